@@ -1,4 +1,29 @@
+from cupyd.core.columnar import ColumnarBucket
+from cupyd.core.computing.runtime import ETLRuntime
 from cupyd.core.etl import ETL
-from cupyd.core.nodes import Extractor, Transformer, Filter, Loader, Bulker, DeBulker
+from cupyd.core.nodes import (
+    Extractor,
+    Transformer,
+    Filter,
+    Loader,
+    Bulker,
+    DeBulker,
+    AsyncExtractor,
+    AsyncTransformer,
+    AsyncLoader,
+)
 
-__all__ = ["ETL", "Extractor", "Transformer", "Filter", "Loader", "Bulker", "DeBulker"]
+__all__ = [
+    "ETL",
+    "ETLRuntime",
+    "ColumnarBucket",
+    "Extractor",
+    "Transformer",
+    "Filter",
+    "Loader",
+    "Bulker",
+    "DeBulker",
+    "AsyncExtractor",
+    "AsyncTransformer",
+    "AsyncLoader",
+]
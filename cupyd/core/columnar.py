@@ -0,0 +1,139 @@
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class ColumnarBucket:
+    """Bucket stored as columns (equally long NumPy arrays, lists...) instead of a list of items.
+
+    Nodes overriding the bucket-level methods (transform_bucket(), filter_bucket()...) process the
+    whole columns at once, while the per-item methods still get every row as a dict. Sent to
+    other processes with the "pickle_oob" serializer, NumPy arrays aren't copied into the pickle.
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of a ColumnarBucket with different lengths: {lengths}")
+
+        self.columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Any:
+        if isinstance(key, str):
+            return self.columns[key]
+        elif isinstance(key, slice):
+            return ColumnarBucket({name: column[key] for name, column in self.columns.items()})
+        return {name: column[key] for name, column in self.columns.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for idx in range(self._length):
+            yield self[idx]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ColumnarBucket):
+            return NotImplemented
+        return self.columns.keys() == other.columns.keys() and all(
+            list(column) == list(other.columns[name]) for name, column in self.columns.items()
+        )
+
+    def __repr__(self) -> str:
+        return f"ColumnarBucket({self.columns!r})"
+
+    def take(self, indexes: Sequence[int]) -> "ColumnarBucket":
+        """Rows at the given positions."""
+
+        return ColumnarBucket(
+            {name: _take_column(column, indexes) for name, column in self.columns.items()}
+        )
+
+    @classmethod
+    def concat(cls, buckets: Sequence["ColumnarBucket"]) -> "ColumnarBucket":
+        """Rows of all the buckets, which must have the same columns."""
+
+        return cls(
+            {
+                name: _concat_columns([bucket.columns[name] for bucket in buckets])
+                for name in buckets[0].columns
+            }
+        )
+
+
+def _take_column(column: Any, indexes: Sequence[int]) -> Any:
+    # NumPy & Arrow arrays select all the positions at once
+    if hasattr(column, "take"):
+        return column.take(indexes)
+    return [column[idx] for idx in indexes]
+
+
+def _concat_columns(columns: List[Any]) -> Any:
+    if numpy is not None and isinstance(columns[0], numpy.ndarray):
+        return numpy.concatenate(columns)
+    elif pyarrow is not None and isinstance(columns[0], pyarrow.Array):
+        return pyarrow.concat_arrays(columns)
+    return list(chain.from_iterable(columns))
+
+
+def _is_record_batch(bucket: Any) -> bool:
+    return pyarrow is not None and isinstance(bucket, pyarrow.RecordBatch)
+
+
+def is_columnar(bucket: Any) -> bool:
+    """Whether the bucket is a ColumnarBucket or an Arrow RecordBatch, instead of a list."""
+
+    return isinstance(bucket, ColumnarBucket) or _is_record_batch(bucket)
+
+
+def iter_rows(bucket: Any) -> Iterable[Any]:
+    """Items of any bucket, the rows of columnar buckets as dicts."""
+
+    if _is_record_batch(bucket):
+        return bucket.to_pylist()
+    return bucket
+
+
+def take_rows(bucket: Any, indexes: Sequence[int]) -> Any:
+    """Bucket (of the same type) with the items at the given positions."""
+
+    if isinstance(bucket, ColumnarBucket):
+        return bucket.take(indexes)
+    elif _is_record_batch(bucket):
+        return bucket.take(pyarrow.array(indexes, type=pyarrow.int64()))
+    return [bucket[idx] for idx in indexes]
+
+
+def filter_rows(bucket: Any, mask: Iterable[Any]) -> Any:
+    """Bucket (of the same type) with the items whose value in the boolean mask is true."""
+
+    if numpy is not None and isinstance(mask, numpy.ndarray):
+        return take_rows(bucket, numpy.flatnonzero(mask))
+    return take_rows(bucket, [idx for idx, keep in enumerate(mask) if keep])
+
+
+def slice_rows(bucket: Any, start: int, stop: int) -> Any:
+    if _is_record_batch(bucket):
+        return bucket.slice(start, stop - start)
+    return bucket[start:stop]
+
+
+def concat_buckets(buckets: Sequence[Any]) -> Any:
+    """Single bucket (of the same type) with the items of all the buckets."""
+
+    if isinstance(buckets[0], ColumnarBucket):
+        return ColumnarBucket.concat(buckets)
+    elif _is_record_batch(buckets[0]):
+        table = pyarrow.Table.from_batches(buckets).combine_chunks()
+        return table.to_batches()[0] if table.num_rows else buckets[0].slice(0, 0)
+    return list(chain.from_iterable(buckets))
@@ -1,23 +1,53 @@
+from cupyd.core.communication.broadcast_connector import BroadcastConnector
 from cupyd.core.communication.connector import (
     Connector,
     IntraProcessConnector,
     InterProcessConnector,
+    SPSCIntraProcessConnector,
+    SharedIntraProcessConnector,
 )
-from cupyd.core.communication.counter import MPCounter
+from cupyd.core.communication.control_plane import ControlPlane, ControlFlag
+from cupyd.core.communication.counter import ShardedCounter, CounterShard
+from cupyd.core.communication.dispatch_connector import DispatchConnector
+from cupyd.core.communication.distributed_connector import DistributedConnector
 from cupyd.core.communication.event_flag import (
     EventFlag,
     IntraProcessEventFlag,
     InterProcessEventFlag,
 )
 from cupyd.core.communication.interruption_handler import InterruptionHandler
+from cupyd.core.communication.serializer import (
+    Serializer,
+    PickleSerializer,
+    PickleOutOfBandSerializer,
+    MarshalSerializer,
+    MsgpackSerializer,
+)
+from cupyd.core.communication.shared_memory_connector import SharedMemoryConnector
+from cupyd.core.communication.spilling_connector import SpillingConnector
 
 __all__ = [
     "Connector",
     "IntraProcessConnector",
     "InterProcessConnector",
+    "SPSCIntraProcessConnector",
+    "SharedIntraProcessConnector",
+    "SharedMemoryConnector",
+    "DistributedConnector",
+    "BroadcastConnector",
+    "DispatchConnector",
+    "SpillingConnector",
     "EventFlag",
     "IntraProcessEventFlag",
     "InterProcessEventFlag",
-    "MPCounter",
+    "ControlPlane",
+    "ControlFlag",
+    "ShardedCounter",
+    "CounterShard",
     "InterruptionHandler",
+    "Serializer",
+    "PickleSerializer",
+    "PickleOutOfBandSerializer",
+    "MarshalSerializer",
+    "MsgpackSerializer",
 ]
@@ -0,0 +1,116 @@
+from collections import Counter
+from typing import Optional, Any, List, Dict
+
+from cupyd.core.communication.connector import Connector, InterProcessConnector
+from cupyd.core.constants.overflow_policies import BLOCK
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+class BroadcastConnector(Connector):
+    """Group of InterProcessConnectors, with the same payload format, fed by the same Node.
+
+    Every bucket is serialized (& compressed) only once, by the first Connector of the group, and
+    the resulting payload is produced to every Connector. The BroadcastConnector only produces:
+    each Node downstream keeps consuming from its own Connector.
+
+    A full Connector doesn't delay the rest: try_produce() gives the bucket to every Connector
+    with room, and produce_overflowing() waits only for the full ones.
+    """
+
+    def __init__(self, connectors: List[InterProcessConnector]):
+        super().__init__()
+
+        payload_formats = {connector.payload_format for connector in connectors}
+        if len(payload_formats) != 1 or None in payload_formats:
+            raise ValueError("Every Connector of a BroadcastConnector needs the same Serializer")
+
+        self.connectors = connectors
+        self._full_connectors: List[InterProcessConnector] = []
+        self._pending_payload: Optional[bytes] = None
+
+    def start(self):
+        for connector in self.connectors:
+            if not connector.started:
+                connector.start()
+        self._started = True
+
+    def produce(self, bucket: List[Any]):
+        if bucket is NO_MORE_ITEMS:
+            for connector in self.connectors:
+                connector.produce(NO_MORE_ITEMS)
+            return
+
+        payload = self.connectors[0].serialize(bucket)
+        for connector in self.connectors:
+            connector.produce_payload(payload)
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        if bucket is NO_MORE_ITEMS:
+            self.produce(bucket)
+            return True
+
+        payload = self.connectors[0].serialize(bucket)
+        self._full_connectors = [
+            connector for connector in self.connectors if not connector.try_produce_payload(payload)
+        ]
+        self._pending_payload = payload if self._full_connectors else None
+        return not self._full_connectors
+
+    def produce_overflowing(self, bucket: List[Any]):
+        # only the Connectors that were full in the last try_produce() still miss the bucket
+        for connector in self._full_connectors:
+            connector.produce_payload(self._pending_payload)
+        self._full_connectors, self._pending_payload = [], None
+
+    def consume(self) -> Optional[List[Any]]:
+        raise NotImplementedError("Buckets must be consumed from every Connector of the group")
+
+    def finish_producing(self, num_consumers: int):
+        for connector in self.connectors:
+            connector.finish_producing(num_consumers=num_consumers)
+
+    def get_current_size(self) -> int:
+        return max(connector.get_current_size() for connector in self.connectors)
+
+    def flush(self):
+        for connector in self.connectors:
+            connector.flush()
+
+    def close(self):
+        for connector in self.connectors:
+            connector.close()
+
+    def collect_stats(self) -> Dict[str, int]:
+        stats: Counter = Counter()
+        for connector in self.connectors:
+            stats.update(connector.collect_stats())
+        return dict(stats)
+
+
+def group_broadcast_connectors(connectors: List[Connector]) -> List[Connector]:
+    """Replace the InterProcessConnectors of a Node sharing their payload format by a group.
+
+    Only the Connectors with the "block" overflow policy are grouped, since every other policy
+    needs each Connector to decide on its own whether it takes the bucket.
+    """
+
+    grouped_connectors: List[Connector] = []
+    connectors_by_payload_format: Dict[Any, List[InterProcessConnector]] = {}
+
+    for connector in connectors:
+        if (
+            isinstance(connector, InterProcessConnector)
+            and connector.payload_format
+            and connector.overflow_policy == BLOCK
+        ):
+            connectors_by_payload_format.setdefault(connector.payload_format, []).append(connector)
+        else:
+            grouped_connectors.append(connector)
+
+    for group in connectors_by_payload_format.values():
+        if len(group) > 1:
+            grouped_connectors.append(BroadcastConnector(connectors=group))
+        else:
+            grouped_connectors.extend(group)
+
+    return grouped_connectors
@@ -0,0 +1,100 @@
+import ctypes
+import multiprocessing
+import sys
+import threading
+from typing import Any, List, Set, Union
+
+from cupyd.core.columnar import ColumnarBucket
+
+# number of items of a bucket whose size is measured to estimate the size of the whole bucket
+ESTIMATION_SAMPLE_SIZE = 10
+
+
+def _deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for value in obj:
+            size += _deep_sizeof(value, seen)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_sizeof(vars(obj), seen)
+
+    return size
+
+
+def estimate_size(bucket: Union[List[Any], tuple]) -> int:
+    """Estimate the memory used by a bucket (in bytes), measuring only a sample of its items."""
+
+    # NumPy & Arrow arrays know their size
+    if isinstance(bucket, ColumnarBucket):
+        return sum(
+            column.nbytes if hasattr(column, "nbytes") else estimate_size(column)
+            for column in bucket.columns.values()
+        )
+    elif hasattr(bucket, "nbytes"):
+        return bucket.nbytes
+
+    if not bucket:
+        return sys.getsizeof(bucket)
+
+    step = max(len(bucket) // ESTIMATION_SAMPLE_SIZE, 1)
+    sample = bucket[::step][:ESTIMATION_SAMPLE_SIZE]
+    sample_size = sum(_deep_sizeof(item, seen=set()) for item in sample)
+
+    return sys.getsizeof(bucket) + sample_size * len(bucket) // len(sample)
+
+
+class ByteBudget:
+    """Limit the bytes stored in a Connector: producers wait until enough bytes are released.
+
+    A bucket bigger than the whole budget is still accepted when nothing else is stored, so it
+    can't block the producer forever.
+    """
+
+    def __init__(self, max_bytes: int, condition: Any, used_bytes: Any):
+        self.max_bytes = max_bytes
+        self._condition = condition
+        self._used_bytes = used_bytes  # ctypes-like object, protected by the condition lock
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes.value
+
+    def acquire(self, size: int, block: bool = True) -> bool:
+        with self._condition:
+            while self._used_bytes.value and self._used_bytes.value + size > self.max_bytes:
+                if not block:
+                    return False
+                self._condition.wait()
+            self._used_bytes.value += size
+            return True
+
+    def release(self, size: int):
+        with self._condition:
+            self._used_bytes.value -= size
+            self._condition.notify_all()
+
+
+class IntraProcessByteBudget(ByteBudget):
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            max_bytes=max_bytes, condition=threading.Condition(), used_bytes=ctypes.c_int64(0)
+        )
+
+
+class InterProcessByteBudget(ByteBudget):
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            max_bytes=max_bytes,
+            condition=multiprocessing.Condition(),
+            used_bytes=multiprocessing.RawValue("q", 0),
+        )
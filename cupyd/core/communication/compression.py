@@ -0,0 +1,193 @@
+import lzma
+import zlib
+from time import perf_counter
+from typing import Optional, Union, Dict, Callable, Tuple
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+ZLIB = "zlib"
+LZMA = "lzma"
+LZ4 = "lz4"
+ZSTD = "zstd"
+AUTO = "auto"  # fastest available codec: zstd > lz4 > zlib
+
+# payloads smaller than this (in bytes) are never compressed
+DEFAULT_THRESHOLD = 16 * 1024
+
+# compression is a net loss if it doesn't save at least 10% of the bytes...
+DEFAULT_MAX_RATIO = 0.9
+
+# ... or if the bytes it saves per second spent compressing are fewer than the bytes moved per
+# second between processes (sending them uncompressed would be faster)
+DEFAULT_MIN_SAVING_RATE = 50 * 1024 * 1024  # bytes per second
+
+# while disabled, compression is tried again every time this number of payloads is sent
+DEFAULT_PROBE_INTERVAL = 100
+
+# weight of the last measure in the moving averages of the ratio & throughput
+_SMOOTHING = 0.2
+
+# one-byte header prepended to every payload
+_RAW = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+def _get_codec_functions(codec: str) -> Tuple[Callable, Callable]:
+    if codec == ZLIB:
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    elif codec == LZMA:
+        return (lambda data: lzma.compress(data, preset=0)), lzma.decompress
+    elif codec == LZ4:
+        if lz4_frame is None:
+            raise ImportError('Package "lz4" is required to use the lz4 compression')
+        return lz4_frame.compress, lz4_frame.decompress
+    elif codec == ZSTD:
+        if zstandard is None:
+            raise ImportError('Package "zstandard" is required to use the zstd compression')
+        return zstandard.ZstdCompressor(level=1).compress, zstandard.ZstdDecompressor().decompress
+    else:
+        raise ValueError(f"Invalid compression codec: {codec}")
+
+
+class Compressor:
+    """Compress the serialized buckets sent through an InterProcessConnector.
+
+    Only payloads bigger than a threshold are compressed, and sent uncompressed if it doesn't
+    make them smaller. An adaptive Compressor also keeps track of the compression ratio &
+    throughput it achieves, and disables itself when compressing becomes a net loss (probing
+    again from time to time, since the incoming data could change).
+    """
+
+    def __init__(
+        self,
+        codec: str = ZLIB,
+        threshold: int = DEFAULT_THRESHOLD,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        min_saving_rate: float = DEFAULT_MIN_SAVING_RATE,
+        probe_interval: int = DEFAULT_PROBE_INTERVAL,
+        adaptive: bool = True,
+    ):
+        _get_codec_functions(codec)  # fail fast if the codec isn't available
+
+        self.codec = codec
+        self.threshold = threshold
+        self.max_ratio = max_ratio
+        self.min_saving_rate = min_saving_rate
+        self.probe_interval = probe_interval
+        self.adaptive = adaptive
+
+        self._compress: Optional[Callable] = None
+        self._decompress: Optional[Callable] = None
+        self._ratio: Optional[float] = None
+        self._throughput: Optional[float] = None
+        self._enabled = True
+        self._payloads_since_disabled = 0
+        self._bytes_saved = 0
+
+    def __getstate__(self):
+        # codec functions might not be pickleable, they will be loaded again when needed
+        state = self.__dict__.copy()
+        state["_compress"] = None
+        state["_decompress"] = None
+        return state
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def compress(self, data: bytes) -> bytes:
+        if len(data) < self.threshold or not self._should_compress():
+            return _RAW + data
+
+        if self._compress is None:
+            self._compress, self._decompress = _get_codec_functions(self.codec)
+
+        start_time = perf_counter()
+        compressed_data = self._compress(data)
+        elapsed_time = perf_counter() - start_time
+
+        if self.adaptive:
+            self._update_measures(
+                ratio=len(compressed_data) / len(data),
+                throughput=len(data) / elapsed_time if elapsed_time else float("inf"),
+            )
+
+        if len(compressed_data) >= len(data):
+            return _RAW + data
+
+        self._bytes_saved += len(data) - len(compressed_data)
+        return _COMPRESSED + compressed_data
+
+    def decompress(self, data: Union[bytes, bytearray, memoryview]) -> Union[bytes, memoryview]:
+        view = memoryview(data)
+
+        if view[:1] == _RAW:
+            return view[1:]
+
+        if self._decompress is None:
+            self._compress, self._decompress = _get_codec_functions(self.codec)
+
+        return self._decompress(view[1:])
+
+    def collect_stats(self) -> Dict[str, int]:
+        """Return the bytes saved since the last call."""
+
+        bytes_saved, self._bytes_saved = self._bytes_saved, 0
+        return {"bytes_saved": bytes_saved}
+
+    def _should_compress(self) -> bool:
+        if self._enabled:
+            return True
+
+        self._payloads_since_disabled += 1
+        if self._payloads_since_disabled >= self.probe_interval:
+            self._payloads_since_disabled = 0
+            return True  # probe whether compression pays off again
+
+        return False
+
+    def _update_measures(self, ratio: float, throughput: float):
+        if self._ratio is None:
+            self._ratio, self._throughput = ratio, throughput
+        else:
+            self._ratio += _SMOOTHING * (ratio - self._ratio)
+            self._throughput += _SMOOTHING * (throughput - self._throughput)
+
+        if self._enabled:
+            self._enabled = self._pays_off(ratio=self._ratio, throughput=self._throughput)
+        else:
+            # a single successful probe is enough to enable it again
+            self._enabled = self._pays_off(ratio=ratio, throughput=throughput)
+            if self._enabled:
+                self._ratio, self._throughput = ratio, throughput
+
+    def _pays_off(self, ratio: float, throughput: float) -> bool:
+        # a slow codec still pays off if it saves enough bytes, e.g. lzma
+        return ratio <= self.max_ratio and throughput * (1 - ratio) >= self.min_saving_rate
+
+
+def get_compressor(compression: Optional[str]) -> Optional[Compressor]:
+    """Get the Compressor from a Node configuration, where it is set by the codec name.
+
+    Only the "auto" compression is adaptive: a codec chosen explicitly is never disabled.
+    """
+
+    if compression is None:
+        return None
+    elif compression == AUTO:
+        if zstandard is not None:
+            return Compressor(codec=ZSTD)
+        elif lz4_frame is not None:
+            return Compressor(codec=LZ4)
+        else:
+            return Compressor(codec=ZLIB)
+    else:
+        return Compressor(codec=compression, adaptive=False)
@@ -1,12 +1,23 @@
 import logging
 import multiprocessing
 import queue
+import threading
 from abc import abstractmethod
+from collections import deque
 from copy import deepcopy
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Dict, Union, Iterable, Tuple
 
 from _multiprocessing import SemLock
 
+from cupyd.core.communication.byte_budget import (
+    ByteBudget,
+    IntraProcessByteBudget,
+    InterProcessByteBudget,
+    estimate_size,
+)
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.communication.serializer import Serializer, PickleSerializer
+from cupyd.core.constants.overflow_policies import BLOCK, DROP_OLDEST, SAMPLE
 from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
 
 logger = logging.getLogger("cupyd.connector")
@@ -15,14 +26,15 @@ logger = logging.getLogger("cupyd.connector")
 class Connector:
     """Unidirectional connection mechanism between two Nodes.
 
-    There are 2 possible types of Connector based on where both Nodes exist. Each Connector type
+    There are 5 possible types of Connector based on where both Nodes exist. Each Connector type
     will use its own communication mechanism to share items between the two Nodes.
 
     These are the available Connector types:
 
     1) IntraProcess Connector
         * Nodes run at the same Process.
-        * Communication mechanism: queue.Queue
+        * Communication mechanism: queue.Queue, or a collections.deque for edges with a single
+          producer & a single consumer thread.
         * Optional: can choose a maxsize for its internal queue.
 
     2) InterProcess Connector
@@ -30,15 +42,34 @@ class Connector:
         * Communication mechanism: multiprocessing.Queue
         * Optional: can choose a maxsize for its internal queue.
 
-    TODO 3) Distributed Connector
-        * Nodes run in different Processes from different computers.
+    3) SharedMemory Connector
+        * Nodes run in different Processes from same computer.
+        * Communication mechanism: ring buffer in multiprocessing.shared_memory
+        * Optional: can choose the number of slots (maxsize) of its ring buffer.
+
+    4) Distributed Connector
+        * Nodes run in different Processes, from the same or different computers.
         * Communication mechanism: TCP Socket
+        * Optional: can choose a maxsize for the buckets stored in its broker.
+
+    5) Dispatch Connector
+        * Nodes run in different Processes from same computer.
+        * Communication mechanism: a multiprocessing.Queue per consumer Process
+        * Optional: can choose a maxsize (split between the queues) & the dispatch policy.
+
+    Besides the number of buckets (maxsize), every Connector can also limit the bytes it stores
+    (max_bytes). Producers will wait once any of both limits is reached, unless the overflow
+    policy of the Connector drops buckets instead (only supported by queue-based Connectors).
     """
 
-    def __init__(self, maxsize: Optional[int] = 0):
+    def __init__(self, maxsize: Optional[int] = 0, max_bytes: Optional[int] = None):
         super().__init__()
         self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._byte_budget: Optional[ByteBudget] = None
         self._started = False
+        self._dropped_buckets = 0
+        self.overflow_policy: str = BLOCK
 
     @abstractmethod
     def start(self):
@@ -64,30 +95,128 @@ class Connector:
     def close(self):
         pass
 
+    def produce_many(self, buckets: Iterable[List[Any]]):
+        for bucket in buckets:
+            self.produce(bucket)
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        """Produce the bucket only if it can be done without waiting. Return whether it was."""
+
+        self.produce(bucket)
+        return True
+
+    def produce_overflowing(self, bucket: List[Any]):
+        """Produce a bucket that didn't fit (try_produce failed), following the overflow policy."""
+
+        if self.overflow_policy == DROP_OLDEST:
+            while not self.try_produce(bucket):
+                if self._drop_oldest():
+                    self._dropped_buckets += 1
+        elif self.overflow_policy == SAMPLE:
+            self._dropped_buckets += 1
+        else:
+            self.produce(bucket)
+
+    def consume_many(self, max_buckets: int) -> List[Optional[List[Any]]]:
+        """Consume at least one bucket (waiting for it) and up to max_buckets, if available."""
+
+        return [self.consume()]
+
+    def flush(self):
+        """Send the buckets buffered by the producer, if the Connector buffers any."""
+
+        pass
+
+    def bind_consumer(self, index: int):
+        """Let the Connector know the index of the consumer ETLWorker (within its segment)."""
+
+        pass
+
+    def collect_stats(self) -> Dict[str, int]:
+        """Return the stats (e.g. bytes saved by compression) gathered since the last call."""
+
+        return self._collect_dropped_buckets()
+
     @property
     def started(self) -> bool:
         return self._started
 
+    def _drop_oldest(self) -> bool:
+        """Remove the oldest bucket waiting to be consumed. Return whether there was any."""
+
+        raise NotImplementedError(f"{type(self).__name__} can't drop buckets")
+
+    def _collect_dropped_buckets(self) -> Dict[str, int]:
+        dropped_buckets, self._dropped_buckets = self._dropped_buckets, 0
+        return {"dropped_buckets": dropped_buckets} if dropped_buckets else {}
+
+    # when there is a byte budget, buckets are stored along with their size, so the consumer knows
+    # how many bytes to release
+
+    def _reserve_bytes(self, bucket: Any, size: Optional[int] = None) -> Any:
+        if self._byte_budget is None or bucket is NO_MORE_ITEMS:
+            return bucket
+        if size is None:
+            size = estimate_size(bucket)
+        self._byte_budget.acquire(size)
+        return size, bucket
+
+    def _try_reserve_bytes(self, bucket: Any, size: Optional[int] = None) -> Tuple[bool, Any]:
+        if self._byte_budget is None:
+            return True, bucket
+        if size is None:
+            size = estimate_size(bucket)
+        return self._byte_budget.acquire(size, block=False), (size, bucket)
+
+    def _release_bytes(self, entry: Any) -> Any:
+        if self._byte_budget is None or entry is NO_MORE_ITEMS:
+            return entry
+        size, bucket = entry
+        self._byte_budget.release(size)
+        return bucket
+
 
 class IntraProcessConnector(Connector):
-    """Used for communication between Nodes at the same process pool where threading is used."""
+    """Used for communication between Nodes at the same process pool where threading is used.
+
+    The size of the buckets, if max_bytes is set, is estimated from a sample of their items.
+    """
 
-    def __init__(self, maxsize: Optional[int] = 0):
-        super().__init__(maxsize=maxsize)
+    def __init__(self, maxsize: Optional[int] = 0, max_bytes: Optional[int] = None):
+        super().__init__(maxsize=maxsize, max_bytes=max_bytes)
         self.copy_bucket_on_produce: bool = False
         self._queue: Optional[queue.Queue] = None
 
     def start(self):
         self._queue = queue.Queue(maxsize=self._maxsize)
+        if self._max_bytes:
+            self._byte_budget = IntraProcessByteBudget(max_bytes=self._max_bytes)
         self._started = True
 
     def produce(self, bucket: List[Any]):
         if self.copy_bucket_on_produce:
             bucket = deepcopy(bucket)
-        self._queue.put(bucket)
+        self._queue.put(self._reserve_bytes(bucket))
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        if self._queue.full():
+            return False
+        if self.copy_bucket_on_produce:
+            bucket = deepcopy(bucket)
+
+        reserved, entry = self._try_reserve_bytes(bucket)
+        if not reserved:
+            return False
+
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._release_bytes(entry)
+            return False
+        return True
 
     def consume(self) -> Optional[List[Any]]:
-        return self._queue.get()
+        return self._release_bytes(self._queue.get())
 
     def get_current_size(self) -> int:
         return self._queue.qsize()
@@ -99,12 +228,171 @@ class IntraProcessConnector(Connector):
     def close(self):
         pass
 
+    def _drop_oldest(self) -> bool:
+        try:
+            self._release_bytes(self._queue.get_nowait())
+        except queue.Empty:
+            return False
+        return True
+
+
+class SharedIntraProcessConnector(IntraProcessConnector):
+    """IntraProcessConnector between the ETLWorkerThreads of different segments (threads mode).
+
+    Like an InterProcessConnector, it's started when the ETL is built & finished from the main
+    thread, once every ETLWorker producing to it has finished. Buckets are passed by reference.
+    """
+
+
+class SPSCIntraProcessConnector(IntraProcessConnector):
+    """IntraProcessConnector for edges with a single producer & a single consumer thread.
+
+    Buckets are stored in a collections.deque, whose append() & popleft() are atomic. Locks and
+    conditions are only used when the consumer has to wait for a bucket, or the producer for
+    room in the deque, instead of on every produce & consume as queue.Queue does.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 0, max_bytes: Optional[int] = None):
+        super().__init__(maxsize=maxsize, max_bytes=max_bytes)
+        self._deque: deque = deque()
+        self._not_empty: Optional[threading.Condition] = None
+        self._not_full: Optional[threading.Condition] = None
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+    def start(self):
+        self._deque = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+        self._not_full = threading.Condition(threading.Lock())
+        if self._max_bytes:
+            self._byte_budget = IntraProcessByteBudget(max_bytes=self._max_bytes)
+        self._started = True
+
+    def produce(self, bucket: List[Any]):
+        if self.copy_bucket_on_produce:
+            bucket = deepcopy(bucket)
+        if self._maxsize and len(self._deque) >= self._maxsize:
+            self._wait_for_room()
+        self._deque.append(self._reserve_bytes(bucket))
+        self._notify_consumer()
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        if self._maxsize and len(self._deque) >= self._maxsize:
+            return False
+        if self.copy_bucket_on_produce:
+            bucket = deepcopy(bucket)
+
+        reserved, entry = self._try_reserve_bytes(bucket)
+        if not reserved:
+            return False
+
+        self._deque.append(entry)
+        self._notify_consumer()
+        return True
+
+    def produce_many(self, buckets: Iterable[List[Any]]):
+        if self._maxsize or self._byte_budget or self.copy_bucket_on_produce:
+            super().produce_many(buckets)
+        else:
+            self._deque.extend(buckets)
+            self._notify_consumer()
+
+    def consume(self) -> Optional[List[Any]]:
+        try:
+            bucket = self._deque.popleft()
+        except IndexError:
+            bucket = self._wait_for_bucket()
+        self._notify_producer()
+        return self._release_bytes(bucket)
+
+    def consume_many(self, max_buckets: int) -> List[Optional[List[Any]]]:
+        try:
+            buckets = [self._deque.popleft()]
+        except IndexError:
+            buckets = [self._wait_for_bucket()]
+
+        while len(buckets) < max_buckets:
+            try:
+                buckets.append(self._deque.popleft())
+            except IndexError:
+                break
+
+        self._notify_producer()
+
+        if self._byte_budget:
+            return [self._release_bytes(bucket) for bucket in buckets]
+        return buckets
+
+    def get_current_size(self) -> int:
+        return len(self._deque)
+
+    def finish_producing(self, num_consumers: int):
+        for _ in range(num_consumers):
+            self.produce(NO_MORE_ITEMS)
+
+    def _drop_oldest(self) -> bool:
+        try:
+            self._release_bytes(self._deque.popleft())
+        except IndexError:
+            return False
+        self._notify_producer()
+        return True
+
+    # each side flags itself as waiting before checking the deque (under the lock), and the other
+    # side checks the flag after modifying the deque, so a wake-up can't be missed
+
+    def _wait_for_bucket(self) -> Optional[List[Any]]:
+        with self._not_empty:
+            self._consumer_waiting = True
+            while not self._deque:
+                self._not_empty.wait()
+            self._consumer_waiting = False
+        return self._deque.popleft()
+
+    def _wait_for_room(self):
+        with self._not_full:
+            self._producer_waiting = True
+            while len(self._deque) >= self._maxsize:
+                self._not_full.wait()
+            self._producer_waiting = False
+
+    def _notify_consumer(self):
+        if self._consumer_waiting:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def _notify_producer(self):
+        if self._producer_waiting:
+            with self._not_full:
+                self._not_full.notify()
+
 
 class InterProcessConnector(Connector):
-    """Used for communication between Nodes at different processes pools."""
+    """Used for communication between Nodes at different processes pools.
 
-    def __init__(self, maxsize: Optional[int] = 0):
-        super().__init__(maxsize=maxsize)
+    By default, buckets are pickled by the multiprocessing.Queue itself. If a Serializer is
+    provided, buckets will be serialized with it before being put into the queue instead. The
+    serialized buckets can also be compressed, if a Compressor is provided.
+
+    If max_bytes is set, the size of the serialized buckets is used for the byte budget (or an
+    estimation of it when the queue pickles the buckets by itself).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 0,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        super().__init__(maxsize=maxsize, max_bytes=max_bytes)
+
+        # compression requires the buckets to be serialized beforehand
+        if compressor and not serializer:
+            serializer = PickleSerializer()
+
+        self._serializer = serializer
+        self._compressor = compressor
 
         if maxsize and maxsize > SemLock.SEM_VALUE_MAX:
             logger.warning(
@@ -117,13 +405,50 @@ class InterProcessConnector(Connector):
 
     def start(self):
         self._queue = multiprocessing.Queue(maxsize=self._maxsize)
+        if self._max_bytes:
+            self._byte_budget = InterProcessByteBudget(max_bytes=self._max_bytes)
         self._started = True
 
     def produce(self, bucket: List[Any]):
-        self._queue.put(bucket)
+        if self._serializer and bucket is not NO_MORE_ITEMS:
+            self.produce_payload(self.serialize(bucket))
+        else:
+            self._queue.put(self._reserve_bytes(bucket))
+
+    def produce_payload(self, payload: bytes):
+        """Produce a bucket already serialized (& compressed) by a Connector of the same format."""
+
+        self._queue.put(self._reserve_bytes(payload, size=len(payload)))
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        if self._queue.full():
+            return False
+
+        if self._serializer:
+            return self.try_produce_payload(self.serialize(bucket))
+        return self._try_put(*self._try_reserve_bytes(bucket))
+
+    def try_produce_payload(self, payload: bytes) -> bool:
+        """Produce an already serialized bucket only if it can be done without waiting."""
+
+        if self._queue.full():
+            return False
+        return self._try_put(*self._try_reserve_bytes(payload, size=len(payload)))
+
+    def produce_overflowing(self, bucket: List[Any]):
+        if self._serializer and self.overflow_policy == DROP_OLDEST:
+            # the bucket is serialized (& compressed) once, not on every retry
+            payload = self.serialize(bucket)
+            while not self.try_produce_payload(payload):
+                if self._drop_oldest():
+                    self._dropped_buckets += 1
+        else:
+            super().produce_overflowing(bucket)
 
     def consume(self) -> Optional[List[Any]]:
-        bucket = self._queue.get()
+        bucket = self._release_bytes(self._queue.get())
+        if self._serializer and bucket is not NO_MORE_ITEMS:
+            return self._deserialize(bucket)
         return bucket
 
     def get_current_size(self) -> int:
@@ -135,3 +460,46 @@ class InterProcessConnector(Connector):
 
     def close(self):
         self._queue.close()
+
+    def collect_stats(self) -> Dict[str, int]:
+        stats = self._collect_dropped_buckets()
+        if self._compressor:
+            stats.update(self._compressor.collect_stats())
+        return stats
+
+    def _drop_oldest(self) -> bool:
+        try:
+            self._release_bytes(self._queue.get(block=False))
+        except queue.Empty:
+            return False
+        return True
+
+    def _try_put(self, reserved: bool, entry: Any) -> bool:
+        if not reserved:
+            return False
+
+        try:
+            self._queue.put(entry, block=False)
+        except queue.Full:
+            self._release_bytes(entry)
+            return False
+        return True
+
+    @property
+    def payload_format(self) -> Optional[Tuple[type, Optional[str]]]:
+        """Connectors with the same payload format can share the payloads they produce."""
+
+        if not self._serializer:
+            return None
+        return type(self._serializer), self._compressor.codec if self._compressor else None
+
+    def serialize(self, bucket: List[Any]) -> bytes:
+        data = self._serializer.dumps(bucket)
+        if self._compressor:
+            data = self._compressor.compress(data)
+        return data
+
+    def _deserialize(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        if self._compressor:
+            data = self._compressor.decompress(data)
+        return self._serializer.loads(data)
@@ -0,0 +1,70 @@
+from multiprocessing import Lock, RawArray
+from time import sleep
+from typing import Any
+
+from cupyd.core.communication.event_flag import EventFlag
+
+# bits of the state word of an ETL. The following ones are the per-node flags
+STOP = 0
+PAUSE = 1
+NUM_GLOBAL_FLAGS = 2
+
+_BITS_PER_WORD = 64
+
+# seconds between checks of a flag while waiting for it to be unset
+CONTROL_PLANE_POLL_INTERVAL = 0.01
+
+
+class ControlFlag(EventFlag):
+    """EventFlag stored as a single bit of a ControlPlane.
+
+    Checking it is a plain read of shared memory, without any lock or syscall, so it can be done
+    on every bucket.
+    """
+
+    def __init__(self, words: Any, lock: Any, bit: int):
+        self._words = words
+        self._lock = lock
+        self._word = bit // _BITS_PER_WORD
+        self._mask = 1 << (bit % _BITS_PER_WORD)
+
+    def __bool__(self) -> bool:
+        return bool(self._words[self._word] & self._mask)
+
+    def wait(self):
+        while self:
+            sleep(CONTROL_PLANE_POLL_INTERVAL)
+
+    def set(self):
+        # like the other EventFlags, setting an active flag deactivates it
+        with self._lock:
+            self._words[self._word] ^= self._mask
+
+
+class ControlPlane:
+    """State of an ETL shared by all its processes: the stop & pause flags, plus a flag per Node
+    (whether its performance is monitored).
+
+    All the flags are bits of a single word in shared memory (or a few words, for ETLs with more
+    than 62 Nodes). Reads need no lock, only writes are serialized, so the hot path of the
+    NodeWorkers never waits for another process.
+    """
+
+    def __init__(self, num_nodes: int):
+        num_words = (NUM_GLOBAL_FLAGS + num_nodes - 1) // _BITS_PER_WORD + 1
+        self._words = RawArray("Q", num_words)
+        self._lock = Lock()
+        self._num_nodes = num_nodes
+
+    @property
+    def stop_flag(self) -> ControlFlag:
+        return ControlFlag(words=self._words, lock=self._lock, bit=STOP)
+
+    @property
+    def pause_flag(self) -> ControlFlag:
+        return ControlFlag(words=self._words, lock=self._lock, bit=PAUSE)
+
+    def get_node_flag(self, index: int) -> ControlFlag:
+        if not 0 <= index < self._num_nodes:
+            raise IndexError(f"Invalid node flag index: {index}")
+        return ControlFlag(words=self._words, lock=self._lock, bit=NUM_GLOBAL_FLAGS + index)
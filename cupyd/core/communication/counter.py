@@ -1,15 +1,48 @@
-from multiprocessing import RawValue, Lock
+from multiprocessing import RawArray
+from typing import Any
 
+# fields of the counters of every Node
+ITEMS_IN = 0
+ITEMS_OUT = 1
+NUM_FIELDS = 2
 
-class MPCounter:
-    def __init__(self):
-        self._value = RawValue("i", 0)
-        self._lock = Lock()
+# every shard takes a whole cache line (8 x 8 bytes), so workers never write to the same one
+_SHARD_STRIDE = 8
 
-    def increase(self, amount: int):
-        with self._lock:
-            self._value.value += amount
+
+class CounterShard:
+    """Part of a ShardedCounter written by a single ETLWorker (so it needs no lock)."""
+
+    def __init__(self, values: Any, offset: int):
+        self._values = values
+        self._offset = offset
+
+    def increase(self, amount: int, field: int = ITEMS_OUT):
+        self._values[self._offset + field] += amount
+
+
+class ShardedCounter:
+    """Counter shared by all the ETLWorkers of a segment, without any lock.
+
+    Each ETLWorker gets its own shard in shared memory, which only that worker writes to. The
+    value of the counter is the sum of all the shards, computed when it is read.
+    """
+
+    def __init__(self, num_shards: int, num_fields: int = NUM_FIELDS):
+        if num_fields > _SHARD_STRIDE:
+            raise ValueError(f"A ShardedCounter can't have more than {_SHARD_STRIDE} fields")
+
+        self._num_shards = num_shards
+        self._values = RawArray("q", num_shards * _SHARD_STRIDE)
+
+    def get_shard(self, index: int) -> CounterShard:
+        if not 0 <= index < self._num_shards:
+            raise IndexError(f"Invalid shard index: {index}")
+        return CounterShard(values=self._values, offset=index * _SHARD_STRIDE)
+
+    def get_value(self, field: int = ITEMS_OUT) -> int:
+        return sum(self._values[field::_SHARD_STRIDE])
 
     @property
-    def value(self):
-        return self._value.value
+    def value(self) -> int:
+        return self.get_value()
@@ -0,0 +1,134 @@
+from typing import Optional, Any, List
+
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.communication.connector import InterProcessConnector
+from cupyd.core.communication.serializer import Serializer
+from cupyd.core.constants.dispatch_policies import ROUND_ROBIN, LEAST_LOADED, DISPATCH_POLICIES
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+class DispatchConnector(InterProcessConnector):
+    """Used for communication between Nodes at different processes pools, with a queue per
+    consumer ETLWorker.
+
+    Consumers never contend for the same queue: each one binds to its own queue, by its index in
+    the segment. Producers pick the queue of every bucket following the dispatch policy:
+
+    * round_robin: every queue in turn.
+    * least_loaded: the queue with fewer buckets. Falls back to round_robin on platforms where
+      the size of a multiprocessing.Queue can't be known (e.g. macOS).
+
+    The maxsize & max_bytes are split evenly between the queues.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 0,
+        num_consumers: int = 1,
+        policy: str = ROUND_ROBIN,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        super().__init__(
+            maxsize=maxsize, serializer=serializer, compressor=compressor, max_bytes=max_bytes
+        )
+
+        if policy not in DISPATCH_POLICIES:
+            raise ValueError(f"Invalid dispatch policy: {policy}")
+
+        self._policy = policy
+        self._next_queue_index = 0
+        self._consumer_index: Optional[int] = None
+
+        # every queue shares the Serializer & Compressor (and so its stats) of the Connector
+        self._queues: List[InterProcessConnector] = [
+            InterProcessConnector(
+                maxsize=-(-self._maxsize // num_consumers) if self._maxsize else 0,
+                serializer=self._serializer,
+                compressor=self._compressor,
+                max_bytes=-(-max_bytes // num_consumers) if max_bytes else None,
+            )
+            for _ in range(num_consumers)
+        ]
+
+    def start(self):
+        for queue in self._queues:
+            queue.start()
+        self._started = True
+
+    def bind_consumer(self, index: int):
+        if not 0 <= index < len(self._queues):
+            raise IndexError(f"Invalid consumer index for DispatchConnector: {index}")
+        self._consumer_index = index
+
+    def produce(self, bucket: List[Any]):
+        index = self._select_queue_index()
+        self._queues[index].produce(bucket)
+        self._advance(index)
+
+    def produce_payload(self, payload: bytes):
+        index = self._select_queue_index()
+        self._queues[index].produce_payload(payload)
+        self._advance(index)
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        index = self._select_queue_index()
+        if self._queues[index].try_produce(bucket):
+            self._advance(index)
+            return True
+        return False
+
+    def try_produce_payload(self, payload: bytes) -> bool:
+        index = self._select_queue_index()
+        if self._queues[index].try_produce_payload(payload):
+            self._advance(index)
+            return True
+        return False
+
+    def consume(self) -> Optional[List[Any]]:
+        return self._queues[self._consumer_index or 0].consume()
+
+    def get_current_size(self) -> int:
+        return sum(self.get_current_sizes())
+
+    def get_current_sizes(self) -> List[int]:
+        """Number of buckets in the queue of every consumer."""
+
+        return [queue.get_current_size() for queue in self._queues]
+
+    def finish_producing(self, num_consumers: int):
+        # every consumer reads only its own queue, so it must get its own sentinel value
+        for queue in self._queues:
+            queue.produce(NO_MORE_ITEMS)
+
+    def close(self):
+        for queue in self._queues:
+            queue.close()
+
+    def _drop_oldest(self) -> bool:
+        # from the queue the next bucket goes to, which a failed try_produce doesn't change
+        return self._queues[self._select_queue_index()]._drop_oldest()
+
+    def _select_queue_index(self) -> int:
+        num_queues = len(self._queues)
+        index = self._next_queue_index
+
+        if self._policy == LEAST_LOADED:
+            try:
+                sizes = self.get_current_sizes()
+            except NotImplementedError:
+                self._policy = ROUND_ROBIN
+            else:
+                # ties are broken in round-robin order, so idle consumers share the buckets
+                index = min(
+                    range(index, index + num_queues), key=lambda idx: sizes[idx % num_queues]
+                )
+                index %= num_queues
+
+        return index
+
+    def _advance(self, index: int):
+        """Start the round-robin order after the queue of the last bucket produced."""
+
+        self._next_queue_index = (index + 1) % len(self._queues)
@@ -0,0 +1,371 @@
+import logging
+import queue
+import socket
+import struct
+import threading
+from time import perf_counter, sleep
+from typing import Optional, Any, List, Tuple, Dict
+
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.communication.connector import InterProcessConnector
+from cupyd.core.communication.serializer import Serializer, PickleSerializer
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+logger = logging.getLogger("cupyd.connector")
+
+# by default, the broker listens on an ephemeral port of the local host
+DEFAULT_ADDRESS = ("127.0.0.1", 0)
+
+# max number of buckets sent together in a single frame...
+DEFAULT_BATCH_SIZE = 16
+
+# ... unless the first bucket of the batch has been waiting for longer than this (seconds)
+DEFAULT_LINGER = 0.05
+
+# frame header: frame type & payload length
+_FRAME_HEADER = struct.Struct("!BQ")
+
+# length of every bucket within a frame. Serialized buckets are never empty, so a zero length
+# is used to send NO_MORE_ITEMS
+_ENTRY_LENGTH = struct.Struct("!Q")
+
+_COUNT = struct.Struct("!Q")
+
+_REQUEST_CREDIT = 0  # producer -> broker: number of buckets it wants to send
+_CREDIT = 1  # broker -> producer: number of buckets it is allowed to send
+_PUT = 2  # producer -> broker: batch of buckets
+_GET = 3  # consumer -> broker: request of a single bucket
+_BUCKET = 4  # broker -> consumer: single bucket
+_SIZE = 5  # any -> broker: request of the number of buckets stored (answered with _COUNT)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytearray:
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+
+    while received < size:
+        num_bytes = sock.recv_into(view[received:], size - received)
+        if not num_bytes:
+            raise ConnectionError("Connection closed by the other end")
+        received += num_bytes
+
+    return data
+
+
+def _send_frame(sock: socket.socket, frame_type: int, payload: bytes = b""):
+    sock.sendall(_FRAME_HEADER.pack(frame_type, len(payload)) + payload)
+
+
+def _recv_frame(sock: socket.socket) -> Tuple[int, bytearray]:
+    frame_type, length = _FRAME_HEADER.unpack(_recv_exactly(sock, _FRAME_HEADER.size))
+    return frame_type, _recv_exactly(sock, length) if length else bytearray()
+
+
+def _pack_entries(entries: List[bytes]) -> bytes:
+    chunks = []
+    for entry in entries:
+        chunks.append(_ENTRY_LENGTH.pack(len(entry)))
+        chunks.append(entry)
+    return b"".join(chunks)
+
+
+def _unpack_entries(payload: bytearray) -> List[bytes]:
+    view = memoryview(payload)
+    entries = []
+    offset = 0
+
+    while offset < len(view):
+        length = _ENTRY_LENGTH.unpack_from(view, offset)[0]
+        offset += _ENTRY_LENGTH.size
+        entries.append(bytes(view[offset : offset + length]))  # noqa
+        offset += length
+
+    return entries
+
+
+class _Broker:
+    """TCP server storing the buckets sent by the producers until the consumers request them.
+
+    Producers can only send as many buckets as credits were granted to them. Credits are given
+    back once the buckets are consumed, so no more than `capacity` buckets are ever stored.
+
+    If max_bytes is set, no credits are granted while the stored buckets reach that size. Every
+    producer can still send the batch it was granted credits for, so it is a soft limit.
+    """
+
+    def __init__(self, address: Tuple[str, int], capacity: int, max_bytes: Optional[int] = None):
+        self._server = socket.create_server(address)
+        self._credits = threading.Semaphore(capacity) if capacity else None
+        self._max_bytes = max_bytes
+        self._stored_bytes = 0
+        self._stored_bytes_condition = threading.Condition()
+        self._buckets: queue.Queue = queue.Queue()
+        self._connections: List[socket.socket] = []
+        self._closed = False
+        self.address: Tuple[str, int] = self._server.getsockname()[:2]
+
+        threading.Thread(target=self._accept, name="cupyd (broker)", daemon=True).start()
+
+    @property
+    def size(self) -> int:
+        return self._buckets.qsize()
+
+    def close(self):
+        self._closed = True
+        self._server.close()
+        for connection in self._connections:
+            connection.close()
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._connections.append(connection)
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection: socket.socket):
+        try:
+            while True:
+                frame_type, payload = _recv_frame(connection)
+
+                if frame_type == _PUT:
+                    entries = _unpack_entries(payload)
+                    self._update_stored_bytes(sum(len(entry) for entry in entries))
+                    for entry in entries:
+                        self._buckets.put(entry)
+                elif frame_type == _GET:
+                    entry = self._buckets.get()
+                    _send_frame(connection, _BUCKET, entry)
+                    self._update_stored_bytes(-len(entry))
+                    if self._credits:
+                        self._credits.release()
+                elif frame_type == _REQUEST_CREDIT:
+                    _send_frame(connection, _CREDIT, _COUNT.pack(self._grant_credits(payload)))
+                elif frame_type == _SIZE:
+                    _send_frame(connection, _SIZE, _COUNT.pack(self.size))
+        except (ConnectionError, OSError):
+            connection.close()
+
+    def _update_stored_bytes(self, num_bytes: int):
+        if self._max_bytes:
+            with self._stored_bytes_condition:
+                self._stored_bytes += num_bytes
+                self._stored_bytes_condition.notify_all()
+
+    def _grant_credits(self, payload: bytearray) -> int:
+        requested = _COUNT.unpack(payload)[0]
+
+        if self._max_bytes:
+            with self._stored_bytes_condition:
+                while self._stored_bytes >= self._max_bytes:
+                    self._stored_bytes_condition.wait()
+
+        if not self._credits:
+            return requested
+
+        # wait for at least a single credit, then grant as many as available
+        self._credits.acquire()
+        granted = 1
+        while granted < requested and self._credits.acquire(blocking=False):
+            granted += 1
+
+        return granted
+
+
+class DistributedConnector(InterProcessConnector):
+    """Used for communication between Nodes at different processes, that could even run on
+    different computers, through TCP sockets.
+
+    The process that starts the Connector hosts a broker listening on the given address. Both
+    producers & consumers connect to it (lazily, on their first produce/consume), so the
+    Connector only needs to know the broker address wherever it is sent.
+
+    Producers send the serialized buckets in length-prefixed frames, batching several buckets
+    per frame. A batch is sent once it's full, or once its first bucket has waited for linger
+    seconds (checked by a flusher thread, so a producer going idle doesn't hold it).
+    Backpressure is credit-based: the broker grants credits as buckets are consumed, so no more
+    than maxsize buckets are stored at any time (and, if max_bytes is set, no more credits are
+    granted while the broker stores that many bytes).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 0,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        address: Tuple[str, int] = DEFAULT_ADDRESS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger: float = DEFAULT_LINGER,
+        max_bytes: Optional[int] = None,
+    ):
+        super().__init__(
+            maxsize=maxsize,
+            serializer=serializer or PickleSerializer(),
+            compressor=compressor,
+            max_bytes=max_bytes,
+        )
+        self._address = address
+        self._batch_size = batch_size
+        self._linger = linger
+
+        self._broker: Optional[_Broker] = None
+        self._producer_socket: Optional[socket.socket] = None
+        self._consumer_socket: Optional[socket.socket] = None
+        self._batch: List[bytes] = []
+        self._batch_start_time: Optional[float] = None
+        self._credits = 0
+        # the batch & the producer socket are shared by the producer & the flusher thread
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # only the broker address is needed to connect from other processes
+        state = self.__dict__.copy()
+        state.update(
+            _broker=None,
+            _producer_socket=None,
+            _consumer_socket=None,
+            _batch=[],
+            _batch_start_time=None,
+            _credits=0,
+            _lock=None,
+            _flusher=None,
+        )
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._address
+
+    def start(self):
+        self._broker = _Broker(
+            address=self._address, capacity=self._maxsize, max_bytes=self._max_bytes
+        )
+        self._address = self._broker.address
+        self._started = True
+
+    def produce(self, bucket: List[Any]):
+        if bucket is NO_MORE_ITEMS:
+            # under the lock, so the flusher thread can't replace the batch meanwhile
+            with self._lock:
+                self._batch.append(b"")
+                self._flush()
+            return
+
+        self.produce_payload(self.serialize(bucket))
+
+    def produce_payload(self, payload: bytes):
+        with self._lock:
+            if not self._batch:
+                self._batch_start_time = perf_counter()
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_lingering_batches, name="cupyd (flusher)", daemon=True
+                    )
+                    self._flusher.start()
+
+            self._batch.append(payload)
+
+            if (
+                len(self._batch) >= self._batch_size
+                or perf_counter() - self._batch_start_time >= self._linger
+            ):
+                self._flush()
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        # the broker only supports the "block" overflow policy
+        self.produce(bucket)
+        return True
+
+    def try_produce_payload(self, payload: bytes) -> bool:
+        self.produce_payload(payload)
+        return True
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+
+        if self._producer_socket is None:
+            self._producer_socket = self._connect()
+
+        while self._batch:
+            if not self._credits:
+                _send_frame(self._producer_socket, _REQUEST_CREDIT, _COUNT.pack(len(self._batch)))
+                _, payload = _recv_frame(self._producer_socket)
+                self._credits = _COUNT.unpack(payload)[0]
+
+            entries = self._batch[: self._credits]
+            self._batch = self._batch[self._credits :]  # noqa
+            self._credits -= len(entries)
+            _send_frame(self._producer_socket, _PUT, _pack_entries(entries))
+
+    def _flush_lingering_batches(self):
+        """Send every batch whose first bucket has waited for linger seconds, until no batch is
+        left (the next one will start another flusher)."""
+
+        while True:
+            with self._lock:
+                if not self._batch:
+                    self._flusher = None
+                    return
+
+                waited = perf_counter() - self._batch_start_time
+                if waited >= self._linger:
+                    self._flush()
+                    waited = 0.0
+
+            sleep(max(self._linger - waited, 0.0))
+
+    def consume(self) -> Optional[List[Any]]:
+        if self._consumer_socket is None:
+            self._consumer_socket = self._connect()
+
+        _send_frame(self._consumer_socket, _GET)
+        _, entry = _recv_frame(self._consumer_socket)
+
+        if not entry:
+            return NO_MORE_ITEMS
+        return self._deserialize(entry)
+
+    def get_current_size(self) -> int:
+        if self._broker:
+            return self._broker.size
+
+        if self._consumer_socket is None:
+            self._consumer_socket = self._connect()
+
+        _send_frame(self._consumer_socket, _SIZE)
+        _, payload = _recv_frame(self._consumer_socket)
+        return _COUNT.unpack(payload)[0]
+
+    def finish_producing(self, num_consumers: int):
+        for _ in range(num_consumers):
+            self.produce(NO_MORE_ITEMS)
+
+    def close(self):
+        self.flush()
+
+        for sock in (self._producer_socket, self._consumer_socket):
+            if sock is not None:
+                sock.close()
+        self._producer_socket, self._consumer_socket = None, None
+
+        if self._broker:
+            self._broker.close()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection(self._address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
@@ -4,7 +4,7 @@ import signal
 from multiprocessing import Lock, Value
 from typing import Dict, Union, Callable, no_type_check
 
-from cupyd.core.communication.event_flag import InterProcessEventFlag
+from cupyd.core.communication.event_flag import EventFlag
 
 logger = logging.getLogger("cupyd.interrupt")
 
@@ -13,7 +13,7 @@ class InterruptionHandler:
     """Class responsible for setting up a handler for termination signals, in order to perform
     clean shutdowns of running ETLs."""
 
-    def __init__(self, stop_event: InterProcessEventFlag):
+    def __init__(self, stop_event: EventFlag):
         self._lock = Lock()
         self._stop_event = stop_event
         self._interrupted = Value(ctypes.c_bool, False)
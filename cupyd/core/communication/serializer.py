@@ -0,0 +1,174 @@
+import marshal
+import pickle
+import struct
+from abc import abstractmethod
+from time import perf_counter
+from typing import Any, List, Dict, Optional, Union, Iterable, Type
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+PICKLE = "pickle"
+PICKLE_OOB = "pickle_oob"
+MARSHAL = "marshal"
+MSGPACK = "msgpack"
+
+# number of out-of-band buffers & length of each one of them
+_NUM_BUFFERS = struct.Struct("=I")
+_BUFFER_LENGTH = struct.Struct("=Q")
+
+
+class Serializer:
+    """Codec used to turn buckets into bytes (and back) when they cross the process boundary.
+
+    Serializers are sent to the ETLWorkerProcesses along with the Connectors, so they must be
+    pickleable themselves.
+    """
+
+    name: str = ""
+
+    # whether loaded buckets may keep referencing the input data instead of copying it
+    loads_keep_references: bool = False
+
+    @abstractmethod
+    def dumps(self, bucket: List[Any]) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        pass
+
+
+class PickleSerializer(Serializer):
+    """Same codec used by multiprocessing.Queue, but using the highest pickle protocol."""
+
+    name = PICKLE
+
+    def dumps(self, bucket: List[Any]) -> bytes:
+        return pickle.dumps(bucket, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        return pickle.loads(data)
+
+
+class PickleOutOfBandSerializer(Serializer):
+    """Pickle protocol 5 with out-of-band buffers.
+
+    Objects supporting out-of-band buffers (NumPy arrays, Arrow buffers, PickleBuffer...) aren't
+    copied into the pickle stream, but appended raw after it. When loading, those objects are
+    rebuilt on top of the incoming data, without any further copy.
+    """
+
+    name = PICKLE_OOB
+    loads_keep_references = True
+
+    def dumps(self, bucket: List[Any]) -> bytes:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(bucket, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        header = [_NUM_BUFFERS.pack(len(raw_buffers)), _BUFFER_LENGTH.pack(len(data))]
+        header.extend(_BUFFER_LENGTH.pack(raw_buffer.nbytes) for raw_buffer in raw_buffers)
+
+        return b"".join([*header, data, *raw_buffers])
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        view = memoryview(data)
+        num_buffers = _NUM_BUFFERS.unpack_from(view, 0)[0]
+        offset = _NUM_BUFFERS.size
+
+        lengths = []
+        for _ in range(num_buffers + 1):
+            lengths.append(_BUFFER_LENGTH.unpack_from(view, offset)[0])
+            offset += _BUFFER_LENGTH.size
+
+        chunks = []
+        for length in lengths:
+            chunks.append(view[offset : offset + length])  # noqa
+            offset += length
+
+        return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+class MarshalSerializer(Serializer):
+    """Faster than pickle for buckets made only of built-in types (dict, list, str, int...).
+
+    Any other type (including user classes) will raise a ValueError when dumped.
+    """
+
+    name = MARSHAL
+
+    def dumps(self, bucket: List[Any]) -> bytes:
+        return marshal.dumps(bucket)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        return marshal.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """Requires the msgpack package. Tuples will be loaded as lists."""
+
+    name = MSGPACK
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError('Package "msgpack" is required to use the MsgpackSerializer')
+
+    def dumps(self, bucket: List[Any]) -> bytes:
+        return msgpack.packb(bucket, use_bin_type=True)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+SERIALIZER_CLASS_BY_NAME: Dict[str, Type[Serializer]] = {
+    PICKLE: PickleSerializer,
+    PICKLE_OOB: PickleOutOfBandSerializer,
+    MARSHAL: MarshalSerializer,
+    MSGPACK: MsgpackSerializer,
+}
+
+
+def get_serializer(serializer: Union[str, Serializer, None]) -> Optional[Serializer]:
+    """Get the Serializer from a Node configuration, where it can be set by its name."""
+
+    if serializer is None or isinstance(serializer, Serializer):
+        return serializer
+    elif serializer in SERIALIZER_CLASS_BY_NAME:
+        return SERIALIZER_CLASS_BY_NAME[serializer]()
+    else:
+        raise ValueError(f"Invalid serializer: {serializer}")
+
+
+def benchmark_serializers(
+    bucket: List[Any], names: Iterable[str] = None, number: int = 100
+) -> Dict[str, Dict[str, float]]:
+    """Measure the dumps & loads time (per bucket) and the output size of every serializer.
+
+    Serializers that can't handle the bucket (or whose package isn't installed) are skipped.
+    """
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    for name in names or SERIALIZER_CLASS_BY_NAME:
+        try:
+            serializer = get_serializer(name)
+            data = serializer.dumps(bucket)
+        except (ImportError, ValueError, TypeError):
+            continue
+
+        start_time = perf_counter()
+        for _ in range(number):
+            serializer.dumps(bucket)
+        dumps_time = (perf_counter() - start_time) / number
+
+        start_time = perf_counter()
+        for _ in range(number):
+            serializer.loads(data)
+        loads_time = (perf_counter() - start_time) / number
+
+        results[name] = {"dumps": dumps_time, "loads": loads_time, "size": len(data)}
+
+    return results
@@ -0,0 +1,216 @@
+import multiprocessing
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Any, List, Tuple, Union
+
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.communication.connector import InterProcessConnector
+from cupyd.core.communication.serializer import Serializer, PickleSerializer
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+# size (in bytes) of every slot of the ring buffer, including the slot header
+DEFAULT_SLOT_SIZE = 64 * 1024
+
+# number of slots of the ring buffer when no maxsize was provided
+DEFAULT_NUM_SLOTS = 1024
+
+# ring buffer header: head (next slot to read) & tail (next slot to write) positions
+_POSITION = struct.Struct("=Q")
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = _POSITION.size
+_RING_HEADER_SIZE = 2 * _POSITION.size
+
+# slot header: kind of slot & payload length
+_SLOT_HEADER = struct.Struct("=BQ")
+
+_PAYLOAD = 0  # last (or only) chunk of a pickled bucket
+_PARTIAL_PAYLOAD = 1  # chunk of a pickled bucket that continues in the next slot
+_NO_MORE_ITEMS = 2
+
+
+class SharedMemoryConnector(InterProcessConnector):
+    """Used for communication between Nodes at different processes pools, using a ring buffer
+    allocated in shared memory.
+
+    Every bucket is serialized (pickled by default) & copied into a slot of the ring buffer,
+    instead of going through the feeder thread & pipe of a multiprocessing.Queue. With a single
+    consumer, buckets are deserialized straight from the ring buffer. Buckets bigger than a slot
+    are split across consecutive slots.
+
+    Slot indices are only protected by a lock when there are several producers (or consumers)
+    for the Connector. With a single producer & a single consumer, each side is the only writer
+    of its own index, so no lock is taken at all.
+
+    The ring buffer is the only memory used by the Connector, so max_bytes just limits its number
+    of slots (to at least a single one).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 0,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        num_producers: int = 1,
+        num_consumers: int = 1,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        super().__init__(
+            maxsize=maxsize,
+            serializer=serializer or PickleSerializer(),
+            compressor=compressor,
+            max_bytes=max_bytes,
+        )
+
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"Slot size must be bigger than {_SLOT_HEADER.size} bytes")
+
+        self._num_slots = self._maxsize or DEFAULT_NUM_SLOTS
+        if max_bytes:
+            self._num_slots = max(min(self._num_slots, max_bytes // slot_size), 1)
+        self._slot_size = slot_size
+        self._max_chunk_size = slot_size - _SLOT_HEADER.size
+        self._num_producers = num_producers
+        self._num_consumers = num_consumers
+
+        self._shm: Optional[SharedMemory] = None
+        self._free_slots: Optional[Any] = None
+        self._used_slots: Optional[Any] = None
+        self._producer_lock: Optional[Any] = None
+        self._consumer_lock: Optional[Any] = None
+
+    def start(self):
+        self._shm = SharedMemory(
+            create=True, size=_RING_HEADER_SIZE + self._num_slots * self._slot_size
+        )
+        _POSITION.pack_into(self._shm.buf, _HEAD_OFFSET, 0)
+        _POSITION.pack_into(self._shm.buf, _TAIL_OFFSET, 0)
+        self._free_slots = multiprocessing.Semaphore(self._num_slots)
+        self._used_slots = multiprocessing.Semaphore(0)
+        if self._num_producers > 1:
+            self._producer_lock = multiprocessing.Lock()
+        if self._num_consumers > 1:
+            self._consumer_lock = multiprocessing.Lock()
+        self._started = True
+
+    def produce(self, bucket: List[Any]):
+        if bucket is NO_MORE_ITEMS:
+            self._produce_slots(kind=_NO_MORE_ITEMS, payload=b"")
+        else:
+            self._produce_slots(kind=_PAYLOAD, payload=self.serialize(bucket))
+
+    def produce_payload(self, payload: bytes):
+        self._produce_slots(kind=_PAYLOAD, payload=payload)
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        # the ring buffer only supports the "block" overflow policy
+        self.produce(bucket)
+        return True
+
+    def try_produce_payload(self, payload: bytes) -> bool:
+        self.produce_payload(payload)
+        return True
+
+    def consume(self) -> Optional[List[Any]]:
+        if self._consumer_lock:
+            # the payload is copied out of the ring buffer, so the (slower) deserialization happens
+            # after releasing the lock & other consumers can read meanwhile
+            with self._consumer_lock:
+                kind, view = self._acquire_slot()
+                kind, payload = self._read_payload(kind=kind, view=view)
+            return self._decode(kind=kind, payload=payload)
+
+        kind, view = self._acquire_slot()
+
+        if kind == _PAYLOAD and not self._serializer.loads_keep_references:
+            # the slot won't be overwritten until it is released
+            try:
+                return self._deserialize(view)
+            finally:
+                view.release()
+                self._release_slot()
+
+        kind, payload = self._read_payload(kind=kind, view=view)
+        return self._decode(kind=kind, payload=payload)
+
+    def get_current_size(self) -> int:
+        head = _POSITION.unpack_from(self._shm.buf, _HEAD_OFFSET)[0]
+        tail = _POSITION.unpack_from(self._shm.buf, _TAIL_OFFSET)[0]
+        return tail - head
+
+    def finish_producing(self, num_consumers: int):
+        for _ in range(num_consumers):
+            self.produce(NO_MORE_ITEMS)
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+    def _produce_slots(self, kind: int, payload: Union[bytes, bytearray]):
+        if self._producer_lock:
+            with self._producer_lock:
+                self._write_payload(kind=kind, payload=payload)
+        else:
+            self._write_payload(kind=kind, payload=payload)
+
+    def _write_payload(self, kind: int, payload: Union[bytes, bytearray]):
+        view = memoryview(payload)
+
+        while len(view) > self._max_chunk_size:
+            self._write_slot(kind=_PARTIAL_PAYLOAD, chunk=view[: self._max_chunk_size])
+            view = view[self._max_chunk_size :]  # noqa
+
+        self._write_slot(kind=kind, chunk=view)
+
+    def _write_slot(self, kind: int, chunk: memoryview):
+        self._free_slots.acquire()
+
+        buf = self._shm.buf
+        tail = _POSITION.unpack_from(buf, _TAIL_OFFSET)[0]
+        offset = _RING_HEADER_SIZE + (tail % self._num_slots) * self._slot_size
+        _SLOT_HEADER.pack_into(buf, offset, kind, len(chunk))
+        start = offset + _SLOT_HEADER.size
+        buf[start : start + len(chunk)] = chunk  # noqa
+        _POSITION.pack_into(buf, _TAIL_OFFSET, tail + 1)
+
+        self._used_slots.release()
+
+    def _acquire_slot(self) -> Tuple[int, memoryview]:
+        """Wait for the next slot to be written & return its kind and a view of its payload."""
+
+        self._used_slots.acquire()
+
+        buf = self._shm.buf
+        head = _POSITION.unpack_from(buf, _HEAD_OFFSET)[0]
+        offset = _RING_HEADER_SIZE + (head % self._num_slots) * self._slot_size
+        kind, length = _SLOT_HEADER.unpack_from(buf, offset)
+        start = offset + _SLOT_HEADER.size
+
+        return kind, buf[start : start + length]  # noqa
+
+    def _release_slot(self):
+        buf = self._shm.buf
+        head = _POSITION.unpack_from(buf, _HEAD_OFFSET)[0]
+        _POSITION.pack_into(buf, _HEAD_OFFSET, head + 1)
+        self._free_slots.release()
+
+    def _read_payload(self, kind: int, view: memoryview) -> Tuple[int, bytearray]:
+        """Copy the payload out of the ring buffer, joining its chunks if it was split."""
+
+        payload = bytearray(view)
+        view.release()
+        self._release_slot()
+
+        while kind == _PARTIAL_PAYLOAD:
+            kind, view = self._acquire_slot()
+            payload += view
+            view.release()
+            self._release_slot()
+
+        return kind, payload
+
+    def _decode(self, kind: int, payload: Union[bytes, bytearray]) -> Optional[List[Any]]:
+        if kind == _NO_MORE_ITEMS:
+            return NO_MORE_ITEMS
+        else:
+            return self._deserialize(payload)
@@ -0,0 +1,169 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+from typing import Optional, Any, List, Dict, BinaryIO
+from uuid import uuid4
+
+from cupyd.core.communication.byte_budget import InterProcessByteBudget
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.communication.connector import InterProcessConnector
+from cupyd.core.communication.serializer import Serializer, PickleSerializer
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+# number of buckets kept in memory when no maxsize was provided
+DEFAULT_MEMORY_BUCKETS = 500
+
+# spilled buckets are appended to a segment file till it reaches this size (in bytes)
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+# kind of every message put into the queue
+_IN_MEMORY = 0
+_SPILLED = 1
+
+
+class SpillingConnector(InterProcessConnector):
+    """Used for communication between Nodes at different processes pools, without ever blocking
+    the producer.
+
+    Up to maxsize buckets (and, if max_bytes is set, up to max_bytes of serialized buckets) are
+    kept in memory. Beyond that, the serialized (and optionally compressed) buckets are appended
+    to segment files in a temporary directory, and only a small reference to them goes through
+    the queue, so buckets are still consumed in FIFO order.
+
+    With a single consumer, every segment file is removed as soon as it has been fully read.
+    Otherwise, they are removed when the Connector is closed.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = DEFAULT_MEMORY_BUCKETS,
+        num_consumers: int = 1,
+        serializer: Optional[Serializer] = None,
+        compressor: Optional[Compressor] = None,
+        spill_directory: Optional[str] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_bytes: Optional[int] = None,
+    ):
+        super().__init__(
+            maxsize=maxsize or DEFAULT_MEMORY_BUCKETS,
+            serializer=serializer or PickleSerializer(),
+            compressor=compressor,
+            max_bytes=max_bytes,
+        )
+        self._num_consumers = num_consumers
+        self._spill_directory = spill_directory
+        self._segment_size = segment_size
+
+        self._directory: Optional[str] = None
+        self._memory_slots: Optional[Any] = None
+        self._write_file: Optional[BinaryIO] = None
+        self._read_file: Optional[BinaryIO] = None
+        self._spilled_buckets = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # open files can't be sent to other processes
+        state = self.__dict__.copy()
+        state.update(_write_file=None, _read_file=None, _spilled_buckets=0)
+        return state
+
+    def start(self):
+        # buckets in memory are limited by the semaphore, so the queue itself is unbounded
+        self._queue = multiprocessing.Queue()
+        self._memory_slots = multiprocessing.Semaphore(self._maxsize)
+        if self._max_bytes:
+            self._byte_budget = InterProcessByteBudget(max_bytes=self._max_bytes)
+        self._directory = tempfile.mkdtemp(prefix="cupyd_spill_", dir=self._spill_directory)
+        self._started = True
+
+    def produce(self, bucket: List[Any]):
+        if bucket is NO_MORE_ITEMS:
+            self._queue.put(NO_MORE_ITEMS)
+        else:
+            self.produce_payload(self.serialize(bucket))
+
+    def produce_payload(self, payload: bytes):
+        if self._memory_slots.acquire(block=False):
+            if self._byte_budget is None or self._byte_budget.acquire(len(payload), block=False):
+                self._queue.put((_IN_MEMORY, payload))
+                return
+            self._memory_slots.release()
+
+        self._queue.put((_SPILLED, *self._spill(payload)))
+
+    def try_produce(self, bucket: List[Any]) -> bool:
+        self.produce(bucket)  # never waits
+        return True
+
+    def try_produce_payload(self, payload: bytes) -> bool:
+        self.produce_payload(payload)
+        return True
+
+    def flush(self):
+        # the producer has finished, release its segment file
+        if self._write_file:
+            self._write_file.close()
+            self._write_file = None
+
+    def consume(self) -> Optional[List[Any]]:
+        message = self._queue.get()
+
+        if message is NO_MORE_ITEMS:
+            return NO_MORE_ITEMS
+        elif message[0] == _IN_MEMORY:
+            self._memory_slots.release()
+            if self._byte_budget:
+                self._byte_budget.release(len(message[1]))
+            return self._deserialize(message[1])
+        else:
+            return self._deserialize(self._read_spilled(*message[1:]))
+
+    def close(self):
+        super().close()
+        for file in (self._write_file, self._read_file):
+            if file:
+                file.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def collect_stats(self) -> Dict[str, int]:
+        stats = super().collect_stats()
+        spilled_buckets, self._spilled_buckets = self._spilled_buckets, 0
+        if spilled_buckets:
+            stats["spilled_buckets"] = spilled_buckets
+        return stats
+
+    def _spill(self, payload: bytes) -> tuple:
+        """Append the payload to the current segment file & return the reference to read it."""
+
+        if self._write_file is None:
+            path = os.path.join(self._directory, f"{os.getpid()}_{uuid4().hex}.segment")
+            self._write_file = open(path, "wb")
+
+        offset = self._write_file.tell()
+        self._write_file.write(payload)
+        self._write_file.flush()  # the consumer may read it as soon as the reference is queued
+
+        path = self._write_file.name
+        is_last = self._write_file.tell() >= self._segment_size
+        if is_last:
+            self._write_file.close()
+            self._write_file = None
+
+        self._spilled_buckets += 1
+        return path, offset, len(payload), is_last
+
+    def _read_spilled(self, path: str, offset: int, length: int, is_last: bool) -> bytes:
+        if self._read_file is None or self._read_file.name != path:
+            if self._read_file:
+                self._read_file.close()
+            self._read_file = open(path, "rb")
+
+        self._read_file.seek(offset)
+        payload = self._read_file.read(length)
+
+        if is_last and self._num_consumers == 1:
+            self._read_file.close()
+            self._read_file = None
+            os.remove(path)
+
+        return payload
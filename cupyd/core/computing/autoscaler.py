@@ -0,0 +1,143 @@
+import logging
+from collections import defaultdict
+from threading import Thread, Lock
+from time import sleep
+from typing import List, Dict, Set, Any
+
+from cupyd.core.communication.event_flag import EventFlag, IntraProcessEventFlag
+from cupyd.core.constants.connector_types import QUEUE
+from cupyd.core.constants.overflow_policies import BLOCK
+from cupyd.core.models.etl_segment import ETLSegment
+from cupyd.core.nodes import Transformer, Filter, Loader, Bulker, DeBulker
+
+logger = logging.getLogger("cupyd.autoscaler")
+
+# seconds between checks of the input connectors of the autoscaled segments
+AUTOSCALE_INTERVAL = 0.25
+
+# buckets waiting per ETLWorker in the input connector of a segment to spawn another ETLWorker
+SCALE_UP_BUCKETS_PER_WORKER = 2
+
+# consecutive checks with an empty input connector to retire an ETLWorker
+SCALE_DOWN_IDLE_CHECKS = 4
+
+
+def is_autoscalable(segment: ETLSegment) -> bool:
+    """Only the segments consuming from a shared queue can change their number of ETLWorkers.
+
+    Every other connector is sized for the number of consumers at build time, and ordered nodes
+    or nodes with their own "workers" configuration have a fixed number of ETLWorkers.
+    """
+
+    processor_types = (Transformer, Filter, Loader, Bulker, DeBulker)
+
+    root = segment.nodes[0]
+    if segment.run_in_main_process or not isinstance(root, processor_types):
+        return False
+
+    for node in segment.nodes:
+        if isinstance(node, processor_types) and (
+            getattr(node.configuration, "workers", None)
+            or getattr(node.configuration, "ordered", False)
+        ):
+            return False
+
+    return (
+        root.configuration.interprocess_connector == QUEUE
+        and root.configuration.overflow_policy == BLOCK
+    )
+
+
+class Autoscaler(Thread):
+    """Spawn & retire the ETLWorkerProcesses of the autoscaled segments, by their queue depth.
+
+    A segment gets another ETLWorker while buckets pile up in its input connector, and loses one
+    once its input connector has been empty for a while. An ETLWorker is retired by producing a
+    NO_MORE_ITEMS to the input connector, behind the buckets already waiting there: the
+    ETLWorker consuming it finishes like at the end of the ETL, so no bucket is lost.
+
+    The lock must be held by the main process thread while it handles the finished ETLWorkers.
+    """
+
+    def __init__(
+        self,
+        segments: List[ETLSegment],
+        active_worker_ids_by_segment_id: Dict[str, Set[str]],
+        workers_by_id: Dict[str, Any],
+        lock: Lock,
+        stop_event: EventFlag,
+        finalize_event: IntraProcessEventFlag,
+    ):
+        super().__init__(name="cupyd (autoscaler)", daemon=True)
+        self.segments = [segment for segment in segments if segment.max_workers]
+        self.active_worker_ids_by_segment_id = active_worker_ids_by_segment_id
+        self.workers_by_id = workers_by_id
+        self.lock = lock
+        self.stop_event = stop_event
+        self.finalize_event = finalize_event
+        self._idle_checks_by_segment_id: Dict[str, int] = defaultdict(int)
+
+    def run(self):
+        while not self.finalize_event and not self.stop_event:
+            sleep(AUTOSCALE_INTERVAL)
+
+            for segment in self.segments:
+                with self.lock:
+                    if self.finalize_event or self.stop_event:
+                        return
+                    if segment.id not in self.active_worker_ids_by_segment_id:
+                        continue
+                    self._scale(segment)
+
+    def _scale(self, segment: ETLSegment):
+        queue_size = segment.input_connector.get_current_size()  # type: ignore
+        queue_max_size = segment.nodes[0].configuration.queue_max_size  # type: ignore
+
+        scale_up_queue_size = segment.num_workers * SCALE_UP_BUCKETS_PER_WORKER
+        if queue_max_size:
+            scale_up_queue_size = min(scale_up_queue_size, queue_max_size)
+
+        if queue_size >= scale_up_queue_size and segment.num_workers < segment.max_workers:
+            self._spawn_worker(segment)
+            self._idle_checks_by_segment_id[segment.id] = 0
+        elif queue_size == 0 and not segment.input_finished:
+            self._idle_checks_by_segment_id[segment.id] += 1
+            if (
+                self._idle_checks_by_segment_id[segment.id] >= SCALE_DOWN_IDLE_CHECKS
+                and segment.num_workers > segment.min_workers
+            ):
+                self._retire_worker(segment)
+                self._idle_checks_by_segment_id[segment.id] = 0
+        else:
+            self._idle_checks_by_segment_id[segment.id] = 0
+
+    def _spawn_worker(self, segment: ETLSegment):
+        # a retiring ETLWorker keeps its index (its counter shard) until it has finished
+        active_worker_ids = self.active_worker_ids_by_segment_id[segment.id]
+        used_indexes = {
+            self.workers_by_id[worker_id].worker_index for worker_id in active_worker_ids
+        }
+        free_indexes = [idx for idx in range(segment.max_workers) if idx not in used_indexes]
+        if not free_indexes:
+            return
+
+        worker = segment.worker_factory(free_indexes[0])  # type: ignore
+        worker.start()
+
+        # once the nodes upstream have finished, a NO_MORE_ITEMS was already produced for every
+        # ETLWorker, so the new one needs its own
+        if segment.input_finished:
+            segment.input_connector.finish_producing(num_consumers=1)  # type: ignore
+
+        self.workers_by_id[worker.worker_id] = worker
+        segment.workers_by_id[worker.worker_id] = worker
+        active_worker_ids.add(worker.worker_id)
+        segment.num_workers += 1
+
+        logger.info(f"{segment.id} scaled up to {segment.num_workers} ETLWorkers")
+
+    def _retire_worker(self, segment: ETLSegment):
+        segment.input_connector.finish_producing(num_consumers=1)  # type: ignore
+        segment.num_workers -= 1
+
+        logger.info(f"{segment.id} scaled down to {segment.num_workers} ETLWorkers")
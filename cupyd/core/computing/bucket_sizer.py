@@ -0,0 +1,83 @@
+import logging
+from typing import Optional
+
+logger = logging.getLogger("cupyd.bucket_size")
+
+# weight of the latest measurement in the moving average of the seconds per item
+SMOOTHING_FACTOR = 0.3
+
+# max factor by which the bucket size changes after each bucket, so it doesn't oscillate
+MAX_STEP_FACTOR = 2.0
+
+# min factor between the bucket size last logged & the current one, to log it again
+LOGGING_FACTOR = 1.5
+
+
+class AdaptiveBucketSizer:
+    """Choose the size of the next bucket of an Extractor from the time the last ones took.
+
+    The seconds per item (extraction & production, including the waits caused by slow nodes
+    downstream) are averaged, and the bucket size is the number of items that would take
+    target_latency seconds, within [min_size, max_size]. If max_bytes is given, the bucket
+    size is also limited so a bucket takes at most max_bytes (estimated).
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int,
+        max_size: int,
+        target_latency: float,
+        max_bytes: Optional[int] = None,
+        name: str = "",
+    ):
+        if not 1 <= min_size <= max_size:
+            raise ValueError(f"Invalid bucket size window: [{min_size}, {max_size}]")
+        if target_latency <= 0:
+            raise ValueError(f"Invalid target bucket latency: {target_latency}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_bytes = max_bytes
+        self.name = name
+
+        self.size = self._clamp(initial_size)
+        self._seconds_per_item: Optional[float] = None
+        self._bytes_per_item: Optional[float] = None
+        self._logged_size = self.size
+
+    def update(self, num_items: int, elapsed: float, num_bytes: Optional[int] = None) -> int:
+        """Record the time (& bytes) taken by the last bucket, and return the next bucket size."""
+
+        if not num_items:
+            return self.size
+
+        self._seconds_per_item = self._average(self._seconds_per_item, elapsed / num_items)
+        if num_bytes is not None:
+            self._bytes_per_item = self._average(self._bytes_per_item, num_bytes / num_items)
+
+        size = self.target_latency / self._seconds_per_item if self._seconds_per_item else 0
+        if not size:
+            size = self.max_size
+        if self.max_bytes and self._bytes_per_item:
+            size = min(size, self.max_bytes / self._bytes_per_item)
+
+        size = min(max(size, self.size / MAX_STEP_FACTOR), self.size * MAX_STEP_FACTOR)
+        self.size = self._clamp(int(size))
+
+        ratio = self.size / self._logged_size
+        if ratio >= LOGGING_FACTOR or ratio <= 1 / LOGGING_FACTOR:
+            logger.info(f"Bucket size of {self.name}: {self._logged_size} -> {self.size}")
+            self._logged_size = self.size
+
+        return self.size
+
+    def _clamp(self, size: int) -> int:
+        return min(max(size, self.min_size), self.max_size)
+
+    @staticmethod
+    def _average(average: Optional[float], value: float) -> float:
+        if average is None:
+            return value
+        return SMOOTHING_FACTOR * value + (1 - SMOOTHING_FACTOR) * average
@@ -1,29 +1,52 @@
 import logging
+from ctypes import c_longlong
 from multiprocessing import Process
 from multiprocessing import Queue as MultiprocessingQueue
 from queue import Queue
 from threading import Thread
-from typing import List, Dict, Type, Tuple
+from typing import List, Dict, Type, Tuple, Optional
 
 from cupyd.core.communication import (
     Connector,
-    InterProcessEventFlag,
+    EventFlag,
     IntraProcessConnector,
-    MPCounter,
+    SharedIntraProcessConnector,
     InterruptionHandler,
 )
+from cupyd.core.communication.counter import CounterShard
 from cupyd.core.computing.node_worker import (
     NodeWorker,
     ExtractorWorker,
     ProcessorWorker,
     DeBulkerWorker,
     BulkerWorker,
+    AsyncExtractorWorker,
+    AsyncProcessorWorker,
+    FusedWorker,
 )
 from cupyd.core.constants.logging import LOGGING_FORMAT
 from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_exception import NodeException
-from cupyd.core.nodes import Extractor, Transformer, Loader, Filter, Bulker, DeBulker
+from cupyd.core.nodes import (
+    Extractor,
+    Transformer,
+    Loader,
+    Filter,
+    Bulker,
+    DeBulker,
+    AsyncExtractor,
+    AsyncTransformer,
+    AsyncLoader,
+)
+
+
+def _is_worker_connector(connector: Connector) -> bool:
+    """Whether the connector only links Nodes of this ETLWorker, so it's managed by it."""
+
+    return isinstance(connector, IntraProcessConnector) and not isinstance(
+        connector, SharedIntraProcessConnector
+    )
 
 
 class ETLWorker:
@@ -33,15 +56,21 @@ class ETLWorker:
         worker_id: str,
         segment_id: str,
         nodes: List[Node],
-        counters: Dict[str, MPCounter],
+        counters: Dict[str, CounterShard],
         input_connector_by_node_id: Dict[str, Connector],
         output_connectors_by_node_id: Dict[str, List[Connector]],
-        monitor_performance_event_by_node_id: Dict[str, InterProcessEventFlag],
-        stop_event: InterProcessEventFlag,
-        pause_event: InterProcessEventFlag,
+        monitor_performance_event_by_node_id: Dict[str, EventFlag],
+        stop_event: EventFlag,
+        pause_event: EventFlag,
         interruption_handler: InterruptionHandler,
         node_timings: MultiprocessingQueue,
         finished_workers: MultiprocessingQueue,
+        worker_index: int = 0,
+        frozen_buckets: bool = False,
+        detect_bucket_mutations: bool = False,
+        sequence_progress_by_node_id: Optional[Dict[str, c_longlong]] = None,
+        reorder_window: int = 0,
+        node_chains: Optional[List[List[Node]]] = None,
     ):
         super().__init__()
         self.worker_id = worker_id
@@ -56,24 +85,33 @@ class ETLWorker:
         self.node_timings = node_timings
         self.interruption_handler = interruption_handler
         self.finished_workers = finished_workers
+        self.worker_index = worker_index
+        self.frozen_buckets = frozen_buckets
+        self.detect_bucket_mutations = detect_bucket_mutations
+        self.sequence_progress_by_node_id = sequence_progress_by_node_id
+        self.reorder_window = reorder_window
+        # nodes of a chain are run by a single thread (fused), every other node by its own one
+        self.node_chains = node_chains or [[node] for node in nodes]
 
     def run(self):
         if isinstance(self, ETLWorkerProcess):
             logging.basicConfig(level=logging.INFO, format=LOGGING_FORMAT, force=True)
+        if not isinstance(self, ETLWorkerThread):
             self.interruption_handler.start()
 
-        thread_by_node_id: Dict[str, NodeWorker] = {}
+        thread_by_node_id: Dict[str, Thread] = {}
+        node_worker_by_node_id: Dict[str, NodeWorker] = {}
         finished_threads_queue: Queue[Tuple[str, NodeException]] = Queue()
 
         # start IntraProcessConnectors (InterProcessConnectors were started outside the ETLWorker)
         for connector in self.input_connector_by_node_id.values():
-            if isinstance(connector, IntraProcessConnector):
+            if _is_worker_connector(connector):
                 connector.start()
+            connector.bind_consumer(self.worker_index)
 
-        # each Node will have its own thread
         for node in self.nodes:
             thread_class = self._get_node_worker_class(node=node)
-            thread = thread_class(
+            node_worker = thread_class(
                 node=node,
                 counter=self.counters.get(node.id, None),
                 input_connector=self.input_connector_by_node_id.get(node.id, None),
@@ -83,23 +121,39 @@ class ETLWorker:
                 pause_event=self.pause_event,
                 node_timings=self.node_timings,
                 monitor_performance=self.monitor_performance_event_by_node_id[node.id],
+                frozen_buckets=self.frozen_buckets,
+                detect_bucket_mutations=self.detect_bucket_mutations,
+                sequence_progress_by_node_id=self.sequence_progress_by_node_id,
+                reorder_window=self.reorder_window,
             )
-            thread.start()
-            thread_by_node_id[node.id] = thread
+            node_worker_by_node_id[node.id] = node_worker
+
+        # each chain of Nodes will have its own thread
+        for chain in self.node_chains:
+            if len(chain) == 1:
+                chain_thread: Thread = node_worker_by_node_id[chain[0].id]
+            else:
+                chain_thread = FusedWorker([node_worker_by_node_id[node.id] for node in chain])
+            chain_thread.start()
+            for node in chain:
+                thread_by_node_id[node.id] = chain_thread
 
         exception_by_node_id: Dict[str, NodeException] = {}
 
         while thread_by_node_id:
             node_id, exception = finished_threads_queue.get()
 
-            # safely wait till the thread is completely finished
+            # safely wait till the thread is completely finished (with all its chain of Nodes)
             thread_by_node_id.pop(node_id).join()
 
             # send sentinel value to every IntraProcessConnector that is output of the finished
-            # Node, if any. InterProcessConnectors will be handled from the main process thread
+            # Node, if any. InterProcessConnectors will be handled from the main process thread,
+            # but any bucket they still buffer must be sent now
             for connector in self.output_connectors_by_node_id.get(node_id, []):
-                if isinstance(connector, IntraProcessConnector):
+                if _is_worker_connector(connector):
                     connector.produce(NO_MORE_ITEMS)
+                else:
+                    connector.flush()
 
             if exception:
                 exception_by_node_id[node_id] = exception
@@ -109,7 +163,11 @@ class ETLWorker:
 
     @staticmethod
     def _get_node_worker_class(node: Node) -> Type[NodeWorker]:
-        if isinstance(node, Extractor):
+        if isinstance(node, AsyncExtractor):
+            return AsyncExtractorWorker
+        elif isinstance(node, (AsyncTransformer, AsyncLoader)):
+            return AsyncProcessorWorker
+        elif isinstance(node, Extractor):
             return ExtractorWorker
         elif isinstance(node, Transformer) or isinstance(node, Filter) or isinstance(node, Loader):
             return ProcessorWorker
@@ -1,15 +1,32 @@
+import asyncio
+import inspect
 from abc import abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from ctypes import c_longlong
 from functools import partial
+from heapq import heappush, heappop
 from multiprocessing import Queue as MultiprocessingQueue
 from queue import Queue
-from threading import Thread
-from time import perf_counter
-from typing import List, Optional, Union, Any, Iterator
-
-from cupyd.core.communication import Connector, InterProcessEventFlag
+from threading import Thread, current_thread
+from time import perf_counter, sleep
+from typing import List, Optional, Union, Any, Iterator, Dict, Tuple, Callable, AsyncIterator
+
+from cupyd.core.columnar import (
+    is_columnar,
+    iter_rows,
+    take_rows,
+    filter_rows,
+    slice_rows,
+    concat_buckets,
+)
+from cupyd.core.communication import Connector, EventFlag
 from cupyd.core.communication.connector import IntraProcessConnector
-from cupyd.core.communication.counter import MPCounter
+from cupyd.core.communication.byte_budget import estimate_size
+from cupyd.core.communication.control_plane import CONTROL_PLANE_POLL_INTERVAL
+from cupyd.core.communication.counter import CounterShard, ITEMS_IN, ITEMS_OUT
+from cupyd.core.computing.bucket_sizer import AdaptiveBucketSizer
 from cupyd.core.constants.node_actions import (
     START,
     FINALIZE,
@@ -20,9 +37,15 @@ from cupyd.core.constants.node_actions import (
     CONSUME_BUCKET,
     GENERATE_BUCKET,
 )
+from cupyd.core.constants.overflow_policies import BLOCK
 from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+from cupyd.core.exceptions import BucketMutationError
+from cupyd.core.frozen import freeze, fingerprint
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_exception import NodeException
+from cupyd.core.nodes.async_extractor import AsyncExtractor
+from cupyd.core.nodes.async_loader import AsyncLoader
+from cupyd.core.nodes.async_transformer import AsyncTransformer
 from cupyd.core.nodes.bulker import Bulker
 from cupyd.core.nodes.debulker import DeBulker
 from cupyd.core.nodes.extractor import Extractor
@@ -30,6 +53,12 @@ from cupyd.core.nodes.filter import Filter
 from cupyd.core.nodes.loader import Loader
 from cupyd.core.nodes.transformer import Transformer
 
+# max number of buckets taken at once from the input connector
+CONSUME_BATCH_SIZE = 16
+
+# seconds the Extractor waits before checking again if the ordered nodes have caught up with it
+REORDER_WINDOW_POLL_INTERVAL = 0.001
+
 
 def _set_copy_bucket_on_produce(output_connectors: List[Connector]) -> List[Connector]:
     """Determine which connectors need a pre-copy of the bucket before producing them."""
@@ -53,31 +82,37 @@ def get_item_value_by_key(item: Any, key: str) -> Any:
         return getattr(item, key)
 
 
+def _overrides(node: Node, base_class: type, method_name: str) -> bool:
+    """Whether the class of the node overrides an optional method of its base class."""
+
+    return getattr(type(node), method_name) is not getattr(base_class, method_name)
+
+
 def _extractor_item_generator(extractor: Extractor) -> Iterator[List[Any]]:
-    for item in extractor.extract():
+    items = extractor.extract()
+    if isinstance(items, AsyncIterator):
+        raise TypeError(f"Async extract() of {extractor} requires an AsyncExtractor")
+    for item in items:
         yield item
 
 
+def _apply_to_item(function: Callable[[Any], Any], input_key: Optional[str], item: Any) -> Any:
+    if input_key:
+        return function(get_item_value_by_key(item=item, key=input_key))
+    return function(item)
+
+
 def _transformer_process_bucket(
     bucket: List[Any],
     transformer: Transformer,
     input_key: Optional[str],
+    map_items: Callable = map,
 ) -> List[Any]:
     """Run the transform() method on every item from a bucket."""
 
-    processed_bucket = []
-
-    for item in bucket:
-
-        if input_key:
-            value = get_item_value_by_key(item=item, key=input_key)
-            result = transformer.transform(value)
-        else:
-            result = transformer.transform(item)
-
-        processed_bucket.append(result)
-
-    return processed_bucket
+    return list(
+        map_items(partial(_apply_to_item, transformer.transform, input_key), iter_rows(bucket))
+    )
 
 
 def _filter_process_bucket(
@@ -86,25 +121,17 @@ def _filter_process_bucket(
     value_to_filter: Any,
     disable_safe_copy: bool,
     input_key: Optional[str],
+    map_items: Callable = map,
 ) -> List[Any]:
     """Run the filter() method on every item from a bucket."""
 
-    filtered_bucket = []
-
     items = bucket if disable_safe_copy else deepcopy(bucket)
+    results = map_items(partial(_apply_to_item, filter_node.filter, input_key), iter_rows(items))
 
-    for item_idx, item in enumerate(items):
-
-        if input_key:
-            value = get_item_value_by_key(item=item, key=input_key)
-            result = filter_node.filter(value)
-        else:
-            result = filter_node.filter(item)
-
-        if result != value_to_filter:
-            filtered_bucket.append(bucket[item_idx])
-
-    return filtered_bucket
+    return take_rows(
+        bucket,
+        [item_idx for item_idx, result in enumerate(results) if result != value_to_filter],
+    )
 
 
 def _loader_process_bucket(
@@ -113,26 +140,46 @@ def _loader_process_bucket(
     has_outputs: bool,
     disable_safe_copy: bool,
     input_key: Optional[str],
+    map_items: Callable = map,
 ) -> List[Any]:
     """Run the load() method on every item from a bucket."""
 
     # If the Loader output items are passed onto another Node, then, as a safety measure (unless
     # disabled), it will load a copy of the incoming bucket instead of the original one
-    if has_outputs:
-        items = bucket if disable_safe_copy else deepcopy(bucket)
-        for item in items:
-            if input_key:
-                value = get_item_value_by_key(item=item, key=input_key)
-                loader.load(value)
-            else:
-                loader.load(item)
+    if has_outputs and not disable_safe_copy:
+        items = deepcopy(bucket)
     else:
-        for item in bucket:
-            if input_key:
-                value = get_item_value_by_key(item=item, key=input_key)
-                loader.load(value)
-            else:
-                loader.load(item)
+        items = bucket
+
+    for _ in map_items(partial(_apply_to_item, loader.load, input_key), iter_rows(items)):
+        pass
+
+    return bucket
+
+
+def _filter_whole_bucket(
+    bucket: List[Any], filter_node: Filter, disable_safe_copy: bool
+) -> List[Any]:
+    """Run the filter_bucket() method on the bucket."""
+
+    items = bucket if disable_safe_copy else deepcopy(bucket)
+    result = filter_node.filter_bucket(items)
+
+    # columnar buckets may be filtered with a boolean mask
+    if is_columnar(bucket) and not is_columnar(result):
+        return filter_rows(bucket, result)
+    return result if is_columnar(result) else list(result)
+
+
+def _load_whole_bucket(
+    bucket: List[Any], loader: Loader, has_outputs: bool, disable_safe_copy: bool
+) -> List[Any]:
+    """Run the load_bucket() method on the bucket."""
+
+    if has_outputs and not disable_safe_copy:
+        loader.load_bucket(deepcopy(bucket))
+    else:
+        loader.load_bucket(bucket)
 
     return bucket
 
@@ -144,12 +191,16 @@ class NodeWorker(Thread):
         node: Union[Node, Extractor, Transformer, Filter, Loader, Bulker, DeBulker],
         input_connector: Optional[Connector],
         output_connectors: List[Connector],
-        counter: Optional[MPCounter],
+        counter: Optional[CounterShard],
         finished_threads_queue: Queue,
-        stop_event: InterProcessEventFlag,
-        pause_event: InterProcessEventFlag,
-        monitor_performance: InterProcessEventFlag,
+        stop_event: EventFlag,
+        pause_event: EventFlag,
+        monitor_performance: EventFlag,
         node_timings: MultiprocessingQueue,
+        frozen_buckets: bool = False,
+        detect_bucket_mutations: bool = False,
+        sequence_progress_by_node_id: Optional[Dict[str, c_longlong]] = None,
+        reorder_window: int = 0,
     ):
         super().__init__(name=node.name)
         self.node = node
@@ -161,29 +212,50 @@ class NodeWorker(Thread):
         self.pause_event = pause_event
         self.node_timings = node_timings
         self.monitor_performance = monitor_performance
+        self.frozen_buckets = frozen_buckets
+        self.detect_bucket_mutations = detect_bucket_mutations
+        # if there are ordered nodes, buckets travel along with their sequence number
+        self.sequence_progress_by_node_id = sequence_progress_by_node_id or {}
+        self.sequenced = bool(self.sequence_progress_by_node_id)
+        self.reorder_window = reorder_window
+        self.sequence_number = 0
+        self._reorder_buffer: Optional[List[Tuple[int, List[Any]]]] = None
+        if isinstance(self.node, (Transformer, Filter, Loader)) and self.node.configuration.ordered:
+            self._reorder_buffer = []
         self.exception_found: Optional[NodeException] = None
         self.skip_processing = False
         self.is_node_terminal = isinstance(self.node, Loader) and not self.node.outputs
+        self._consumed_buckets: deque = deque()
+        # next node of a fused chain, whose buckets are processed by this thread (see FusedWorker)
+        self.fused_output: Optional["ProcessorWorker"] = None
 
     def run(self):
+        self._start()
+
+        if not self.exception_found:
+            self._run()
+
+        self._finish()
+
+    def _start(self):
         # todo: could this be determined beforehand? should be possible, at build() step
-        self.output_connectors = _set_copy_bucket_on_produce(self.output_connectors)
+        # frozen buckets can't be modified, so a single one can be shared by all the connectors
+        if not self.frozen_buckets:
+            self.output_connectors = _set_copy_bucket_on_produce(self.output_connectors)
 
         if not isinstance(self.node, (Bulker, DeBulker)):
             try:
-                self.node.start()
+                self._run_node_method(self.node.start)
             except Exception as exc:
                 self.exception_found = NodeException(exc=exc, action=START)
 
-        if not self.exception_found:
-            self._run()
-
+    def _finish(self):
         if not isinstance(self.node, (Bulker, DeBulker)):
             try:
                 if self.exception_found:
-                    self.node.handle_exception(self.exception_found)
+                    self._run_node_method(self.node.handle_exception, self.exception_found)
                 else:
-                    self.node.finalize()
+                    self._run_node_method(self.node.finalize)
             except Exception as e:
                 self.exception_found = NodeException(exc=e, action=FINALIZE)
 
@@ -193,6 +265,100 @@ class NodeWorker(Thread):
     def _run(self):
         pass
 
+    def _run_node_method(self, method: Callable, *args: Any) -> Any:
+        return method(*args)
+
+    def _consume(self) -> Optional[List[Any]]:
+        """Consume the next bucket (in order, if the node is ordered)."""
+
+        if self._reorder_buffer is None:
+            entry = self._consume_entry()
+        else:
+            entry = self._consume_entry_in_order()
+
+        if self.sequenced and entry is not NO_MORE_ITEMS:
+            self.sequence_number, entry = entry
+        return entry
+
+    def _consume_entry(self) -> Any:
+        """Consume the next entry, taking all the available ones at once from the connector."""
+
+        if not self._consumed_buckets:
+            self._consumed_buckets.extend(
+                self.input_connector.consume_many(max_buckets=CONSUME_BATCH_SIZE)
+            )
+        return self._consumed_buckets.popleft()
+
+    def _consume_entry_in_order(self) -> Any:
+        """Hold the buckets arriving ahead of their turn until all the previous ones arrive."""
+
+        next_sequence_number = self.sequence_progress_by_node_id[self.node.id].value
+
+        while not self._reorder_buffer or self._reorder_buffer[0][0] != next_sequence_number:
+            entry = self._consume_entry()
+
+            if entry is NO_MORE_ITEMS:
+                # there can only be missing buckets if another node failed, release the rest
+                if self._reorder_buffer:
+                    self._consumed_buckets.appendleft(NO_MORE_ITEMS)
+                    return heappop(self._reorder_buffer)
+                return NO_MORE_ITEMS
+
+            heappush(self._reorder_buffer, entry)
+
+        # let the Extractor know it can generate more buckets
+        self.sequence_progress_by_node_id[self.node.id].value = next_sequence_number + 1
+        return heappop(self._reorder_buffer)
+
+    def _produce(self, bucket: List[Any]) -> None:
+        """Produce the bucket to every output connector (with its sequence number, if needed)."""
+
+        if self.fused_output:
+            self._produce_fused(bucket)
+            return
+
+        entry = (self.sequence_number, bucket) if self.sequenced else bucket
+        self._produce_entry(entry)
+
+    def _produce_fused(self, bucket: List[Any]) -> None:
+        """Process the bucket right away in the next node of the chain, within this thread."""
+
+        fused_output = self.fused_output
+        fused_output.sequence_number = self.sequence_number
+
+        # logs keep showing the name of the node running
+        thread = current_thread()
+        thread.name = fused_output.node.name
+        try:
+            fused_output._process_bucket(bucket)
+        finally:
+            thread.name = self.node.name
+
+    def _produce_entry(self, entry: Any) -> None:
+        if len(self.output_connectors) == 1:
+            connector = self.output_connectors[0]
+            if connector.overflow_policy == BLOCK:
+                connector.produce(entry)
+            elif not connector.try_produce(entry):
+                connector.produce_overflowing(entry)
+            return
+
+        # a full connector can't delay the rest: it is only waited for (or dropped, etc.) after
+        # all the others got the bucket
+        full_connectors = [
+            connector for connector in self.output_connectors if not connector.try_produce(entry)
+        ]
+        for connector in full_connectors:
+            connector.produce_overflowing(entry)
+
+    def _put_connectors_stats(self) -> None:
+        """Send the stats gathered by the output connectors along with the node timings."""
+
+        for connector in self.output_connectors:
+            for stat_name, value in connector.collect_stats().items():
+                if value:
+                    self.node_timings.put((self.node.id, stat_name, value))
+
     def _handle_exception(self, exception: Exception, action: str) -> None:
         if not self.stop_event:
             self.stop_event.set()
@@ -206,11 +372,27 @@ class ExtractorWorker(NodeWorker):
     def _run(self):
         self.node: Extractor
 
-        bucket: List[Any] = []
+        bucket: Any = []
         stop_iteration = False
         start_time: Optional[float] = None
-        bucket_size = self.node.configuration.bucket_size
-        generator = _extractor_item_generator(extractor=self.node)
+        configuration = self.node.configuration
+        bucket_size = configuration.bucket_size
+        self._generator = _extractor_item_generator(extractor=self.node)
+        self._bucket_generator: Optional[Iterator[List[Any]]] = None
+        if _overrides(self.node, Extractor, "extract_buckets"):
+            self._bucket_generator = self.node.extract_buckets()
+
+        bucket_sizer: Optional[AdaptiveBucketSizer] = None
+        if configuration.adaptive_bucket_size:
+            bucket_sizer = AdaptiveBucketSizer(
+                initial_size=bucket_size,
+                min_size=configuration.min_bucket_size,
+                max_size=configuration.max_bucket_size,
+                target_latency=configuration.target_bucket_latency,
+                max_bytes=configuration.max_bucket_bytes,
+                name=self.node.name,
+            )
+            bucket_size = bucket_sizer.size
 
         while not self.stop_event:
 
@@ -219,10 +401,15 @@ class ExtractorWorker(NodeWorker):
 
             # generate a bucket of items
             try:
-                start_time = perf_counter() if self.monitor_performance else None
+                if self.monitor_performance or bucket_sizer:
+                    start_time = perf_counter()
+                else:
+                    start_time = None
 
-                while len(bucket) < bucket_size:
-                    bucket.append(next(generator))
+                if self._bucket_generator:
+                    bucket = next(self._bucket_generator)
+                else:
+                    self._fill_bucket(bucket=bucket, bucket_size=bucket_size)
 
             except StopIteration:
                 stop_iteration = True
@@ -233,16 +420,37 @@ class ExtractorWorker(NodeWorker):
             # produce the bucket to the output connectors of the node
             if bucket:
                 try:
-                    for connector in self.output_connectors:
-                        connector.produce(bucket)
+                    if bucket_sizer and bucket_sizer.max_bytes:
+                        bucket_bytes: Optional[int] = estimate_size(bucket)
+                    else:
+                        bucket_bytes = None
+                    if self.frozen_buckets:
+                        bucket = freeze(bucket)
+                    if self.sequenced:
+                        self._wait_for_ordered_nodes()
+                    self._produce(bucket)
+                    self.sequence_number += 1
                 except Exception as e:
                     self.exception_found = NodeException(exc=e, action=PRODUCE_BUCKET)
                     break
 
+                try:
+                    if self.counter:
+                        self.counter.increase(amount=len(bucket), field=ITEMS_OUT)
+                except Exception as e:
+                    self.exception_found = NodeException(exc=e, action=UPDATE_COUNTER)
+                    break
+
                 try:
                     if start_time:
-                        timing = (perf_counter() - start_time) / len(bucket)
-                        self.node_timings.put((self.node.id, timing))
+                        elapsed = perf_counter() - start_time
+                        if self.monitor_performance:
+                            self.node_timings.put((self.node.id, elapsed / len(bucket)))
+                            self._put_connectors_stats()
+                        if bucket_sizer:
+                            bucket_size = bucket_sizer.update(
+                                num_items=len(bucket), elapsed=elapsed, num_bytes=bucket_bytes
+                            )
                 except Exception as e:
                     self.exception_found = NodeException(exc=e, action=PRODUCE_TIMING)
                     break
@@ -252,96 +460,223 @@ class ExtractorWorker(NodeWorker):
             if stop_iteration:
                 break
 
+    def _fill_bucket(self, bucket: List[Any], bucket_size: int):
+        """Extract items into the bucket until it's full. StopIteration once there are no more."""
+
+        while len(bucket) < bucket_size:
+            bucket.append(next(self._generator))
+
+    def _wait_for_ordered_nodes(self):
+        """Don't get further ahead of the ordered nodes than their reorder buffers allow."""
+
+        for progress in self.sequence_progress_by_node_id.values():
+            while self.sequence_number - progress.value >= self.reorder_window:
+                if self.stop_event:
+                    return
+                sleep(REORDER_WINDOW_POLL_INTERVAL)
+
 
 class ProcessorWorker(NodeWorker):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        if isinstance(self.node, Transformer):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        map_items = self._get_map_items()
+
+        # nodes overriding the bucket-level methods get the whole bucket at once
+        if isinstance(self.node, Transformer) and _overrides(
+            self.node, Transformer, "transform_bucket"
+        ):
+            self._process_bucket_function = self.node.transform_bucket
+        elif isinstance(self.node, Loader) and _overrides(self.node, Loader, "load_bucket"):
+            self._process_bucket_function = partial(
+                _load_whole_bucket,
+                loader=self.node,
+                has_outputs=bool(self.node.outputs),
+                disable_safe_copy=self.node.configuration.disable_safe_copy or self.frozen_buckets,
+            )
+        elif isinstance(self.node, Filter) and _overrides(self.node, Filter, "filter_bucket"):
+            self._process_bucket_function = partial(
+                _filter_whole_bucket,
+                filter_node=self.node,
+                disable_safe_copy=self.node.configuration.disable_safe_copy or self.frozen_buckets,
+            )
+        elif isinstance(self.node, Transformer):
             self._process_bucket_function = partial(
                 _transformer_process_bucket,
                 transformer=self.node,
                 input_key=self.node.configuration.input_key,
+                map_items=map_items,
             )
         elif isinstance(self.node, Loader):
             self._process_bucket_function = partial(
                 _loader_process_bucket,
                 loader=self.node,
                 has_outputs=bool(self.node.outputs),
-                disable_safe_copy=self.node.configuration.disable_safe_copy,
+                disable_safe_copy=self.node.configuration.disable_safe_copy or self.frozen_buckets,
                 input_key=self.node.configuration.input_key,
+                map_items=map_items,
             )
         elif isinstance(self.node, Filter):
             self._process_bucket_function = partial(
                 _filter_process_bucket,
                 filter_node=self.node,
                 value_to_filter=self.node.configuration.value_to_filter,
-                disable_safe_copy=self.node.configuration.disable_safe_copy,
+                disable_safe_copy=self.node.configuration.disable_safe_copy or self.frozen_buckets,
                 input_key=self.node.configuration.input_key,
+                map_items=map_items,
             )
         else:
             raise TypeError(f"Invalid node type: {type(self.node)}")
 
-    # TODO: Might be useful to know which item value caused the error
-    def _run(self):
-        timing: Optional[float] = None
-        bucket = None
+    def _get_map_items(self) -> Callable:
+        """Function applying the node method to every item of a bucket, like map()."""
+
+        # items of a bucket processed concurrently (in order) by a pool of threads, if concurrency
+        # is above 1, so I/O bound nodes don't wait for each item before starting the next one
+        concurrency = 1
+        if isinstance(self.node, (Transformer, Filter, Loader)):
+            concurrency = self.node.configuration.concurrency
+        if concurrency > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix=self.node.name
+            )
+            return self._executor.map
+        return map
 
+    def _run(self):
         while True:
             # consume a bucket of items
             try:
-                bucket = self.input_connector.consume()
+                bucket = self._consume()
                 if bucket is NO_MORE_ITEMS:
                     break
             except Exception as e:
                 self._handle_exception(exception=e, action=CONSUME_BUCKET)
+                continue
 
-            if self.stop_event:
-                self.skip_processing = True
+            self._process_bucket(bucket)
 
-            if self.skip_processing:
-                continue
+    def _finish(self):
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+        super()._finish()
 
-            if self.pause_event:
-                self.pause_event.wait()
+    # TODO: Might be useful to know which item value caused the error
+    def _process_bucket(self, bucket: List[Any]):
+        """Process a bucket & produce the result to the output connectors of the node."""
 
-            # process the bucket
-            # todo: detect the stop or pause event as soon its set, checking on every item
-            #  instead on every bucket? Add timeout to avoid hanging processing after stop was set?
-            try:
-                start_time = perf_counter() if self.monitor_performance else None
+        timing: Optional[float] = None
 
-                bucket = self._process_bucket_function(bucket)
+        if self.stop_event:
+            self.skip_processing = True
 
-                if start_time and bucket:
-                    timing = (perf_counter() - start_time) / len(bucket)
+        if self.skip_processing:
+            return
 
-            except Exception as e:
-                self._handle_exception(exception=e, action=PROCESS_BUCKET)
+        if self.pause_event:
+            self.pause_event.wait()
+
+        # process the bucket
+        # todo: detect the stop or pause event as soon its set, checking on every item
+        #  instead on every bucket? Add timeout to avoid hanging processing after stop was set?
+        try:
+            start_time = perf_counter() if self.monitor_performance else None
+
+            num_items_in = len(bucket)
+
+            if self.detect_bucket_mutations:
+                bucket = self._process_bucket_detecting_mutations(bucket)
             else:
-                # produce the bucket to the output connectors of the node
-                try:
-                    for connector in self.output_connectors:
-                        connector.produce(bucket)
-                except Exception as e:
-                    self._handle_exception(exception=e, action=PRODUCE_BUCKET)
-                    continue
+                bucket = self._process_bucket_function(bucket)
 
-                try:
-                    if timing:
-                        self.node_timings.put((self.node.id, timing))
-                        timing = None
-                except Exception as e:
-                    self._handle_exception(exception=e, action=PRODUCE_TIMING)
-                    continue
+            # new items are created by Transformers only, the rest are already frozen
+            if self.frozen_buckets and isinstance(self.node, Transformer):
+                bucket = freeze(bucket)
+
+            if start_time and bucket:
+                timing = (perf_counter() - start_time) / len(bucket)
+
+        except Exception as e:
+            self._handle_exception(exception=e, action=PROCESS_BUCKET)
+            return
+
+        # the bucket is left incomplete if the node was stopped while processing it
+        if self.skip_processing:
+            return
+
+        # produce the bucket to the output connectors of the node
+        try:
+            self._produce(bucket)
+        except Exception as e:
+            self._handle_exception(exception=e, action=PRODUCE_BUCKET)
+            return
+
+        try:
+            if timing:
+                self.node_timings.put((self.node.id, timing))
+                self._put_connectors_stats()
+        except Exception as e:
+            self._handle_exception(exception=e, action=PRODUCE_TIMING)
+            return
+
+        try:
+            if self.counter:
+                self.counter.increase(amount=num_items_in, field=ITEMS_IN)
+                self.counter.increase(amount=len(bucket), field=ITEMS_OUT)
+        except Exception as e:
+            self._handle_exception(exception=e, action=UPDATE_COUNTER)
+
+    def _process_bucket_detecting_mutations(self, bucket: List[Any]) -> List[Any]:
+        """Process the bucket, ensuring the node didn't modify the incoming items."""
+
+        # an unmodified bucket must be pickled exactly the same way
+        input_fingerprint = fingerprint(bucket)
+        processed_bucket = self._process_bucket_function(bucket)
+
+        if fingerprint(bucket) != input_fingerprint:
+            raise BucketMutationError(
+                f"Node {self.node.name} modified the items of an incoming bucket, which are "
+                f"shared with other nodes. Copy the items before modifying them."
+            )
 
-                try:
-                    if self.counter:
-                        self.counter.increase(amount=len(bucket))
-                except Exception as e:
-                    self._handle_exception(exception=e, action=UPDATE_COUNTER)
-                    continue
+        return processed_bucket
+
+
+class FusedWorker(Thread):
+    """Chain of ProcessorWorkers run by a single thread.
+
+    Consecutive Transformers, Filters & Loaders with a single output don't need a thread & a
+    connector each: the first worker consumes the buckets, and every worker processes its output
+    right away in the next one. Each node keeps its own start(), finalize(), exception handling,
+    timings & counters, and the thread takes the name of the node running.
+    """
+
+    def __init__(self, workers: List[NodeWorker]):
+        super().__init__(name=workers[0].node.name)
+        self.workers = [worker for worker in workers if isinstance(worker, ProcessorWorker)]
+        if len(self.workers) != len(workers):
+            raise TypeError("Only ProcessorWorkers can be fused")
+        for worker, next_worker in zip(self.workers, self.workers[1:]):
+            worker.fused_output = next_worker
+
+    def run(self):
+        for worker in self.workers:
+            self.name = worker.node.name
+            worker._start()
+            # a node that couldn't start drops the buckets, like if it had no thread
+            if worker.exception_found:
+                worker.skip_processing = True
+
+        head = self.workers[0]
+        if not head.exception_found:
+            self.name = head.node.name
+            head._run()
+
+        for worker in self.workers:
+            self.name = worker.node.name
+            worker._finish()
 
 
 class BulkerWorker(NodeWorker):
@@ -349,14 +684,14 @@ class BulkerWorker(NodeWorker):
     def _run(self):
         self.node: Bulker
 
-        bulk = []
+        bulk: Any = []
         bulk_size = self.node.bulk_size  # TODO: allow changing bulk size dynamically?
 
         while True:
 
             # consume a bucket of items
             try:
-                bucket = self.input_connector.consume()
+                bucket = self._consume()
                 if bucket is NO_MORE_ITEMS:
                     break
             except Exception as e:
@@ -373,15 +708,23 @@ class BulkerWorker(NodeWorker):
                 self.pause_event.wait()
 
             try:
-                bulk.extend(bucket)
+                if is_columnar(bucket):
+                    bulk = concat_buckets([bulk, bucket]) if len(bulk) else bucket
+                else:
+                    bulk.extend(bucket)
+                if self.counter:
+                    self.counter.increase(amount=len(bucket), field=ITEMS_IN)
 
                 if len(bulk) >= bulk_size:
                     remaining_items = None
 
                     for chunk in self._chunk(items=bulk, bulk_size=bulk_size):
                         if len(chunk) == bulk_size:
-                            for connector in self.output_connectors:
-                                connector.produce([chunk])
+                            if self.frozen_buckets:
+                                chunk = freeze(chunk)
+                            self._produce([chunk])
+                            if self.counter:
+                                self.counter.increase(amount=1, field=ITEMS_OUT)
                         else:
                             remaining_items = chunk
 
@@ -394,15 +737,18 @@ class BulkerWorker(NodeWorker):
         # if there are remaining items, produce them
         if bulk and self.exception_found is None:
             try:
-                for connector in self.output_connectors:
-                    connector.produce([bulk])
+                if self.frozen_buckets:
+                    bulk = freeze(bulk)
+                self._produce([bulk])
+                if self.counter:
+                    self.counter.increase(amount=1, field=ITEMS_OUT)
             except Exception as e:
                 self._handle_exception(exception=e, action=PRODUCE_BUCKET)
 
     @staticmethod
-    def _chunk(items: List[Any], bulk_size: int) -> Iterator[List[Any]]:
+    def _chunk(items: Any, bulk_size: int) -> Iterator[Any]:
         for i in range(0, len(items), bulk_size):
-            yield items[i : i + bulk_size]  # noqa
+            yield slice_rows(items, i, i + bulk_size)
 
 
 class DeBulkerWorker(NodeWorker):
@@ -412,7 +758,7 @@ class DeBulkerWorker(NodeWorker):
 
             # consume a bucket of items
             try:
-                bucket = self.input_connector.consume()
+                bucket = self._consume()
                 if bucket is NO_MORE_ITEMS:
                     break
             except Exception as e:
@@ -429,9 +775,118 @@ class DeBulkerWorker(NodeWorker):
                 self.pause_event.wait()
 
             try:
-                for item in bucket:
-                    for connector in self.output_connectors:
-                        connector.produce(item)
+                if self.sequenced:
+                    # ordered nodes can't be downstream, the sequence number doesn't matter here
+                    bucket = [(self.sequence_number, item) for item in bucket]
+                if len(self.output_connectors) == 1 and (
+                    self.output_connectors[0].overflow_policy == BLOCK
+                ):
+                    self.output_connectors[0].produce_many(bucket)
+                else:
+                    for entry in bucket:
+                        self._produce_entry(entry)
             except Exception as e:
                 self._handle_exception(exception=e, action=PRODUCE_BUCKET)
                 continue
+
+            try:
+                if self.counter:
+                    self.counter.increase(amount=len(bucket), field=ITEMS_IN)
+                    self.counter.increase(amount=len(bucket), field=ITEMS_OUT)
+            except Exception as e:
+                self._handle_exception(exception=e, action=UPDATE_COUNTER)
+                continue
+
+
+class AsyncNodeWorker(NodeWorker):
+    """NodeWorker running the coroutines of its node in an event loop of its own thread.
+
+    The start(), finalize() & handle_exception() methods of the node may be coroutines too.
+    """
+
+    def run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            super().run()
+        finally:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            asyncio.set_event_loop(None)
+            self._loop.close()
+
+    def _run_node_method(self, method: Callable, *args: Any) -> Any:
+        result = method(*args)
+        if inspect.isawaitable(result):
+            return self._loop.run_until_complete(result)
+        return result
+
+    async def _wait_while_paused(self):
+        # the event loop keeps running, so the awaited items aren't blocked by the pause
+        while self.pause_event and not self.stop_event:
+            await asyncio.sleep(CONTROL_PLANE_POLL_INTERVAL)
+
+
+class AsyncExtractorWorker(AsyncNodeWorker, ExtractorWorker):
+
+    def _run(self):
+        self.node: AsyncExtractor
+        self._async_generator: AsyncIterator[Any] = self.node.extract()
+        super()._run()
+
+    def _fill_bucket(self, bucket: List[Any], bucket_size: int):
+        if self._loop.run_until_complete(self._fill_bucket_async(bucket, bucket_size)):
+            raise StopIteration
+
+    async def _fill_bucket_async(self, bucket: List[Any], bucket_size: int) -> bool:
+        """Extract items into the bucket until it's full. True once there are no more."""
+
+        while len(bucket) < bucket_size:
+            if self.pause_event:
+                await self._wait_while_paused()
+            if self.stop_event:
+                return False
+
+            try:
+                bucket.append(await self._async_generator.__anext__())
+            except StopAsyncIteration:
+                return True
+
+        return False
+
+
+class AsyncProcessorWorker(AsyncNodeWorker, ProcessorWorker):
+    """ProcessorWorker awaiting up to configuration.concurrency items of each bucket at once."""
+
+    def _get_map_items(self) -> Callable:
+        return self._map_items
+
+    def _map_items(self, function: Callable, items: List[Any]) -> List[Any]:
+        return self._loop.run_until_complete(self._map_items_async(function, items))
+
+    async def _map_items_async(self, function: Callable, items: List[Any]) -> List[Any]:
+        results: List[Any] = [None] * len(items)
+        indexes = iter(range(len(items)))
+
+        # a fixed number of tasks take the next item once they're done with theirs
+        async def process_items():
+            for idx in indexes:
+                if self.pause_event:
+                    await self._wait_while_paused()
+                if self.stop_event:
+                    self.skip_processing = True
+                    return
+                results[idx] = await function(items[idx])
+
+        self.node: Union[AsyncTransformer, AsyncLoader]
+        concurrency = min(self.node.configuration.concurrency, len(items)) or 1
+        tasks = [asyncio.ensure_future(process_items()) for _ in range(concurrency)]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+
+        # the first exception raised is the one handled, the items still awaited are cancelled
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()
+
+        return results
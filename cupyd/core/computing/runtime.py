@@ -0,0 +1,246 @@
+import logging
+import platform
+import sys
+from contextlib import contextmanager
+from multiprocessing import get_context, context, reduction, resource_sharer
+from time import perf_counter
+from typing import List, Optional, Any
+
+from cupyd.core.computing.etl_worker import ETLWorker
+from cupyd.core.constants.logging import LOGGING_FORMAT
+from cupyd.core.constants.node_actions import START
+from cupyd.core.models.node_exception import NodeException
+
+logger = logging.getLogger("cupyd.runtime")
+
+# messages sent by the warm processes to the main process
+READY = "ready"
+DONE = "done"
+
+
+def _can_share_resources() -> bool:
+    """Whether the private multiprocessing APIs used by _sharing_resources() are available."""
+
+    if platform.python_implementation() != "CPython" or sys.platform == "win32":
+        return False
+    return hasattr(context, "set_spawning_popen") and hasattr(resource_sharer, "DupFd")
+
+
+class _SharingPopen:
+    """Stand-in for the Popen of a process being spawned.
+
+    Connectors, counters & flags can only be pickled while spawning a process. Pretending to be
+    spawning one lets them be sent to a process that is already running: their file descriptors
+    are passed with the resource_sharer, and their semaphores are reopened by name.
+    """
+
+    @staticmethod
+    def duplicate_for_child(fd: int) -> int:
+        return fd
+
+    @staticmethod
+    def DupFd(fd: int) -> Any:
+        return resource_sharer.DupFd(fd)
+
+
+@contextmanager
+def _sharing_resources():
+    context.set_spawning_popen(_SharingPopen())  # type: ignore[arg-type]
+    try:
+        yield
+    finally:
+        context.set_spawning_popen(None)
+
+
+def _run_warm_process(connection: Any):
+    logging.basicConfig(level=logging.INFO, format=LOGGING_FORMAT, force=True)
+    connection.send(READY)
+
+    while True:
+        header = connection.recv_bytes()
+        if not header:
+            break
+
+        # the header is enough to report the ETLWorker as finished, even if it can't be loaded
+        worker_id, segment_id, node_id, finished_workers, stop_event = (
+            reduction.ForkingPickler.loads(header)
+        )
+        worker: Optional[ETLWorker] = None
+        try:
+            worker = reduction.ForkingPickler.loads(connection.recv_bytes())
+            worker.run()
+        except Exception as exc:
+            # the ETL waits for every ETLWorker to report it has finished, and stops like if one
+            # of its nodes had failed
+            logger.exception(f"{worker_id} failed in the warm process")
+            stop_event.set()
+            finished_workers.put(
+                (worker_id, segment_id, {node_id: NodeException(exc=exc, action=START)})
+            )
+        finally:
+            if worker:
+                worker.interruption_handler.restore_handlers()
+            connection.send(DONE)
+
+
+class WarmProcess:
+    """Spawned process that runs ETLWorkers, one after another, for several ETLs."""
+
+    def __init__(self, name: str):
+        self._connection, child_connection = get_context("spawn").Pipe()
+        self._process = get_context("spawn").Process(
+            target=_run_warm_process, args=(child_connection,), name=name, daemon=True
+        )
+        self.busy = False
+        self.spawn_time: Optional[float] = None
+        self._spawn_start_time = perf_counter()
+        self._process.start()
+        # only the child keeps its end, so recv() fails instead of waiting if the process dies
+        child_connection.close()
+
+    @property
+    def name(self) -> str:
+        return self._process.name
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def wait_until_ready(self):
+        if self.spawn_time is None:
+            self._connection.recv()
+            self.spawn_time = perf_counter() - self._spawn_start_time
+
+    def submit(self, worker: ETLWorker):
+        with _sharing_resources():
+            header = reduction.ForkingPickler.dumps(
+                (
+                    worker.worker_id,
+                    worker.segment_id,
+                    worker.nodes[0].id,
+                    worker.finished_workers,
+                    worker.stop_event,
+                )
+            )
+            payload = reduction.ForkingPickler.dumps(worker)
+
+        self.busy = True
+        self._connection.send_bytes(header)
+        self._connection.send_bytes(payload)
+
+    def join(self):
+        if self.busy:
+            try:
+                self._connection.recv()
+            except EOFError:
+                logger.warning(f"{self.name} died while running an ETLWorker")
+            self.busy = False
+
+    def close(self):
+        if self._process.is_alive():
+            self._connection.send_bytes(b"")
+        self._process.join()
+        self._connection.close()
+
+
+class PooledETLWorker:
+    """ETLWorker run by a WarmProcess of an ETLRuntime, instead of by a new ETLWorkerProcess."""
+
+    def __init__(self, worker: ETLWorker, runtime: "ETLRuntime"):
+        self.worker = worker
+        self.runtime = runtime
+        self._warm_process: Optional[WarmProcess] = None
+
+    @property
+    def worker_id(self) -> str:
+        return self.worker.worker_id
+
+    @property
+    def worker_index(self) -> int:
+        return self.worker.worker_index
+
+    def start(self):
+        self._warm_process = self.runtime.acquire()
+        self._warm_process.submit(self.worker)
+
+    def join(self):
+        if self._warm_process:
+            self._warm_process.join()
+
+
+class ETLRuntime:
+    """Pool of spawned processes kept alive between ETL runs.
+
+    Spawning an ETLWorkerProcess means starting an interpreter, importing cupyd & the modules of
+    the nodes, and unpickling them. The WarmProcesses of an ETLRuntime pay for it once: each ETL
+    run with ETL.run(runtime=...) just sends them the ETLWorkers of its segments. The pool grows
+    when a run needs more processes than the idle ones, and is closed with close() (or by using
+    it as a context manager).
+    """
+
+    def __init__(self, num_processes: int = 1):
+        if not _can_share_resources():
+            raise RuntimeError(
+                f"ETLRuntime isn't supported on {platform.python_implementation()} "
+                f"{platform.python_version()} ({sys.platform})"
+            )
+
+        self.num_processes = num_processes
+        self._warm_processes: List[WarmProcess] = []
+        self._num_spawned = 0
+
+    def start(self):
+        processes = [self._spawn() for _ in range(self.num_processes - len(self._warm_processes))]
+        for process in processes:
+            process.wait_until_ready()
+
+    def acquire(self) -> WarmProcess:
+        # dead processes (e.g. killed by the OS) are replaced by new ones
+        for process in [p for p in self._warm_processes if not p.busy and not p.is_alive()]:
+            logger.warning(f"{process.name} is dead, spawning a new one")
+            process.close()
+            self._warm_processes.remove(process)
+
+        for process in self._warm_processes:
+            if not process.busy:
+                process.wait_until_ready()
+                return process
+
+        process = self._spawn()
+        process.wait_until_ready()
+        return process
+
+    @property
+    def processes(self) -> List[WarmProcess]:
+        """WarmProcesses of the pool."""
+
+        return list(self._warm_processes)
+
+    @property
+    def spawn_time(self) -> float:
+        """Average seconds a WarmProcess took to be ready, saved by every ETLWorker it runs."""
+
+        spawn_times = [p.spawn_time for p in self._warm_processes if p.spawn_time is not None]
+        return sum(spawn_times) / len(spawn_times) if spawn_times else 0.0
+
+    def close(self):
+        for process in self._warm_processes:
+            process.join()
+            process.close()
+        self._warm_processes = []
+
+    def __enter__(self) -> "ETLRuntime":
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _spawn(self) -> WarmProcess:
+        self._num_spawned += 1
+        process = WarmProcess(name=f"cupyd (warm process {self._num_spawned})")
+        self._warm_processes.append(process)
+        return process
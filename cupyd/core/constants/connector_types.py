@@ -0,0 +1,11 @@
+QUEUE = "queue"
+SHARED_MEMORY = "shared_memory"
+TCP = "tcp"
+DISPATCH = "dispatch"
+
+INTERPROCESS_CONNECTOR_TYPES = [
+    QUEUE,
+    SHARED_MEMORY,
+    TCP,
+    DISPATCH,
+]
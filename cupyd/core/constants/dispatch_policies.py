@@ -0,0 +1,7 @@
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+DISPATCH_POLICIES = [
+    ROUND_ROBIN,
+    LEAST_LOADED,
+]
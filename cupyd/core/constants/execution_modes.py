@@ -0,0 +1,9 @@
+AUTO = "auto"  # threads on free-threaded Python builds (without the GIL), processes otherwise
+PROCESSES = "processes"  # ETLWorkerProcesses, except for the segments run in the main process
+THREADS = "threads"  # every ETLWorker is an ETLWorkerThread of the main process
+
+EXECUTION_MODES = [
+    AUTO,
+    PROCESSES,
+    THREADS,
+]
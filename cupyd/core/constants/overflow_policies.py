@@ -0,0 +1,11 @@
+BLOCK = "block"  # wait till there is room for the bucket
+DROP_OLDEST = "drop_oldest"  # drop the oldest bucket waiting in the connector
+SAMPLE = "sample"  # drop the incoming bucket, so the node only gets a sample while overloaded
+SPILL = "spill"  # write the bucket to disk
+
+OVERFLOW_POLICIES = [
+    BLOCK,
+    DROP_OLDEST,
+    SAMPLE,
+    SPILL,
+]
@@ -0,0 +1,9 @@
+SPAWN = "spawn"  # fresh interpreter per ETLWorkerProcess, re-importing every module
+FORKSERVER = "forkserver"  # forked from a server process, which can preload modules
+FORK = "fork"  # forked from the main process, only safe while no other thread is running
+
+START_METHODS = [
+    SPAWN,
+    FORKSERVER,
+    FORK,
+]
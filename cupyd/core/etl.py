@@ -1,26 +1,72 @@
+import importlib
+import inspect
 import logging
-from collections import defaultdict
-from multiprocessing import Queue, set_start_method, get_start_method
+import os
+from ctypes import c_longlong
+from collections import defaultdict, Counter
+from copy import deepcopy
+from functools import partial
+from itertools import count
+from multiprocessing import (
+    Queue,
+    RawValue,
+    set_start_method,
+    get_start_method,
+    get_all_start_methods,
+    set_forkserver_preload,
+)
+from threading import Lock, current_thread, enumerate as enumerate_threads
 from time import time
-from typing import List, Dict, Union, Tuple
+from typing import List, Dict, Union, Tuple, Optional, Type, Any
 
+from cupyd.core.communication.broadcast_connector import group_broadcast_connectors
+from cupyd.core.communication.compression import Compressor, get_compressor
 from cupyd.core.communication.connector import (
     Connector,
     IntraProcessConnector,
     InterProcessConnector,
+    SPSCIntraProcessConnector,
+    SharedIntraProcessConnector,
 )
-from cupyd.core.communication.counter import MPCounter
-from cupyd.core.communication.event_flag import (
-    InterProcessEventFlag,
-    IntraProcessEventFlag,
-)
+from cupyd.core.communication.control_plane import ControlPlane
+from cupyd.core.communication.counter import ShardedCounter
+from cupyd.core.communication.event_flag import IntraProcessEventFlag
+from cupyd.core.communication.dispatch_connector import DispatchConnector
+from cupyd.core.communication.distributed_connector import DistributedConnector
 from cupyd.core.communication.interruption_handler import InterruptionHandler
-from cupyd.core.computing.etl_worker import ETLWorkerProcess, ETLWorkerThread
+from cupyd.core.communication.serializer import (
+    get_serializer,
+    Serializer,
+    PickleSerializer,
+    MarshalSerializer,
+)
+from cupyd.core.communication.shared_memory_connector import SharedMemoryConnector
+from cupyd.core.communication.spilling_connector import SpillingConnector
+from cupyd.core.computing.autoscaler import Autoscaler, is_autoscalable
+from cupyd.core.computing.etl_worker import ETLWorker, ETLWorkerProcess, ETLWorkerThread
+from cupyd.core.computing.runtime import ETLRuntime, PooledETLWorker
+from cupyd.core.constants.connector_types import (
+    QUEUE,
+    SHARED_MEMORY,
+    TCP,
+    DISPATCH,
+    INTERPROCESS_CONNECTOR_TYPES,
+)
+from cupyd.core.constants.execution_modes import AUTO, PROCESSES, THREADS, EXECUTION_MODES
 from cupyd.core.constants.logging import LOGGING_FORMAT_W_NODE_NAME, LOGGING_FORMAT
+from cupyd.core.constants.overflow_policies import (
+    BLOCK,
+    SPILL,
+    DROP_OLDEST,
+    SAMPLE,
+    OVERFLOW_POLICIES,
+)
 from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+from cupyd.core.constants.start_methods import SPAWN, FORK, FORKSERVER, START_METHODS
 from cupyd.core.exceptions import ETLExecutionError, InterruptedETL
 from cupyd.core.graph.algorithms import (
     get_etl_segments,
+    get_node_chains,
     topological_sort,
     assign_names_and_ids_to_nodes,
 )
@@ -35,10 +81,18 @@ from cupyd.core.nodes.filter import Filter
 from cupyd.core.nodes.transformer import Transformer
 from cupyd.core.stats.progress_thread import ProgressThread
 from cupyd.core.stats.timings_thread import TimingsThread
-from cupyd.core.utils import format_seconds, get_subdict, use_cupyd_logging_format
+from cupyd.core.utils import (
+    format_seconds,
+    get_subdict,
+    use_cupyd_logging_format,
+    is_free_threaded,
+)
 
 logger = logging.getLogger("cupyd.etl")
 
+# Nodes with an input Connector
+_ConnectedNode = Union[Transformer, Loader, Filter, Bulker, DeBulker]
+
 
 class ETL:
 
@@ -57,24 +111,56 @@ class ETL:
         progress_refresh_interval: float = 2.5,
         verbose: bool = True,
         include_node_name_in_logs: bool = True,
+        frozen_buckets: bool = False,
+        detect_bucket_mutations: bool = False,
+        autoscale: bool = False,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        runtime: Optional[ETLRuntime] = None,
+        start_method: str = SPAWN,
+        preload: Optional[List[str]] = None,
+        fuse_nodes: bool = True,
+        execution_mode: str = AUTO,
     ):
         logging_format = LOGGING_FORMAT_W_NODE_NAME if include_node_name_in_logs else LOGGING_FORMAT
 
-        start_method = get_start_method()
-        set_start_method("spawn", force=True)  # ETLWorkerProcesses will be spawned
+        execution_mode = self._get_execution_mode(execution_mode=execution_mode, runtime=runtime)
+
+        original_start_method = get_start_method()
+        if execution_mode == PROCESSES:
+            start_method = self._prepare_start_method(
+                start_method=start_method, preload=preload, autoscale=autoscale, runtime=runtime
+            )
+            set_start_method(start_method, force=True)
 
         with use_cupyd_logging_format(logging_format):
-            (
-                nodes,
-                segments_by_id,
-                stop_event,
-                pause_event,
-                interruption_handler,
-                node_timings,
-                finished_workers,
-                monitor_performance_event_by_node_id,
-                counter_by_node_id,
-            ) = self._build(num_workers=workers, monitor_performance=monitor_performance)
+            try:
+                (
+                    nodes,
+                    segments_by_id,
+                    stop_event,
+                    pause_event,
+                    interruption_handler,
+                    node_timings,
+                    finished_workers,
+                    monitor_performance_event_by_node_id,
+                    counter_by_node_id,
+                ) = self._build(
+                    num_workers=workers,
+                    monitor_performance=monitor_performance,
+                    frozen_buckets=frozen_buckets,
+                    detect_bucket_mutations=detect_bucket_mutations,
+                    autoscale=autoscale,
+                    min_workers=min_workers,
+                    max_workers=max_workers,
+                    runtime=runtime,
+                    fuse_nodes=fuse_nodes,
+                    execution_mode=execution_mode,
+                )
+            except Exception:
+                # the ETL couldn't be built (& nothing was started), leave the start method as is
+                set_start_method(original_start_method, force=True)
+                raise
 
             if verbose:
                 logger.info("ETL build successful, running ETL...")
@@ -85,6 +171,18 @@ class ETL:
             # this will handle interruptions in this main process (and the ETLWorkerThreads)
             interruption_handler.start()
 
+            # start all ETLWorkers, the processes first: if they are forked, no other thread of
+            # the ETL is running yet
+            etl_workers = [
+                worker
+                for segment in segments_by_id.values()
+                for worker in segment.workers_by_id.values()
+            ]
+            for worker in sorted(
+                etl_workers, key=lambda worker_: isinstance(worker_, ETLWorkerThread)
+            ):
+                worker.start()
+
             if monitor_performance:
                 timings_thread = TimingsThread(
                     nodes=nodes, node_timings=node_timings, stop_event=stop_event
@@ -106,11 +204,6 @@ class ETL:
             else:
                 progress_thread, finalize_event = None, None
 
-            # start all ETLWorkers
-            for segment in segments_by_id.values():
-                for worker in segment.workers_by_id.values():
-                    worker.start()
-
             # auxiliary structures to easily access segment resources
             active_worker_ids_by_segment_id = {}
             workers_by_id = {}
@@ -121,13 +214,48 @@ class ETL:
                 for worker_id, worker in segment.workers_by_id.items():
                     workers_by_id[worker_id] = worker
 
+            # the Autoscaler spawns & retires ETLWorkers of the autoscaled segments, while the
+            # finished ETLWorkers are handled with the lock held
+            workers_lock = Lock()
+            if autoscale:
+                autoscaler_finalize_event = IntraProcessEventFlag()
+                autoscaler = Autoscaler(
+                    segments=list(segments_by_id.values()),
+                    active_worker_ids_by_segment_id=active_worker_ids_by_segment_id,
+                    workers_by_id=workers_by_id,
+                    lock=workers_lock,
+                    stop_event=stop_event,
+                    finalize_event=autoscaler_finalize_event,
+                )
+                autoscaler.start()
+            else:
+                autoscaler, autoscaler_finalize_event = None, None
+
             if verbose:
-                logger.info(f"ETL startup time: {round(time() - start_time, 4)} seconds")
+                startup_mode = start_method if execution_mode == PROCESSES else THREADS
+                startup_msg = (
+                    f"ETL startup time ({startup_mode}): {round(time() - start_time, 4)} seconds"
+                )
+                num_pooled_workers = sum(
+                    isinstance(worker, PooledETLWorker) for worker in workers_by_id.values()
+                )
+                if num_pooled_workers:
+                    # every ETLWorkerProcess would have taken about the spawn time of the warm
+                    # processes to be ready
+                    startup_msg += (
+                        f" | {num_pooled_workers} ETLWorkers run by warm processes, saving "
+                        f"~{round(runtime.spawn_time, 4)} seconds of spawn time"  # type: ignore
+                    )
+                logger.info(startup_msg)
 
             # run until all ETLSegments are finished
             while active_worker_ids_by_segment_id:
                 try:
                     worker_id, segment_id, exception_by_node_id = finished_workers.get()
+                except InterruptedError:
+                    continue
+
+                with workers_lock:
                     workers_by_id[worker_id].join()
                     active_worker_ids_by_segment_id[segment_id].remove(worker_id)
 
@@ -140,13 +268,15 @@ class ETL:
                     if not active_worker_ids_by_segment_id[segment_id]:
                         active_worker_ids_by_segment_id.pop(segment_id)
 
-                        for output_segment_num_workers, connector in segments_by_id[
+                        for output_segment, connector in segments_by_id[
                             segment_id
                         ].output_interprocess_connectors:
-                            for _ in range(output_segment_num_workers):
-                                connector.produce(NO_MORE_ITEMS)
-                except InterruptedError:
-                    continue
+                            output_segment.input_finished = True
+                            connector.finish_producing(num_consumers=output_segment.num_workers)
+
+            if autoscale:
+                autoscaler_finalize_event.set()
+                autoscaler.join()
 
             # stop the TimingsThread & ProgressThread, if running
             if monitor_performance:
@@ -165,7 +295,7 @@ class ETL:
             elapsed_time = format_seconds(time() - start_time)
 
             # restore multiprocessing start method & the previous signal handlers
-            set_start_method(start_method, force=True)
+            set_start_method(original_start_method, force=True)
             interruption_handler.restore_handlers()
 
             if exceptions_by_node_id:
@@ -192,7 +322,92 @@ class ETL:
                 for exceptions in exceptions_by_node_id.values():
                     raise ETLExecutionError(exceptions[0].traceback_formatted)
 
-    def _build(self, num_workers: int, monitor_performance: bool):
+    @staticmethod
+    def _get_execution_mode(execution_mode: str, runtime: Optional[ETLRuntime]) -> str:
+        """Return whether the ETLWorkers run as processes or as threads of the main process.
+
+        Without the GIL, threads run Python code in parallel, so the ETLWorkerProcesses would
+        only add their spawn time & the serialization of every bucket.
+        """
+
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(f'Invalid "execution_mode": {execution_mode}')
+
+        if execution_mode == AUTO:
+            execution_mode = THREADS if is_free_threaded() and not runtime else PROCESSES
+        elif execution_mode == THREADS and runtime:
+            raise ValueError(f'An ETLRuntime requires the "{PROCESSES}" execution mode')
+
+        return execution_mode
+
+    def _prepare_start_method(
+        self,
+        start_method: str,
+        preload: Optional[List[str]],
+        autoscale: bool,
+        runtime: Optional[ETLRuntime],
+    ) -> str:
+        """Return the start method of the ETLWorkerProcesses, once its modules are preloaded.
+
+        Forking is only safe while no other thread runs in the main process, since a thread
+        could be holding a lock the forked process would inherit. If it isn't, "spawn" is used.
+        """
+
+        if start_method not in START_METHODS or start_method not in get_all_start_methods():
+            raise ValueError(f'Invalid "start_method": {start_method}')
+
+        if start_method == FORK:
+            if runtime:
+                raise ValueError('An ETLRuntime requires the "spawn" or "forkserver" start method')
+
+            # the feeder threads of multiprocessing Queues (e.g. left by a previous ETL) only hold
+            # the locks of their own Queue, so they are harmless
+            hazards = [
+                f'thread "{thread.name}" running'
+                for thread in enumerate_threads()
+                if thread is not current_thread() and thread.name != "QueueFeederThread"
+            ]
+            if autoscale:
+                hazards.append("ETLWorkerProcesses started by the Autoscaler thread")
+            nodes, _ = topological_sort(root_node=self.extractor)
+            if any(
+                isinstance(node, (Transformer, Loader, Filter, Bulker, DeBulker))
+                and node.configuration.interprocess_connector == TCP
+                for node in nodes
+            ):
+                hazards.append('"tcp" connectors running a broker thread')
+
+            if hazards:
+                logger.warning(
+                    f'"fork" start method is unsafe ({", ".join(hazards)}), using "spawn"'
+                )
+                start_method = SPAWN
+
+        if preload:
+            if start_method == FORKSERVER:
+                # only used when the forkserver is started, by the first ETL with this method
+                set_forkserver_preload(preload)
+            elif start_method == FORK:
+                for module_name in preload:
+                    importlib.import_module(module_name)
+            else:
+                logger.warning(f'"preload" ignored with the "{start_method}" start method')
+
+        return start_method
+
+    def _build(
+        self,
+        num_workers: int,
+        monitor_performance: bool,
+        frozen_buckets: bool = False,
+        detect_bucket_mutations: bool = False,
+        autoscale: bool = False,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        runtime: Optional[ETLRuntime] = None,
+        fuse_nodes: bool = True,
+        execution_mode: str = PROCESSES,
+    ):
         """Build the ETL."""
 
         # 1. List all nodes & edges & ensure the ETL is a DAG
@@ -205,14 +420,165 @@ class ETL:
         # consecutive nodes that will run on the same ETLWorker
         segments = get_etl_segments(nodes=nodes, num_workers=num_workers)
 
+        # chains of nodes inside a segment run on a single thread, without connectors between them
+        for segment in segments:
+            if fuse_nodes:
+                segment.node_chains = get_node_chains(segment)
+            else:
+                segment.node_chains = [[node] for node in segment.nodes]
+
+            for chain in segment.node_chains:
+                if len(chain) > 1:
+                    logger.info(f"Nodes fused: {' >> '.join(node.name for node in chain)}")
+
+        fused_node_ids = {
+            node.id for segment in segments for chain in segment.node_chains for node in chain[1:]
+        }
+
+        # autoscaled segments start with num_workers ETLWorkers (within the bounds), and
+        # everything shared by their ETLWorkers is sized for max_workers
+        if autoscale:
+            max_workers = max(max_workers or os.cpu_count() or 1, min_workers)
+            if min_workers < 1:
+                raise ValueError(f'Invalid "min_workers": {min_workers}')
+
+            for segment in segments:
+                if is_autoscalable(segment):
+                    segment.min_workers = min_workers
+                    segment.max_workers = max_workers
+                    segment.num_workers = min(max(segment.num_workers, min_workers), max_workers)
+
+        for node in nodes:
+            if (
+                isinstance(node, (Transformer, Filter, Loader))
+                and node.configuration.concurrency < 1
+            ):
+                raise ValueError(
+                    f'Invalid "concurrency" for Node {node}: {node.configuration.concurrency}'
+                )
+
+            # bucket-level methods are called by the worker thread, they'd never be awaited
+            for method_name in (
+                "extract_buckets",
+                "transform_bucket",
+                "filter_bucket",
+                "load_bucket",
+            ):
+                method = getattr(node, method_name, None)
+                if inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method):
+                    raise TypeError(f"{method_name}() of Node {node} can't be async")
+
+        # Ordered nodes receive the buckets in the same order they were extracted. Every bucket
+        # carries its sequence number, so no node upstream can change the number of buckets, nor
+        # drop them (the ordered node would wait forever for a missing sequence number)
+        ordered_nodes: List[Union[Transformer, Filter, Loader]] = [
+            node
+            for node in nodes
+            if isinstance(node, (Transformer, Filter, Loader)) and node.configuration.ordered
+        ]
+
+        for node in ordered_nodes:
+            ascendant: Optional[Node] = node
+            while ascendant:
+                if ascendant is not node and isinstance(ascendant, (Bulker, DeBulker)):
+                    raise ValueError(
+                        f"Ordered Node {node} can't be downstream of a Bulker or DeBulker"
+                    )
+                # the Extractor has no input edge, so no overflow policy
+                if isinstance(ascendant, (Transformer, Loader, Filter, Bulker, DeBulker)):
+                    overflow_policy = ascendant.configuration.overflow_policy
+                    if overflow_policy in (DROP_OLDEST, SAMPLE):
+                        raise ValueError(
+                            f"Ordered Node {node} can't receive buckets through an edge with the "
+                            f'"{overflow_policy}" overflow policy'
+                        )
+                ascendant = ascendant.input
+
+        # next bucket (sequence number) every ordered node is waiting for
+        sequence_progress_by_node_id: Dict[str, c_longlong] = {
+            node.id: RawValue(c_longlong, 0) for node in ordered_nodes
+        }
+        reorder_window = min(
+            (node.configuration.reorder_buffer_size for node in ordered_nodes), default=0
+        )
+
         # 4. Create the ETL connectors
         input_connector_by_node_id: Dict[str, Connector] = {}
         output_connectors_by_node_id: Dict[str, List[Connector]] = defaultdict(list)
 
+        segment_id_by_node_id = {
+            node_id: segment.id for segment in segments for node_id in segment.node_ids
+        }
+        num_interprocess_outputs_by_node_id = Counter(
+            edge.origin.id
+            for edge in edges
+            if segment_id_by_node_id[edge.origin.id] != segment_id_by_node_id[edge.target.id]
+        )
+
+        # every edge is validated before creating any connector, so none is left started (shared
+        # memory, broker threads, spill directories...) when the ETL can't be built
+        connected_edges: List[Tuple[Node, _ConnectedNode]] = []
+        serializer_by_node_id: Dict[str, Optional[Serializer]] = {}
+        compressor_by_node_id: Dict[str, Optional[Compressor]] = {}
+
         for edge in edges:
-            origin: Node = edge.origin
-            target: Node = edge.target
+            origin, target = edge.origin, edge.target
+
+            # fused nodes get their buckets straight from the previous node of their chain
+            if target.id in fused_node_ids:
+                continue
+
+            if not isinstance(target, (Transformer, Loader, Filter, Bulker, DeBulker)):
+                raise AttributeError('No "queue_max_size" attr in connected Node!')
+
+            interprocess_connector = target.configuration.interprocess_connector
+            overflow_policy = target.configuration.overflow_policy
+            serializer = get_serializer(target.configuration.serializer)
+            compressor = get_compressor(target.configuration.compression)
+            between_processes = (
+                segment_id_by_node_id[origin.id] != segment_id_by_node_id[target.id]
+                and execution_mode == PROCESSES
+            )
+
+            if overflow_policy not in OVERFLOW_POLICIES:
+                raise ValueError(f'Invalid "overflow_policy" for Node {target}: {overflow_policy}')
+
+            if between_processes and interprocess_connector not in INTERPROCESS_CONNECTOR_TYPES:
+                raise ValueError(
+                    f'Invalid "interprocess_connector" for Node {target}: {interprocess_connector}'
+                )
+
+            # FrozenDicts are dict subclasses, which marshal can't dump
+            if frozen_buckets and isinstance(serializer, MarshalSerializer) and between_processes:
+                raise ValueError(
+                    f'Node {target} with "marshal" serializer can\'t receive frozen buckets'
+                )
+
+            if (
+                overflow_policy not in (BLOCK, SPILL)
+                and between_processes
+                and interprocess_connector not in (QUEUE, DISPATCH)
+            ):
+                raise ValueError(
+                    f'Node {target} with "{overflow_policy}" overflow policy requires the "queue" '
+                    f'or "dispatch" "interprocess_connector"'
+                )
+
+            if overflow_policy == SPILL and between_processes and interprocess_connector != QUEUE:
+                raise ValueError(
+                    f'Node {target} with "spill" overflow policy requires the "queue" '
+                    f'"interprocess_connector"'
+                )
+
+            # buckets sent to several processes are serialized only once, before the Connectors
+            if num_interprocess_outputs_by_node_id[origin.id] > 1:
+                serializer = serializer or PickleSerializer()
+
+            connected_edges.append((origin, target))
+            serializer_by_node_id[target.id] = serializer
+            compressor_by_node_id[target.id] = compressor
 
+        for origin, target in connected_edges:
             origin_segment = None
             target_segment = None
 
@@ -224,68 +590,197 @@ class ETL:
 
             connector: Union[IntraProcessConnector, InterProcessConnector]
 
-            if isinstance(target, (Transformer, Loader, Filter, Bulker, DeBulker)):
-                queue_max_size = target.configuration.queue_max_size
+            queue_max_size = target.configuration.queue_max_size
+            queue_max_bytes = target.configuration.queue_max_bytes
+            interprocess_connector = target.configuration.interprocess_connector
+            overflow_policy = target.configuration.overflow_policy
+            serializer = serializer_by_node_id[target.id]
+            compressor = compressor_by_node_id[target.id]
+
+            if origin_segment.id == target_segment.id or execution_mode == THREADS:
+                if origin_segment.id == target_segment.id:
+                    # inside an ETLWorker, every edge links the thread of a single Node to the
+                    # thread of another one, so it always has a single producer & consumer
+                    connector = SPSCIntraProcessConnector(
+                        maxsize=queue_max_size, max_bytes=queue_max_bytes
+                    )
+                else:
+                    # between the ETLWorkerThreads of two segments, buckets aren't serialized
+                    connector = SharedIntraProcessConnector(
+                        maxsize=queue_max_size, max_bytes=queue_max_bytes
+                    )
+                    connector.start()
+                if overflow_policy == SPILL:
+                    logger.warning(
+                        f'"spill" overflow policy of Node {target} ignored: only applies to '
+                        f"edges between processes"
+                    )
+                    overflow_policy = BLOCK
+            elif overflow_policy == SPILL:
+                connector = SpillingConnector(
+                    maxsize=queue_max_size,
+                    num_consumers=target_segment.num_workers,
+                    serializer=serializer,
+                    compressor=compressor,
+                    spill_directory=target.configuration.spill_directory,
+                    max_bytes=queue_max_bytes,
+                )
+                connector.start()
+            elif interprocess_connector == QUEUE:
+                connector = InterProcessConnector(
+                    maxsize=queue_max_size,
+                    serializer=serializer,
+                    compressor=compressor,
+                    max_bytes=queue_max_bytes,
+                )
+                connector.start()
+            elif interprocess_connector == SHARED_MEMORY:
+                connector = SharedMemoryConnector(
+                    maxsize=queue_max_size,
+                    num_producers=origin_segment.max_workers or origin_segment.num_workers,
+                    num_consumers=target_segment.num_workers,
+                    serializer=serializer,
+                    compressor=compressor,
+                    max_bytes=queue_max_bytes,
+                )
+                connector.start()
+            elif interprocess_connector == TCP:
+                connector = DistributedConnector(
+                    maxsize=queue_max_size,
+                    serializer=serializer,
+                    compressor=compressor,
+                    max_bytes=queue_max_bytes,
+                )
+                connector.start()
+            elif interprocess_connector == DISPATCH:
+                connector = DispatchConnector(
+                    maxsize=queue_max_size,
+                    num_consumers=target_segment.num_workers,
+                    policy=target.configuration.dispatch_policy,
+                    serializer=serializer,
+                    compressor=compressor,
+                    max_bytes=queue_max_bytes,
+                )
+                connector.start()
             else:
-                raise AttributeError('No "queue_max_size" attr in connected Node!')
+                raise ValueError(
+                    f'Invalid "interprocess_connector" for Node {target}: {interprocess_connector}'
+                )
 
-            if origin_segment.id == target_segment.id:
-                connector = IntraProcessConnector(maxsize=queue_max_size)
-            else:
-                connector = InterProcessConnector(maxsize=queue_max_size)
-                connector.start()
+            if overflow_policy != SPILL:
+                connector.overflow_policy = overflow_policy
 
             input_connector_by_node_id[target.id] = connector
+            if target_segment.nodes[0] is target:
+                target_segment.input_connector = connector
             output_connectors_by_node_id[origin.id].append(connector)
 
-            if isinstance(connector, InterProcessConnector):
-                origin_segment.output_interprocess_connectors.append(
-                    (target_segment.num_workers, connector)
-                )
+            if isinstance(connector, (InterProcessConnector, SharedIntraProcessConnector)):
+                origin_segment.output_interprocess_connectors.append((target_segment, connector))
+
+        # buckets sent to several processes with the same Serializer are grouped into a single
+        # BroadcastConnector, so they are serialized only once
+        for node_id, connectors in output_connectors_by_node_id.items():
+            output_connectors_by_node_id[node_id] = group_broadcast_connectors(connectors)
 
         # 5. Create necessary structures & ETL Workers
         finished_workers: Queue[Tuple[str, str, Dict[str, NodeException]]] = Queue()
         node_timings: Queue[Tuple[str, float]] = Queue(maxsize=25_000)
-        stop_event = InterProcessEventFlag()
-        pause_event = InterProcessEventFlag()
+        # stop, pause & monitoring flags, readable by every process without any syscall
+        control_plane = ControlPlane(num_nodes=len(nodes))
+        stop_event = control_plane.stop_flag
+        pause_event = control_plane.pause_flag
         interruption_handler = InterruptionHandler(stop_event=stop_event)
-        counter_by_node_id: Dict[str, MPCounter] = {
-            node.id: MPCounter() for node in nodes if isinstance(node, Loader) and not node.outputs
+        # items in & out of every Node, with a shard per ETLWorker running it
+        counter_by_node_id: Dict[str, ShardedCounter] = {
+            node.id: ShardedCounter(num_shards=segment.max_workers or segment.num_workers)
+            for segment in segments
+            for node in segment.nodes
         }
         monitor_performance_event_by_node_id = {
-            node.id: InterProcessEventFlag(start_set=monitor_performance) for node in nodes
+            node.id: control_plane.get_node_flag(index) for index, node in enumerate(nodes)
         }
+        if monitor_performance:
+            for monitor_performance_event in monitor_performance_event_by_node_id.values():
+                monitor_performance_event.set()
+
         segments_by_id: Dict[str, ETLSegment] = {}
-        etl_worker_num = 1
+        etl_worker_nums = count(1)
+
+        def create_worker(
+            segment: ETLSegment, worker_index: int
+        ) -> Union[ETLWorkerThread, ETLWorkerProcess, PooledETLWorker]:
+            nodes_, node_chains = segment.nodes, segment.node_chains
+            input_connectors = get_subdict(
+                dictionary=input_connector_by_node_id, keys=segment.node_ids
+            )
+            output_connectors = get_subdict(
+                dictionary=output_connectors_by_node_id, keys=segment.node_ids
+            )
+
+            if segment.run_in_main_process:
+                worker_class: Type[ETLWorker] = ETLWorkerThread
+            elif execution_mode == THREADS:
+                worker_class = ETLWorkerThread
+                # like every ETLWorkerProcess unpickles its own nodes & the connectors between
+                # them, every ETLWorkerThread gets a copy of them, so neither the state of a node
+                # nor a single producer & consumer connector is shared by several threads. The
+                # connectors to other segments are shared by all of them
+                shared_connectors = [
+                    connector
+                    for connector in [
+                        *input_connectors.values(),
+                        *(c for connectors in output_connectors.values() for c in connectors),
+                    ]
+                    if not isinstance(connector, SPSCIntraProcessConnector)
+                ]
+                memo: Dict[int, Any] = {id(connector): connector for connector in shared_connectors}
+                nodes_ = deepcopy(segment.nodes, memo)
+                node_chains = deepcopy(segment.node_chains, memo)
+                input_connectors = deepcopy(input_connectors, memo)
+                output_connectors = deepcopy(output_connectors, memo)
+            elif runtime:
+                worker_class = ETLWorker  # run by a WarmProcess of the runtime
+            else:
+                worker_class = ETLWorkerProcess
+
+            worker = worker_class(
+                worker_id=f"etl_worker_{next(etl_worker_nums)}",
+                segment_id=segment.id,
+                nodes=nodes_,
+                counters={
+                    node.id: counter_by_node_id[node.id].get_shard(worker_index)
+                    for node in segment.nodes
+                },
+                input_connector_by_node_id=input_connectors,
+                output_connectors_by_node_id=output_connectors,
+                monitor_performance_event_by_node_id=get_subdict(
+                    dictionary=monitor_performance_event_by_node_id,
+                    keys=segment.node_ids,
+                ),
+                stop_event=stop_event,
+                pause_event=pause_event,
+                interruption_handler=interruption_handler,
+                node_timings=node_timings,
+                finished_workers=finished_workers,
+                worker_index=worker_index,
+                frozen_buckets=frozen_buckets,
+                detect_bucket_mutations=detect_bucket_mutations,
+                sequence_progress_by_node_id=sequence_progress_by_node_id,
+                reorder_window=reorder_window,
+                node_chains=node_chains,
+            )
+
+            if worker_class is ETLWorker:
+                return PooledETLWorker(worker=worker, runtime=runtime)  # type: ignore
+            return worker  # type: ignore
 
         for segment in segments:
-            worker_class = ETLWorkerThread if segment.run_in_main_process else ETLWorkerProcess
-
-            for _ in range(segment.num_workers):
-                etl_worker_id = f"etl_worker_{etl_worker_num}"
-                etl_worker = worker_class(
-                    worker_id=etl_worker_id,
-                    segment_id=segment.id,
-                    nodes=segment.nodes,
-                    counters=get_subdict(dictionary=counter_by_node_id, keys=segment.node_ids),
-                    input_connector_by_node_id=get_subdict(
-                        dictionary=input_connector_by_node_id, keys=segment.node_ids
-                    ),
-                    output_connectors_by_node_id=get_subdict(
-                        dictionary=output_connectors_by_node_id, keys=segment.node_ids
-                    ),
-                    monitor_performance_event_by_node_id=get_subdict(
-                        dictionary=monitor_performance_event_by_node_id,
-                        keys=segment.node_ids,
-                    ),
-                    stop_event=stop_event,
-                    pause_event=pause_event,
-                    interruption_handler=interruption_handler,
-                    node_timings=node_timings,
-                    finished_workers=finished_workers,
-                )
-                segment.workers_by_id[etl_worker_id] = etl_worker  # type: ignore
-                etl_worker_num += 1
+            segment.worker_factory = partial(create_worker, segment)
+
+            for worker_index in range(segment.num_workers):
+                etl_worker = segment.worker_factory(worker_index)
+                segment.workers_by_id[etl_worker.worker_id] = etl_worker  # type: ignore
 
             segments_by_id[segment.id] = segment
 
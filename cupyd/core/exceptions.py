@@ -24,3 +24,7 @@ class ETLExecutionError(Exception):
 
 class InterruptedETL(Exception):
     pass
+
+
+class BucketMutationError(Exception):
+    pass
@@ -0,0 +1,57 @@
+import hashlib
+import pickle
+from typing import Any, NoReturn
+
+
+class FrozenDict(dict):
+    """Read-only dict. Unlike MappingProxyType, it can be pickled & sent to other processes."""
+
+    def _readonly(self, *args, **kwargs) -> NoReturn:
+        raise TypeError("Cannot modify a frozen item. Copy it before modifying it.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly  # type: ignore
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        # the default dict subclass pickling would call the (disabled) __setitem__ when loading
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenDict":
+        return self
+
+
+def freeze(obj: Any) -> Any:
+    """Return a read-only version of a Python object, recursively.
+
+    Dicts are turned into FrozenDicts, lists & tuples into tuples, sets into frozensets and
+    bytearrays into bytes. Any other object is returned as it is, so the instances of custom
+    classes can't be protected (see detect_bucket_mutations from ETL.run for those).
+    """
+
+    if isinstance(obj, (str, bytes, int, float, bool, FrozenDict)) or obj is None:
+        return obj
+    elif isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        return tuple(freeze(value) for value in obj)
+    elif isinstance(obj, (set, frozenset)):
+        return frozenset(freeze(value) for value in obj)
+    elif isinstance(obj, bytearray):
+        return bytes(obj)
+    else:
+        return obj
+
+
+def fingerprint(obj: Any) -> bytes:
+    """Digest of the pickled object, used to detect if it was modified."""
+
+    return hashlib.blake2b(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)).digest()
@@ -3,10 +3,19 @@ from collections import defaultdict
 from itertools import groupby
 from typing import List, Tuple
 
+from cupyd.core.constants.overflow_policies import BLOCK
 from cupyd.core.graph.classes import Node, Edge
 from cupyd.core.models.etl_segment import ETLSegment
-from cupyd.core.nodes import Extractor, Transformer, Loader, Filter, Bulker, DeBulker
-
+from cupyd.core.nodes import (
+    Extractor,
+    Transformer,
+    Loader,
+    Filter,
+    Bulker,
+    DeBulker,
+    AsyncTransformer,
+    AsyncLoader,
+)
 
 # PUBLIC FUNCTIONS
 
@@ -47,17 +56,34 @@ def assign_names_and_ids_to_nodes(nodes: List[Node]) -> None:
 
 
 def get_etl_segments(nodes: List[Node], num_workers: int) -> List[ETLSegment]:
+    """Group the Nodes into ETLSegments.
+
+    num_workers is the number of ETLWorkers of each segment, unless its Nodes set their own
+    "workers" configuration (Nodes with different numbers of workers never share a segment).
+    """
+
     segments = []
     segment_num = 1
 
+    groups = []
+
+    # ordered nodes need a single ETLWorker to process all the buckets in order, so they can't
+    # share their segment with the nodes running on several ETLWorkers
     for group in _split_nodes_by_attr(nodes=nodes, attr_name="run_in_main_process"):
+        if group[0].configuration.run_in_main_process:  # type: ignore
+            groups.append(group)
+        else:
+            for group_ in _split_nodes_by_attr(nodes=group, attr_name="ordered", default=False):
+                groups.extend(_split_nodes_by_num_workers(nodes=group_, num_workers=num_workers))
+
+    for group in groups:
         for group_ in _split_nodes_if_not_consecutive(nodes=group):
             run_in_main_process = group_[0].configuration.run_in_main_process  # type: ignore
 
-            if run_in_main_process or isinstance(group_[0], Extractor):
+            if run_in_main_process:
                 segment_num_workers = 1
             else:
-                segment_num_workers = num_workers
+                segment_num_workers = _get_num_workers(node=group_[0], num_workers=num_workers)
 
             segments.append(
                 ETLSegment(
@@ -73,9 +99,50 @@ def get_etl_segments(nodes: List[Node], num_workers: int) -> List[ETLSegment]:
     return segments
 
 
+def get_node_chains(segment: ETLSegment) -> List[List[Node]]:
+    """Group the Nodes of a segment into chains, each one run by a single thread (fused).
+
+    A Node joins the chain of its input when both are (non-async) Transformers, Filters or
+    Loaders and the input has no other output, unless the Node needs a connector of its own: it's
+    ordered, or its overflow policy isn't "block".
+    """
+
+    chains: List[List[Node]] = []
+    chain_by_node_id: typing.Dict[str, List[Node]] = {}
+
+    # the nodes of a segment are topologically sorted, so the input of a node comes first
+    for node in segment.nodes:
+        chain = chain_by_node_id.get(node.input.id) if node.input else None
+
+        if chain is not None and _can_be_fused(origin=node.input, target=node):
+            chain.append(node)
+        else:
+            chain = [node]
+            chains.append(chain)
+
+        chain_by_node_id[node.id] = chain
+
+    return chains
+
+
 # PROTECTED FUNCTIONS
 
 
+def _can_be_fused(origin: Node, target: Node) -> bool:
+    fusable_types = (Transformer, Filter, Loader)
+    async_types = (AsyncTransformer, AsyncLoader)
+
+    return (
+        isinstance(origin, fusable_types)
+        and isinstance(target, fusable_types)
+        and not isinstance(origin, async_types)
+        and not isinstance(target, async_types)
+        and len(origin.outputs) == 1
+        and not _get_node_attr(target, attr_name="ordered", default=False)
+        and _get_node_attr(target, attr_name="overflow_policy") == BLOCK
+    )
+
+
 def _downstream_discovery(
     node: Node, nodes: List[Node], edges: List[Edge]
 ) -> Tuple[List[Node], List[Edge]]:
@@ -100,14 +167,16 @@ def _downstream_discovery(
     return nodes, edges
 
 
-def _split_nodes_by_attr(nodes: List[Node], attr_name: str) -> List[List[Node]]:
+def _split_nodes_by_attr(
+    nodes: List[Node], attr_name: str, default: typing.Any = None
+) -> List[List[Node]]:
     """This function will split Nodes based on equality of a selected Node attribute."""
 
     groups = [
         list(g)
         for _, g in groupby(
-            sorted(nodes, key=lambda x: _get_node_attr(x, attr_name)),
-            key=lambda x: _get_node_attr(x, attr_name),
+            sorted(nodes, key=lambda x: _get_node_attr(x, attr_name, default)),
+            key=lambda x: _get_node_attr(x, attr_name, default),
         )
     ]
     return groups
@@ -193,6 +262,25 @@ def _split_nodes_if_not_consecutive(nodes: List[Node]) -> List[List[Node]]:
     return groups
 
 
+def _get_num_workers(node: Node, num_workers: int) -> int:
+    """Number of ETLWorkers a Node runs on, if it doesn't run in the main process."""
+
+    if isinstance(node, Extractor) or _get_node_attr(node, attr_name="ordered", default=False):
+        return 1
+
+    node_num_workers = _get_node_attr(node, attr_name="workers") or num_workers
+    if node_num_workers < 1:
+        raise ValueError(f'Invalid "workers" for Node {node}: {node_num_workers}')
+    return node_num_workers
+
+
+def _split_nodes_by_num_workers(nodes: List[Node], num_workers: int) -> List[List[Node]]:
+    def get_num_workers(node: Node) -> int:
+        return _get_num_workers(node=node, num_workers=num_workers)
+
+    return [list(g) for _, g in groupby(sorted(nodes, key=get_num_workers), key=get_num_workers)]
+
+
 def _get_node_attr(
     node: typing.Union[Node, Extractor, Transformer, Loader, Filter, Bulker, DeBulker],
     attr_name: str,
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List, Set, Union, Dict, Tuple
+from typing import List, Set, Union, Dict, Tuple, Optional, Callable
 
-from cupyd.core.communication import InterProcessConnector
+from cupyd.core.communication import Connector
 from cupyd.core.computing.etl_worker import ETLWorkerThread, ETLWorkerProcess
+from cupyd.core.computing.runtime import PooledETLWorker
 from cupyd.core.graph.classes import Node
 
 
@@ -14,11 +15,26 @@ class ETLSegment:
     run_in_main_process: bool
     num_workers: int
 
+    # nodes of each chain are run by a single thread (fused), the rest by a thread per node
+    node_chains: List[List[Node]] = field(default_factory=lambda: [])
+
+    # only set for autoscaled segments, whose num_workers changes while the ETL runs
+    min_workers: Optional[int] = None
+    max_workers: Optional[int] = None
+
     # these will be filled when building the ETL
-    workers_by_id: Dict[str, Union[ETLWorkerThread, ETLWorkerProcess]] = field(
+    workers_by_id: Dict[str, Union[ETLWorkerThread, ETLWorkerProcess, PooledETLWorker]] = field(
         default_factory=lambda: dict()
     )
-    # first tuple element is the amount of ETLWorkers that are consuming from the Connector
-    output_interprocess_connectors: List[Tuple[int, InterProcessConnector]] = field(
+    # first tuple element is the segment whose ETLWorkers are consuming from the Connector
+    output_interprocess_connectors: List[Tuple["ETLSegment", Connector]] = field(
         default_factory=lambda: []
     )
+    input_connector: Optional[Connector] = None
+    # creates a new ETLWorker of the segment, given its index
+    worker_factory: Optional[
+        Callable[[int], Union[ETLWorkerThread, ETLWorkerProcess, PooledETLWorker]]
+    ] = None
+
+    # set once every Node upstream has finished (and a NO_MORE_ITEMS was produced per ETLWorker)
+    input_finished: bool = False
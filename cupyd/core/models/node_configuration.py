@@ -1,24 +1,56 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+from cupyd.core.communication.serializer import Serializer
+from cupyd.core.constants.connector_types import QUEUE
+from cupyd.core.constants.dispatch_policies import ROUND_ROBIN
+from cupyd.core.constants.overflow_policies import BLOCK
 
 # max number of items that can be stored in a bucket
 DEFAULT_BUCKET_SIZE = 100
 
+# window of bucket sizes & seconds per bucket targeted by Extractors with adaptive bucket size
+DEFAULT_MIN_BUCKET_SIZE = 1
+DEFAULT_MAX_BUCKET_SIZE = 10_000
+DEFAULT_TARGET_BUCKET_LATENCY = 0.05
+
 # max number of buckets that can be stored in a queue
 DEFAULT_QUEUE_MAX_SIZE = 500
 
+# max number of buckets waiting in the reorder buffer of an ordered node
+DEFAULT_REORDER_BUFFER_SIZE = 100
+
+# max number of items of a bucket awaited at once by the async nodes
+DEFAULT_ASYNC_CONCURRENCY = 100
+
 
 @dataclass
 class ExtractorConfiguration:
     bucket_size: int = DEFAULT_BUCKET_SIZE
     run_in_main_process: bool = True
+    adaptive_bucket_size: bool = False
+    min_bucket_size: int = DEFAULT_MIN_BUCKET_SIZE
+    max_bucket_size: int = DEFAULT_MAX_BUCKET_SIZE
+    max_bucket_bytes: Optional[int] = None
+    target_bucket_latency: float = DEFAULT_TARGET_BUCKET_LATENCY
 
 
 @dataclass
 class TransformerConfiguration:
     input_key: str = None
     run_in_main_process: bool = False
+    workers: Optional[int] = None
     queue_max_size: Optional[int] = DEFAULT_QUEUE_MAX_SIZE
+    queue_max_bytes: Optional[int] = None
+    overflow_policy: str = BLOCK
+    spill_directory: Optional[str] = None
+    interprocess_connector: str = QUEUE
+    dispatch_policy: str = ROUND_ROBIN
+    serializer: Union[str, Serializer, None] = None
+    compression: Optional[str] = None
+    ordered: bool = False
+    reorder_buffer_size: int = DEFAULT_REORDER_BUFFER_SIZE
+    concurrency: int = 1
 
 
 @dataclass
@@ -27,7 +59,18 @@ class FilterConfiguration:
     value_to_filter: Any = None
     disable_safe_copy: bool = False
     run_in_main_process: bool = False
+    workers: Optional[int] = None
     queue_max_size: Optional[int] = DEFAULT_QUEUE_MAX_SIZE
+    queue_max_bytes: Optional[int] = None
+    overflow_policy: str = BLOCK
+    spill_directory: Optional[str] = None
+    interprocess_connector: str = QUEUE
+    dispatch_policy: str = ROUND_ROBIN
+    serializer: Union[str, Serializer, None] = None
+    compression: Optional[str] = None
+    ordered: bool = False
+    reorder_buffer_size: int = DEFAULT_REORDER_BUFFER_SIZE
+    concurrency: int = 1
 
 
 @dataclass
@@ -35,15 +78,42 @@ class LoaderConfiguration:
     input_key: str = None
     disable_safe_copy: bool = False
     run_in_main_process: bool = False
+    workers: Optional[int] = None
     queue_max_size: Optional[int] = DEFAULT_QUEUE_MAX_SIZE
+    queue_max_bytes: Optional[int] = None
+    overflow_policy: str = BLOCK
+    spill_directory: Optional[str] = None
+    interprocess_connector: str = QUEUE
+    dispatch_policy: str = ROUND_ROBIN
+    serializer: Union[str, Serializer, None] = None
+    compression: Optional[str] = None
+    ordered: bool = False
+    reorder_buffer_size: int = DEFAULT_REORDER_BUFFER_SIZE
+    concurrency: int = 1
 
 
 @dataclass
 class BulkerConfiguration:
     run_in_main_process: bool = False
+    workers: Optional[int] = None
     queue_max_size: Optional[int] = DEFAULT_QUEUE_MAX_SIZE
+    queue_max_bytes: Optional[int] = None
+    overflow_policy: str = BLOCK
+    spill_directory: Optional[str] = None
+    interprocess_connector: str = QUEUE
+    dispatch_policy: str = ROUND_ROBIN
+    serializer: Union[str, Serializer, None] = None
+    compression: Optional[str] = None
 
 
 class DeBulkerConfiguration:
     run_in_main_process: bool = False
+    workers: Optional[int] = None
     queue_max_size: Optional[int] = DEFAULT_QUEUE_MAX_SIZE
+    queue_max_bytes: Optional[int] = None
+    overflow_policy: str = BLOCK
+    spill_directory: Optional[str] = None
+    interprocess_connector: str = QUEUE
+    dispatch_policy: str = ROUND_ROBIN
+    serializer: Union[str, Serializer, None] = None
+    compression: Optional[str] = None
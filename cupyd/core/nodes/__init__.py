@@ -1,3 +1,6 @@
+from cupyd.core.nodes.async_extractor import AsyncExtractor
+from cupyd.core.nodes.async_loader import AsyncLoader
+from cupyd.core.nodes.async_transformer import AsyncTransformer
 from cupyd.core.nodes.bulker import Bulker
 from cupyd.core.nodes.debulker import DeBulker
 from cupyd.core.nodes.extractor import Extractor
@@ -5,4 +8,14 @@ from cupyd.core.nodes.filter import Filter
 from cupyd.core.nodes.loader import Loader
 from cupyd.core.nodes.transformer import Transformer
 
-__all__ = ["Extractor", "Transformer", "Filter", "Loader", "Bulker", "DeBulker"]
+__all__ = [
+    "Extractor",
+    "Transformer",
+    "Filter",
+    "Loader",
+    "Bulker",
+    "DeBulker",
+    "AsyncExtractor",
+    "AsyncTransformer",
+    "AsyncLoader",
+]
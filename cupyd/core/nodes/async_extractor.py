@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Any, AsyncIterator
+
+from cupyd.core.nodes.extractor import Extractor
+
+
+class AsyncExtractor(Extractor):
+    """Extractor whose items are yielded by an async generator, run by an event loop."""
+
+    @abstractmethod
+    def extract(self) -> AsyncIterator[Any]:
+        """Extract an item. Must be an async generator (async def ... yield item)."""
+
+        raise NotImplementedError("Missing implementation of extract() method!")
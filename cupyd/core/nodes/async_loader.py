@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from typing import Any
+
+from cupyd.core.models.node_configuration import DEFAULT_ASYNC_CONCURRENCY
+from cupyd.core.nodes.loader import Loader
+
+
+class AsyncLoader(Loader):
+    """Loader awaiting up to configuration.concurrency items of a bucket at once."""
+
+    def __init__(self):
+        super().__init__()
+        self._configuration.concurrency = DEFAULT_ASYNC_CONCURRENCY
+
+    @abstractmethod
+    async def load(self, item: Any):
+        """Load an incoming item (Python object)."""
+
+        raise NotImplementedError("Missing implementation of load() method!")
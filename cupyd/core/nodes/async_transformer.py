@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from typing import Any
+
+from cupyd.core.models.node_configuration import DEFAULT_ASYNC_CONCURRENCY
+from cupyd.core.nodes.transformer import Transformer
+
+
+class AsyncTransformer(Transformer):
+    """Transformer awaiting up to configuration.concurrency items of a bucket at once."""
+
+    def __init__(self):
+        super().__init__()
+        self._configuration.concurrency = DEFAULT_ASYNC_CONCURRENCY
+
+    @abstractmethod
+    async def transform(self, item: Any) -> Any:
+        """Transform an incoming item (Python object)."""
+
+        raise NotImplementedError("Missing implementation of transform() method!")
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, Iterator, final
+from typing import Any, AsyncIterator, Iterator, List, Union, final
 
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_configuration import ExtractorConfiguration
@@ -11,11 +11,20 @@ class Extractor(Node):
         self._configuration = ExtractorConfiguration()
 
     @abstractmethod
-    def extract(self) -> Iterator[Any]:
-        """Extract an item."""
+    def extract(self) -> Union[Iterator[Any], AsyncIterator[Any]]:
+        """Extract an item. Only an AsyncExtractor can extract them with an async generator."""
 
         raise NotImplementedError("Missing implementation of extract() method!")
 
+    def extract_buckets(self) -> Iterator[List[Any]]:
+        """Extract whole buckets of items, instead of an item at a time with extract().
+
+        Optional: only called when overridden. Every list yielded is sent as a bucket, so the
+        bucket size configuration doesn't apply.
+        """
+
+        raise NotImplementedError("Missing implementation of extract_buckets() method!")
+
     @final
     @property
     def configuration(self):
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, final
+from typing import Any, List, final
 
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_configuration import FilterConfiguration
@@ -16,6 +16,15 @@ class Filter(Node):
 
         raise NotImplementedError("Missing implementation of filter() method!")
 
+    def filter_bucket(self, bucket: List[Any]) -> List[Any]:
+        """Return the items of a whole bucket that pass the filter, instead of an item at a time.
+
+        Optional: only called when overridden, with the whole items (input_key doesn't apply).
+        """
+
+        value_to_filter = self.configuration.value_to_filter
+        return [item for item in bucket if self.filter(item) != value_to_filter]
+
     @final
     @property
     def configuration(self):
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, final
+from typing import Any, List, final
 
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_configuration import LoaderConfiguration
@@ -16,6 +16,15 @@ class Loader(Node):
 
         raise NotImplementedError("Missing implementation of load() method!")
 
+    def load_bucket(self, bucket: List[Any]):
+        """Load a whole bucket of items at once (executemany, bulk APIs...).
+
+        Optional: only called when overridden, with the whole items (input_key doesn't apply).
+        """
+
+        for item in bucket:
+            self.load(item)
+
     @final
     @property
     def configuration(self):
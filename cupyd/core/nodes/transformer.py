@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, final
+from typing import Any, List, final
 
 from cupyd.core.graph.classes import Node
 from cupyd.core.models.node_configuration import TransformerConfiguration
@@ -16,6 +16,14 @@ class Transformer(Node):
 
         raise NotImplementedError("Missing implementation of transform() method!")
 
+    def transform_bucket(self, bucket: List[Any]) -> List[Any]:
+        """Transform a whole bucket of items at once, instead of an item at a time.
+
+        Optional: only called when overridden, with the whole items (input_key doesn't apply).
+        """
+
+        return [self.transform(item) for item in bucket]
+
     @final
     @property
     def configuration(self):
@@ -3,13 +3,14 @@ from threading import Thread
 from time import sleep, time
 from typing import List, Dict, Optional
 
-from cupyd.core.communication.counter import MPCounter
+from cupyd.core.communication.counter import ShardedCounter, ITEMS_IN, ITEMS_OUT
 from cupyd.core.communication.event_flag import (
     IntraProcessEventFlag,
-    InterProcessEventFlag,
+    EventFlag,
 )
 from cupyd.core.constants.logging import LOGGING_MSG_PADDING
 from cupyd.core.graph.classes import Node
+from cupyd.core.nodes import Loader
 from cupyd.core.utils import format_seconds
 
 logger = logging.getLogger("cupyd.progress")
@@ -20,21 +21,24 @@ class ProgressThread(Thread):
     def __init__(
         self,
         nodes: List[Node],
-        counter_by_node_id: Dict[str, MPCounter],
+        counter_by_node_id: Dict[str, ShardedCounter],
         finalize_event: IntraProcessEventFlag,
-        stop_event: InterProcessEventFlag,
+        stop_event: EventFlag,
         refresh_interval: float,  # seconds
     ):
         super().__init__(name="cupyd (progress)")
         self.finalize_event = finalize_event
         self.stop_event = stop_event
         self.refresh_interval = refresh_interval or 2.5
-        self.counter_by_node_name = {}
+        self.counter_by_node_name: Dict[str, ShardedCounter] = {}
+        self.loader_counter_by_node_name: Dict[str, ShardedCounter] = {}
         self.start_time: Optional[float] = None
 
         for node in nodes:
             if node.id in counter_by_node_id:
                 self.counter_by_node_name[node.name] = counter_by_node_id[node.id]
+                if isinstance(node, Loader) and not node.outputs:
+                    self.loader_counter_by_node_name[node.name] = counter_by_node_id[node.id]
 
     def run(self):
         self.start_time = time()
@@ -52,8 +56,8 @@ class ProgressThread(Thread):
 
     def _get_counters_state(self):
         return {
-            node_name: int(counter.value)
-            for node_name, counter in self.counter_by_node_name.items()
+            node_name: counter.value
+            for node_name, counter in self.loader_counter_by_node_name.items()
         }
 
     def _log_progress(self, last_log: bool = False):
@@ -62,7 +66,15 @@ class ProgressThread(Thread):
         else:
             log = f"ET: {format_seconds(time() - self.start_time)} | Loaded items:\n"
 
-        for node_name, counter in self.counter_by_node_name.items():
+        for node_name, counter in self.loader_counter_by_node_name.items():
             total_items = f"{counter.value:,}"
             log += f"{LOGGING_MSG_PADDING}\t• {node_name}: {total_items}\n"
+
+        if last_log:
+            log += f"{LOGGING_MSG_PADDING}Items in / out per node:\n"
+            for node_name, counter in self.counter_by_node_name.items():
+                items_in = f"{counter.get_value(field=ITEMS_IN):,}"
+                items_out = f"{counter.get_value(field=ITEMS_OUT):,}"
+                log += f"{LOGGING_MSG_PADDING}\t• {node_name}: {items_in} / {items_out}\n"
+
         logger.info(log)
@@ -1,5 +1,5 @@
 import logging
-from collections import deque
+from collections import deque, defaultdict
 from itertools import chain
 from multiprocessing import Queue
 from statistics import median
@@ -7,7 +7,7 @@ from threading import Thread
 from time import time
 from typing import Optional, List, Dict
 
-from cupyd.core.communication import InterProcessEventFlag
+from cupyd.core.communication import EventFlag
 from cupyd.core.constants.logging import LOGGING_MSG_PADDING
 from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
 from cupyd.core.graph.classes import Node
@@ -21,7 +21,7 @@ class TimingsThread(Thread):
         self,
         nodes: List[Node],
         node_timings: Queue,
-        stop_event: InterProcessEventFlag,
+        stop_event: EventFlag,
         refresh_interval: int = 5,  # seconds
     ):
         super().__init__(name="cupyd")
@@ -35,6 +35,10 @@ class TimingsThread(Thread):
         self.buffer_by_node_id: Dict[str, deque[float]] = {
             node.id: deque(maxlen=100) for node in nodes
         }
+        # accumulated stats sent by the output connectors of each node (e.g. bytes saved)
+        self.connector_stats_by_node_id: Dict[str, Dict[str, int]] = {
+            node.id: defaultdict(int) for node in nodes
+        }
 
     def run(self):
         last_log_time = time()
@@ -46,6 +50,10 @@ class TimingsThread(Thread):
                 break
             elif self.stop_event:
                 continue
+            elif len(item) == 3:
+                node_id, stat_name, value = item
+                self.connector_stats_by_node_id[node_id][stat_name] += value
+                continue
             else:
                 node_id, timing = item
 
@@ -89,6 +97,9 @@ class TimingsThread(Thread):
                 f"{median_timing} (avg) | {min_timing} (min) | {max_timing} (max)\n"
             )
 
+            for stat_name, value in self.connector_stats_by_node_id[node_id].items():
+                log += f"{LOGGING_MSG_PADDING}\t\t{stat_name}: {value:,}\n"
+
         logger.info(log)
 
     @staticmethod
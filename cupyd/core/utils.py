@@ -1,5 +1,6 @@
 import contextlib
 import logging
+import sys
 from datetime import timedelta
 from typing import List, Tuple, Optional
 from typing import Union, Dict, Iterable
@@ -13,6 +14,13 @@ def format_seconds(seconds: Union[int, float]) -> str:
     return str(timedelta(seconds=seconds))
 
 
+def is_free_threaded() -> bool:
+    """Whether the interpreter runs without the GIL (free-threaded build, e.g. python3.13t)."""
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
 def get_subdict(dictionary: Dict, keys: Iterable[str]) -> Dict:
     return {key: dictionary[key] for key in keys if key in dictionary}
 
@@ -0,0 +1,63 @@
+"""In this example we will compare the "processes" & "threads" execution modes on a CPU bound ETL.
+On a free-threaded Python build (e.g. python3.13t) the ETLWorkerThreads run in parallel, without
+spawning processes nor serializing the buckets. With the GIL, only the processes run in
+parallel."""
+
+import logging
+from time import perf_counter
+from typing import Iterator
+
+from cupyd.core.constants.execution_modes import PROCESSES, THREADS
+from cupyd.core.etl import ETL
+from cupyd.core.nodes import Extractor, Transformer, Loader
+from cupyd.core.utils import is_free_threaded
+
+logger = logging.getLogger("execution_modes_benchmark")
+
+
+class IntExtractor(Extractor):
+
+    def __init__(self, n: int):
+        super().__init__()
+        self.configuration.run_in_main_process = True
+        self.n = n
+
+    def extract(self) -> Iterator[int]:
+        for value in range(self.n):
+            yield value
+
+
+class SumOfSquares(Transformer):
+    """CPU bound transformation."""
+
+    def transform(self, value: int) -> int:
+        return sum(idx * idx for idx in range(value % 1_000))
+
+
+class SumLoader(Loader):
+
+    def __init__(self):
+        super().__init__()
+        self.total = 0
+
+    def load(self, value: int):
+        self.total += value
+
+
+def run_benchmark(num_items: int = 200_000, workers: int = 4):
+    logger.info(f"Free-threaded Python: {is_free_threaded()}")
+
+    for execution_mode in (PROCESSES, THREADS):
+        extractor = IntExtractor(n=num_items)
+        extractor >> SumOfSquares() >> SumLoader()
+
+        start_time = perf_counter()
+        ETL(extractor).run(
+            workers=workers, execution_mode=execution_mode, show_progress=False, verbose=False
+        )
+        logger.info(f"{execution_mode:<10} {perf_counter() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.INFO)
+    run_benchmark()
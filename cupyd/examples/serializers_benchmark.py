@@ -0,0 +1,26 @@
+"""In this example we will measure every built-in serializer over a bucket of dict items, similar
+to the ones produced by an Extractor reading rows from a DB."""
+
+import logging
+
+from cupyd.core.communication.serializer import benchmark_serializers
+
+logger = logging.getLogger("serializers_benchmark")
+
+
+def run_benchmark():
+    bucket = [
+        {"id": idx, "name": f"name_{idx}", "price": idx * 0.5, "tags": ["a", "b"], "active": True}
+        for idx in range(10_000)
+    ]
+
+    for name, result in benchmark_serializers(bucket=bucket, number=20).items():
+        logger.info(
+            f"{name:<12} dumps: {result['dumps'] * 1000:.2f} ms | "
+            f"loads: {result['loads'] * 1000:.2f} ms | size: {result['size'] / 1024:.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.INFO)
+    run_benchmark()
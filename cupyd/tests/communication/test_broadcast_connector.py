@@ -0,0 +1,93 @@
+import pytest
+
+from cupyd.core.communication import (
+    BroadcastConnector,
+    InterProcessConnector,
+    SharedMemoryConnector,
+    SPSCIntraProcessConnector,
+    PickleSerializer,
+    MarshalSerializer,
+)
+from cupyd.core.communication.broadcast_connector import group_broadcast_connectors
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+class CountingSerializer(PickleSerializer):
+
+    def __init__(self):
+        self.num_dumps = 0
+
+    def dumps(self, bucket):
+        self.num_dumps += 1
+        return super().dumps(bucket)
+
+
+def test__broadcast_connector():
+    serializer = CountingSerializer()
+    connectors = [
+        InterProcessConnector(serializer=serializer),
+        SharedMemoryConnector(serializer=serializer),
+    ]
+    broadcast_connector = BroadcastConnector(connectors=connectors)
+    broadcast_connector.start()
+
+    broadcast_connector.produce([1, 2, 3])
+    broadcast_connector.produce(NO_MORE_ITEMS)
+
+    assert serializer.num_dumps == 1
+    for connector in connectors:
+        assert connector.consume() == [1, 2, 3]
+        assert connector.consume() is NO_MORE_ITEMS
+
+    broadcast_connector.close()
+
+
+def test__broadcast_connector_full_connector():
+    serializer = CountingSerializer()
+    full_connector = InterProcessConnector(maxsize=1, serializer=serializer)
+    connector = InterProcessConnector(maxsize=10, serializer=serializer)
+    broadcast_connector = BroadcastConnector(connectors=[full_connector, connector])
+    broadcast_connector.start()
+    full_connector.produce([0])
+    serializer.num_dumps = 0
+
+    # the full Connector doesn't prevent the other one from getting the bucket
+    assert not broadcast_connector.try_produce([1, 2, 3])
+    assert connector.consume() == [1, 2, 3]
+
+    assert full_connector.consume() == [0]
+    broadcast_connector.produce_overflowing([1, 2, 3])
+    assert full_connector.consume() == [1, 2, 3]
+
+    assert serializer.num_dumps == 1
+    assert connector.get_current_size() == 0
+    broadcast_connector.close()
+
+
+def test__broadcast_connector_different_serializers():
+    with pytest.raises(ValueError):
+        BroadcastConnector(
+            connectors=[
+                InterProcessConnector(serializer=PickleSerializer()),
+                InterProcessConnector(serializer=MarshalSerializer()),
+            ]
+        )
+
+
+def test__group_broadcast_connectors():
+    intra_connector = SPSCIntraProcessConnector()
+    pickle_connectors = [InterProcessConnector(serializer=PickleSerializer()) for _ in range(2)]
+    marshal_connector = InterProcessConnector(serializer=MarshalSerializer())
+    queue_connector = InterProcessConnector()
+
+    connectors = group_broadcast_connectors(
+        [intra_connector, *pickle_connectors, marshal_connector, queue_connector]
+    )
+
+    assert len(connectors) == 4
+    assert intra_connector in connectors
+    assert marshal_connector in connectors
+    assert queue_connector in connectors
+    broadcast_connectors = [c for c in connectors if isinstance(c, BroadcastConnector)]
+    assert len(broadcast_connectors) == 1
+    assert broadcast_connectors[0].connectors == pickle_connectors
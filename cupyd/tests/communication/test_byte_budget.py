@@ -0,0 +1,67 @@
+from threading import Thread
+
+import pytest
+
+from cupyd.core.communication import (
+    IntraProcessConnector,
+    InterProcessConnector,
+    SPSCIntraProcessConnector,
+    PickleSerializer,
+)
+from cupyd.core.communication.byte_budget import IntraProcessByteBudget, estimate_size
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def test__estimate_size():
+    small_bucket = [{"value": idx} for idx in range(100)]
+    big_bucket = [{"value": "x" * 1000} for _ in range(100)]
+
+    assert estimate_size(big_bucket) > 100 * 1000
+    assert estimate_size(small_bucket) < estimate_size(big_bucket)
+
+
+def test__byte_budget_accepts_oversized_bucket():
+    budget = IntraProcessByteBudget(max_bytes=10)
+
+    budget.acquire(100)  # nothing stored, so it doesn't wait
+    assert budget.used_bytes == 100
+
+    budget.release(100)
+    assert budget.used_bytes == 0
+
+
+@pytest.mark.parametrize(
+    "connector",
+    [
+        IntraProcessConnector(max_bytes=50_000),
+        SPSCIntraProcessConnector(max_bytes=50_000),
+        InterProcessConnector(max_bytes=50_000),
+        InterProcessConnector(max_bytes=50_000, serializer=PickleSerializer()),
+    ],
+)
+def test__connector_max_bytes(connector):
+    connector.start()
+    buckets = [["x" * 10_000] for _ in range(50)]
+    max_used_bytes = 0
+
+    def produce():
+        for bucket in buckets:
+            connector.produce(bucket)
+        connector.finish_producing(num_consumers=1)
+
+    producer = Thread(target=produce)
+    producer.start()
+
+    consumed = []
+    while True:
+        max_used_bytes = max(max_used_bytes, connector._byte_budget.used_bytes)
+        bucket = connector.consume()
+        if bucket is NO_MORE_ITEMS:
+            break
+        consumed.append(bucket)
+    producer.join()
+    connector.close()
+
+    assert consumed == buckets
+    assert 0 < max_used_bytes <= 50_000
+    assert connector._byte_budget.used_bytes == 0
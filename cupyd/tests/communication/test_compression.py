@@ -0,0 +1,78 @@
+import os
+import pickle
+
+import pytest
+
+from cupyd.core.communication import InterProcessConnector, SharedMemoryConnector
+from cupyd.core.communication.compression import AUTO, LZMA, ZLIB, Compressor, get_compressor
+
+BUCKET = [{"id": idx, "name": "same_name", "tags": ["a", "b"]} for idx in range(1_000)]
+
+
+@pytest.mark.parametrize("codec", [ZLIB, LZMA])
+def test__compressor_round_trip(codec):
+    compressor = Compressor(codec=codec, threshold=0, min_saving_rate=0)
+    data = pickle.dumps(BUCKET)
+
+    compressed_data = compressor.compress(data)
+
+    assert len(compressed_data) < len(data)
+    assert bytes(compressor.decompress(compressed_data)) == data
+    assert compressor.collect_stats()["bytes_saved"] == len(data) - len(compressed_data) + 1
+    assert compressor.collect_stats()["bytes_saved"] == 0
+
+
+def test__compressor_below_threshold():
+    compressor = Compressor(threshold=1024)
+    data = b"x" * 100
+
+    assert bytes(compressor.decompress(compressor.compress(data))) == data
+    assert compressor.collect_stats()["bytes_saved"] == 0
+
+
+def test__compressor_disables_itself():
+    compressor = Compressor(threshold=0, min_saving_rate=0, probe_interval=3)
+    incompressible_data = os.urandom(1024)
+
+    compressor.compress(pickle.dumps(BUCKET))
+    assert compressor.enabled
+
+    for _ in range(20):
+        compressor.compress(incompressible_data)
+    assert not compressor.enabled
+
+    # probing with compressible data again will enable it back
+    for _ in range(3):
+        compressor.compress(pickle.dumps(BUCKET))
+    assert compressor.enabled
+
+
+def test__compressor_saving_rate():
+    compressor = Compressor(threshold=0, min_saving_rate=float("inf"))
+    compressor.compress(pickle.dumps(BUCKET))
+    assert not compressor.enabled
+
+    # a codec chosen explicitly is never disabled, however slow it is
+    compressor = get_compressor(LZMA)
+    compressor.min_saving_rate = float("inf")
+    compressor.compress(pickle.dumps(BUCKET))
+    assert compressor.enabled
+    assert get_compressor(AUTO).adaptive
+
+
+def test__invalid_compression():
+    with pytest.raises(ValueError):
+        get_compressor("unknown")
+
+
+@pytest.mark.parametrize("connector_class", [InterProcessConnector, SharedMemoryConnector])
+def test__connector_with_compression(connector_class):
+    connector = connector_class(maxsize=10, compressor=Compressor(threshold=0, min_saving_rate=0))
+    connector.start()
+
+    connector.produce(BUCKET)
+
+    assert connector.consume() == BUCKET
+    assert connector.collect_stats()["bytes_saved"] > 0
+
+    connector.close()
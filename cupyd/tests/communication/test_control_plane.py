@@ -0,0 +1,41 @@
+from multiprocessing import Process
+
+import pytest
+
+from cupyd.core.communication import ControlPlane
+
+
+def _stop(control_plane: ControlPlane):
+    control_plane.stop_flag.set()
+
+
+def test__control_plane_flags():
+    control_plane = ControlPlane(num_nodes=100)
+    stop_flag, pause_flag = control_plane.stop_flag, control_plane.pause_flag
+    node_flags = [control_plane.get_node_flag(index) for index in range(100)]
+
+    assert not stop_flag and not pause_flag and not any(node_flags)
+
+    pause_flag.set()
+    node_flags[70].set()
+    assert pause_flag and node_flags[70]
+    assert not stop_flag and sum(map(bool, node_flags)) == 1
+
+    # setting an active flag deactivates it, like the other EventFlags
+    pause_flag.set()
+    assert not pause_flag
+    pause_flag.wait()
+
+    with pytest.raises(IndexError):
+        control_plane.get_node_flag(100)
+
+
+def test__control_plane_shared_between_processes():
+    control_plane = ControlPlane(num_nodes=1)
+
+    process = Process(target=_stop, args=(control_plane,))
+    process.start()
+    process.join()
+
+    assert control_plane.stop_flag
+    assert not control_plane.pause_flag and not control_plane.get_node_flag(0)
@@ -0,0 +1,27 @@
+from multiprocessing import get_context
+
+from cupyd.core.communication import ShardedCounter, CounterShard
+from cupyd.core.communication.counter import ITEMS_IN, ITEMS_OUT
+
+
+def _increase(shard: CounterShard, times: int):
+    for _ in range(times):
+        shard.increase(amount=1, field=ITEMS_IN)
+        shard.increase(amount=2, field=ITEMS_OUT)
+
+
+def test__sharded_counter():
+    counter = ShardedCounter(num_shards=4)
+    context = get_context("spawn")
+
+    processes = [
+        context.Process(target=_increase, args=(counter.get_shard(idx), 1_000)) for idx in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert counter.get_value(field=ITEMS_IN) == 4_000
+    assert counter.get_value(field=ITEMS_OUT) == 8_000
+    assert counter.value == 8_000
@@ -0,0 +1,71 @@
+from copy import copy
+from typing import Any, List
+
+from cupyd.core.communication import DispatchConnector
+from cupyd.core.constants.dispatch_policies import LEAST_LOADED
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def _bound_consumer(connector: DispatchConnector, index: int) -> DispatchConnector:
+    # every consumer gets its own copy of the Connector, as if it was sent to its own process
+    consumer = copy(connector)
+    consumer.bind_consumer(index)
+    return consumer
+
+
+def _consume_all(connector: DispatchConnector) -> List[List[Any]]:
+    buckets: List[List[Any]] = []
+    while True:
+        bucket = connector.consume()
+        if bucket is NO_MORE_ITEMS:
+            return buckets
+        buckets.append(bucket)
+
+
+def test__dispatch_connector_round_robin():
+    connector = DispatchConnector(num_consumers=3)
+    connector.start()
+
+    for idx in range(6):
+        connector.produce([idx])
+    connector.finish_producing(num_consumers=3)
+
+    assert _consume_all(_bound_consumer(connector, 0)) == [[0], [3]]
+    assert _consume_all(_bound_consumer(connector, 1)) == [[1], [4]]
+    assert _consume_all(_bound_consumer(connector, 2)) == [[2], [5]]
+    connector.close()
+
+
+def test__dispatch_connector_try_produce():
+    connector = DispatchConnector(maxsize=2, num_consumers=2)
+    connector.start()
+    consumer = _bound_consumer(connector, 0)
+
+    assert connector.try_produce([0])
+    assert connector.try_produce([1])
+    assert not connector.try_produce([2])
+
+    # the failed bucket still goes to the first queue, once it has room
+    assert consumer.consume() == [0]
+    assert connector.try_produce([2])
+    assert consumer.consume() == [2]
+    assert _bound_consumer(connector, 1).consume() == [1]
+    connector.close()
+
+
+def test__dispatch_connector_least_loaded():
+    connector = DispatchConnector(num_consumers=2, policy=LEAST_LOADED)
+    connector.start()
+    consumer = _bound_consumer(connector, 0)
+
+    connector.produce([0])
+    connector.produce([1])
+    assert consumer.consume() == [0]
+
+    # the first queue is empty again, so it gets the next bucket
+    connector.produce([2])
+    assert consumer.consume() == [2]
+
+    connector.finish_producing(num_consumers=2)
+    assert _consume_all(_bound_consumer(connector, 1)) == [[1]]
+    connector.close()
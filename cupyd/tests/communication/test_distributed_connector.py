@@ -0,0 +1,62 @@
+import pickle
+from threading import Thread
+
+from cupyd.core.communication import DistributedConnector
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def test__distributed_connector():
+    connector = DistributedConnector(maxsize=10, batch_size=4, linger=10)
+    connector.start()
+
+    connector.produce([1, 2])
+    connector.produce([3])
+    assert connector.get_current_size() == 0  # still batched by the producer
+
+    connector.flush()
+    assert connector.consume() == [1, 2]
+    assert connector.consume() == [3]
+
+    connector.finish_producing(num_consumers=1)
+    assert connector.consume() is NO_MORE_ITEMS
+
+    connector.close()
+
+
+def test__distributed_connector_linger():
+    connector = DistributedConnector(maxsize=10, batch_size=100, linger=0.05)
+    connector.start()
+
+    # sent by the flusher thread, although the producer doesn't produce anything else
+    connector.produce([1, 2])
+    assert connector.consume() == [1, 2]
+
+    connector.close()
+
+
+def test__distributed_connector_backpressure():
+    connector = DistributedConnector(maxsize=2, batch_size=3)
+    connector.start()
+
+    # the connector is sent to other processes pickled, it must only keep the broker address
+    producer_connector = pickle.loads(pickle.dumps(connector))
+    buckets = [[idx] for idx in range(20)]
+
+    def produce():
+        for bucket in buckets:
+            producer_connector.produce(bucket)
+            assert connector.get_current_size() <= 2
+        producer_connector.finish_producing(num_consumers=1)
+
+    producer = Thread(target=produce)
+    producer.start()
+
+    consumed = []
+    while (bucket := connector.consume()) is not NO_MORE_ITEMS:
+        consumed.append(bucket)
+    producer.join()
+
+    assert consumed == buckets
+
+    producer_connector.close()
+    connector.close()
@@ -0,0 +1,31 @@
+from cupyd.core.communication import InterProcessConnector, PickleSerializer
+from cupyd.core.constants.overflow_policies import DROP_OLDEST
+
+
+class CountingSerializer(PickleSerializer):
+
+    def __init__(self):
+        self.num_dumps = 0
+
+    def dumps(self, bucket):
+        self.num_dumps += 1
+        return super().dumps(bucket)
+
+
+def test__inter_process_connector_drop_oldest():
+    serializer = CountingSerializer()
+    connector = InterProcessConnector(maxsize=2, serializer=serializer)
+    connector.overflow_policy = DROP_OLDEST
+    connector.start()
+
+    connector.produce([1])
+    connector.produce([2])
+    serializer.num_dumps = 0
+
+    # the bucket is serialized once, although the oldest bucket is dropped before it fits
+    connector.produce_overflowing([3])
+
+    assert serializer.num_dumps == 1
+    assert [connector.consume(), connector.consume()] == [[2], [3]]
+    assert connector.collect_stats() == {"dropped_buckets": 1}
+    connector.close()
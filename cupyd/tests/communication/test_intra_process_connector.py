@@ -0,0 +1,62 @@
+from threading import Thread
+
+from cupyd.core.communication import SPSCIntraProcessConnector
+from cupyd.core.constants.overflow_policies import DROP_OLDEST, SAMPLE
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def test__spsc_connector():
+    connector = SPSCIntraProcessConnector(maxsize=3)
+    connector.start()
+    buckets = [[idx] for idx in range(1_000)]
+
+    def produce():
+        for bucket in buckets:
+            connector.produce(bucket)
+            assert connector.get_current_size() <= 3
+        connector.finish_producing(num_consumers=1)
+
+    producer = Thread(target=produce)
+    producer.start()
+
+    consumed = []
+    while True:
+        batch = connector.consume_many(max_buckets=2)
+        assert 1 <= len(batch) <= 2
+        consumed.extend(batch)
+        if consumed[-1] is NO_MORE_ITEMS:
+            break
+    producer.join()
+
+    assert consumed == buckets + [NO_MORE_ITEMS]
+
+
+def test__spsc_connector_produce_many():
+    connector = SPSCIntraProcessConnector()
+    connector.start()
+
+    connector.produce_many([[1], [2], [3]])
+
+    assert connector.consume_many(max_buckets=10) == [[1], [2], [3]]
+
+
+def test__spsc_connector_overflow_policies():
+    connector = SPSCIntraProcessConnector(maxsize=2)
+    connector.overflow_policy = DROP_OLDEST
+    connector.start()
+
+    for bucket in [[1], [2], [3], [4]]:
+        if not connector.try_produce(bucket):
+            connector.produce_overflowing(bucket)
+
+    assert connector.consume_many(max_buckets=10) == [[3], [4]]
+    assert connector.collect_stats() == {"dropped_buckets": 2}
+
+    connector.overflow_policy = SAMPLE
+    for bucket in [[5], [6], [7]]:
+        if not connector.try_produce(bucket):
+            connector.produce_overflowing(bucket)
+
+    assert connector.consume_many(max_buckets=10) == [[5], [6]]
+    assert connector.collect_stats() == {"dropped_buckets": 1}
+    assert connector.collect_stats() == {}
@@ -0,0 +1,57 @@
+import pickle
+
+import pytest
+
+from cupyd.core.communication import InterProcessConnector, SharedMemoryConnector
+from cupyd.core.communication.serializer import (
+    MARSHAL,
+    PICKLE,
+    PICKLE_OOB,
+    PickleOutOfBandSerializer,
+    benchmark_serializers,
+    get_serializer,
+)
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+BUCKET = [{"id": idx, "name": f"name_{idx}", "tags": ["a", "b"]} for idx in range(10)]
+
+
+@pytest.mark.parametrize("name", [PICKLE, PICKLE_OOB, MARSHAL])
+def test__serializer_round_trip(name):
+    serializer = get_serializer(name)
+    assert serializer.loads(serializer.dumps(BUCKET)) == BUCKET
+
+
+def test__pickle_out_of_band_buffers():
+    serializer = PickleOutOfBandSerializer()
+    bucket = [pickle.PickleBuffer(bytearray(b"x" * 1000)), "item"]
+
+    loaded = serializer.loads(serializer.dumps(bucket))
+
+    assert bytes(loaded[0]) == b"x" * 1000
+    assert loaded[1] == "item"
+
+
+def test__invalid_serializer():
+    with pytest.raises(ValueError):
+        get_serializer("unknown")
+
+
+@pytest.mark.parametrize("connector_class", [InterProcessConnector, SharedMemoryConnector])
+def test__connector_with_serializer(connector_class):
+    connector = connector_class(maxsize=10, serializer=get_serializer(MARSHAL))
+    connector.start()
+
+    connector.produce(BUCKET)
+    connector.finish_producing(num_consumers=1)
+
+    assert connector.consume() == BUCKET
+    assert connector.consume() is NO_MORE_ITEMS
+
+    connector.close()
+
+
+def test__benchmark_serializers():
+    results = benchmark_serializers(bucket=BUCKET, names=[PICKLE, MARSHAL], number=2)
+    assert set(results) == {PICKLE, MARSHAL}
+    assert all(result["size"] > 0 for result in results.values())
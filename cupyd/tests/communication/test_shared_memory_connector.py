@@ -0,0 +1,64 @@
+from threading import Thread
+from typing import Any, List
+
+import pytest
+
+from cupyd.core.communication import SharedMemoryConnector, PickleSerializer
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def test__shared_memory_connector():
+    connector = SharedMemoryConnector(maxsize=32, slot_size=64)
+    connector.start()
+
+    small_bucket = [1, 2, 3]
+    big_bucket = [str(item) * 10 for item in range(50)]  # split across several slots
+
+    connector.produce(small_bucket)
+    assert connector.get_current_size() == 1
+    assert connector.consume() == small_bucket
+
+    connector.produce(big_bucket)
+    assert connector.consume() == big_bucket
+
+    connector.finish_producing(num_consumers=2)
+    assert connector.consume() is NO_MORE_ITEMS
+    assert connector.consume() is NO_MORE_ITEMS
+    assert connector.get_current_size() == 0
+
+    connector.close()
+
+
+def test__shared_memory_connector_bucket_bigger_than_ring():
+    connector = SharedMemoryConnector(maxsize=2, slot_size=64, num_consumers=2)
+    connector.start()
+
+    buckets: List[List[Any]] = [[str(item) * 10 for item in range(50)], [1], [2]]
+
+    producer = Thread(target=lambda: [connector.produce(bucket) for bucket in buckets])
+    producer.start()
+    consumed = [connector.consume() for _ in buckets]
+    producer.join()
+
+    assert consumed == buckets
+
+    connector.close()
+
+
+class FailingSerializer(PickleSerializer):
+
+    def loads(self, data):
+        raise ValueError("corrupted bucket")
+
+
+def test__shared_memory_connector_deserialization_error():
+    connector = SharedMemoryConnector(maxsize=2, slot_size=64, serializer=FailingSerializer())
+    connector.start()
+
+    connector.produce([1])
+    with pytest.raises(ValueError):
+        connector.consume()
+
+    # the slot was released, & so was the view of the shared memory
+    assert connector.get_current_size() == 0
+    connector.close()
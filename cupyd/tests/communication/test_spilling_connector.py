@@ -0,0 +1,62 @@
+import os
+
+from cupyd.core.communication import SpillingConnector
+from cupyd.core.communication.compression import Compressor
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+
+
+def test__spilling_connector():
+    connector = SpillingConnector(maxsize=2, segment_size=1_000)
+    connector.start()
+    buckets = [[idx] * 100 for idx in range(50)]
+
+    # the producer never blocks, although nobody is consuming
+    for bucket in buckets:
+        connector.produce(bucket)
+    connector.flush()
+    connector.finish_producing(num_consumers=1)
+
+    assert connector.collect_stats() == {"spilled_buckets": 48}
+    assert len(os.listdir(connector._directory)) > 1
+
+    consumed = []
+    while True:
+        bucket = connector.consume()
+        if bucket is NO_MORE_ITEMS:
+            break
+        consumed.append(bucket)
+
+    assert consumed == buckets
+    # fully read segments are removed right away
+    assert len(os.listdir(connector._directory)) <= 1
+
+    connector.close()
+    assert not os.path.exists(connector._directory)
+
+
+def test__spilling_connector_compression():
+    connector = SpillingConnector(maxsize=1, compressor=Compressor(threshold=0))
+    connector.start()
+    buckets = [["x" * 10_000] for _ in range(5)]
+
+    for bucket in buckets:
+        connector.produce(bucket)
+
+    assert [connector.consume() for _ in buckets] == buckets
+    assert connector.collect_stats()["bytes_saved"] > 0
+    connector.close()
+
+
+def test__spilling_connector_max_bytes():
+    connector = SpillingConnector(maxsize=100, max_bytes=1_000)
+    connector.start()
+    buckets = [["x" * 400] for _ in range(5)]
+
+    # only 2 buckets fit in the in-memory byte budget, although there are free memory slots
+    for bucket in buckets:
+        connector.produce(bucket)
+
+    assert connector.collect_stats()["spilled_buckets"] == 3
+    assert [connector.consume() for _ in buckets] == buckets
+    assert connector._byte_budget.used_bytes == 0
+    connector.close()
@@ -0,0 +1,77 @@
+from threading import Lock
+from typing import Any
+
+from cupyd.core.communication import IntraProcessEventFlag, InterProcessConnector
+from cupyd.core.computing.autoscaler import Autoscaler, SCALE_DOWN_IDLE_CHECKS
+from cupyd.core.constants.sentinel_values import NO_MORE_ITEMS
+from cupyd.core.models.etl_segment import ETLSegment
+from cupyd.tests.etl.nodes import AdderToStr
+
+
+class FakeWorker:
+    def __init__(self, worker_id: str, worker_index: int):
+        self.worker_id = worker_id
+        self.worker_index = worker_index
+        self.started = False
+
+    def start(self):
+        self.started = True
+
+
+def _create_fake_worker(worker_index: int) -> Any:
+    # stands in for the ETLWorkers created by the ETL
+    return FakeWorker(worker_id=f"etl_worker_{worker_index + 1}", worker_index=worker_index)
+
+
+def test__autoscaler_scales_by_queue_depth():
+    tf = AdderToStr()
+    tf.id = "node_1"
+    connector = InterProcessConnector()
+    connector.start()
+
+    workers = [FakeWorker(worker_id="etl_worker_1", worker_index=0)]
+    segment = ETLSegment(
+        id="segment_1",
+        nodes=[tf],
+        node_ids={tf.id},
+        run_in_main_process=False,
+        num_workers=1,
+        min_workers=1,
+        max_workers=2,
+        input_connector=connector,
+        worker_factory=_create_fake_worker,
+    )
+    active_worker_ids_by_segment_id = {segment.id: {"etl_worker_1"}}
+    workers_by_id = {worker.worker_id: worker for worker in workers}
+    autoscaler = Autoscaler(
+        segments=[segment],
+        active_worker_ids_by_segment_id=active_worker_ids_by_segment_id,
+        workers_by_id=workers_by_id,
+        lock=Lock(),
+        stop_event=IntraProcessEventFlag(),
+        finalize_event=IntraProcessEventFlag(),
+    )
+
+    # buckets pile up: a second ETLWorker is spawned, with the free index
+    for idx in range(5):
+        connector.produce([idx])
+    while connector.get_current_size() < 5:
+        pass
+    autoscaler._scale(segment)
+
+    assert segment.num_workers == 2
+    assert workers_by_id["etl_worker_2"].started
+    assert workers_by_id["etl_worker_2"].worker_index == 1
+
+    # max workers reached
+    autoscaler._scale(segment)
+    assert segment.num_workers == 2
+
+    # the queue stays empty: an ETLWorker is retired with a NO_MORE_ITEMS
+    for idx in range(5):
+        connector.consume()
+    for _ in range(SCALE_DOWN_IDLE_CHECKS):
+        autoscaler._scale(segment)
+
+    assert segment.num_workers == 1
+    assert connector.consume() is NO_MORE_ITEMS
@@ -0,0 +1,37 @@
+import pytest
+
+from cupyd.core.computing.bucket_sizer import AdaptiveBucketSizer
+
+
+def test__bucket_sizer_targets_latency():
+    sizer = AdaptiveBucketSizer(initial_size=100, min_size=10, max_size=5_000, target_latency=0.1)
+
+    # 1 ms per item: grows (at most 2x per bucket) until a bucket takes 0.1 seconds
+    for _ in range(10):
+        sizer.update(num_items=sizer.size, elapsed=sizer.size * 0.001)
+    assert sizer.size == 100
+
+    # 0.01 ms per item: grows till the max size
+    for _ in range(20):
+        sizer.update(num_items=sizer.size, elapsed=sizer.size * 0.00001)
+    assert sizer.size == 5_000
+
+    # 1 second per item: shrinks till the min size
+    for _ in range(20):
+        sizer.update(num_items=sizer.size, elapsed=sizer.size * 1.0)
+    assert sizer.size == 10
+
+
+def test__bucket_sizer_max_bytes():
+    sizer = AdaptiveBucketSizer(
+        initial_size=100, min_size=1, max_size=10_000, target_latency=1.0, max_bytes=50_000
+    )
+
+    for _ in range(20):
+        sizer.update(num_items=sizer.size, elapsed=0.0, num_bytes=sizer.size * 1_000)
+    assert sizer.size == 50
+
+
+def test__bucket_sizer_invalid_window():
+    with pytest.raises(ValueError):
+        AdaptiveBucketSizer(initial_size=10, min_size=100, max_size=10, target_latency=0.1)
@@ -0,0 +1,48 @@
+import os
+import signal
+import time
+
+import pytest
+
+from cupyd import ETL, ETLRuntime
+from cupyd.core.exceptions import ETLExecutionError
+from cupyd.tests.etl.nodes import ListExtractor, AdderToStr, ListLoader, UnloadableAdderToStr
+
+
+def _run_etl(runtime: ETLRuntime) -> ListLoader:
+    ext = ListExtractor(list(range(1_000)))
+    ldr = ListLoader()
+    ext >> AdderToStr() >> ldr
+    ETL(ext).run(workers=2, runtime=runtime, show_progress=False)
+    return ldr
+
+
+def test__runtime_respawns_dead_processes():
+    with ETLRuntime(num_processes=2) as runtime:
+        dead_process = runtime.processes[0]
+        os.kill(dead_process.pid, signal.SIGKILL)
+        while dead_process.is_alive():
+            time.sleep(0.01)
+
+        ldr = _run_etl(runtime)
+
+        assert len(ldr.items) == 1_000
+        assert dead_process not in runtime.processes
+        assert all(process.is_alive() for process in runtime.processes)
+
+
+def test__runtime_worker_error():
+    with ETLRuntime(num_processes=1) as runtime:
+        ext = ListExtractor(list(range(100)))
+        ext >> UnloadableAdderToStr() >> ListLoader()
+
+        # the failed ETLWorker is reported, instead of the ETL waiting for it forever
+        with pytest.raises(ETLExecutionError):
+            ETL(ext).run(runtime=runtime, show_progress=False)
+
+        # & the warm process keeps running the ETLWorkers of the next ETLs
+        process = runtime.processes[0]
+        ldr = _run_etl(runtime)
+
+        assert len(ldr.items) == 1_000
+        assert process in runtime.processes
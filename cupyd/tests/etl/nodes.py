@@ -1,6 +1,17 @@
-from typing import Any, Iterator, List, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from cupyd import Transformer, Loader, Extractor, Filter
+from cupyd import (
+    ColumnarBucket,
+    Transformer,
+    Loader,
+    Extractor,
+    Filter,
+    AsyncExtractor,
+    AsyncTransformer,
+    AsyncLoader,
+)
 
 
 class ListExtractor(Extractor):
@@ -22,6 +33,40 @@ class AdderToStr(Transformer):
         return str(item)
 
 
+class SlowAdderToStr(AdderToStr):
+
+    def transform(self, item: int) -> str:
+        time.sleep(0.005)
+        return super().transform(item)
+
+
+class UnloadableAdderToStr(AdderToStr):
+    """Loses its configuration when unpickled, so its ETLWorker fails before running it."""
+
+    def __setstate__(self, state):
+        state.pop("_configuration")
+        self.__dict__.update(state)
+
+
+class StrictAdderToStr(AdderToStr):
+    """Fails on non-int items, after a delay, and keeps the first exception it handles."""
+
+    def __init__(self):
+        super().__init__()
+        self.configuration.run_in_main_process = True
+        self.exception = None
+
+    def transform(self, item: int) -> str:
+        if not isinstance(item, int):
+            time.sleep(0.01 if item == "first" else 0)
+            raise ValueError(item)
+        return super().transform(item)
+
+    def handle_exception(self, exception):
+        self.exception = exception
+        super().handle_exception(exception)
+
+
 class CustomFilter(Filter):
 
     def filter(self, item: str) -> Optional[str]:
@@ -42,3 +87,128 @@ class ListLoader(Loader):
 
     def load(self, item: Any):
         self.items.append(item)
+
+
+class KeyIncrementer(Transformer):
+
+    def transform(self, item: dict) -> dict:
+        item["value"] += 1  # modifies the incoming item instead of a copy of it
+        return item
+
+
+class AsyncListExtractor(AsyncExtractor):
+
+    def __init__(self, items: List[Any]):
+        super().__init__()
+        self.items = items
+
+    async def extract(self) -> AsyncIterator[Any]:
+        for item in self.items:
+            await asyncio.sleep(0)
+            yield item
+
+
+class AsyncAdderToStr(AsyncTransformer):
+    """Keeps the max number of items awaited at once."""
+
+    def __init__(self):
+        super().__init__()
+        self.configuration.run_in_main_process = True
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def transform(self, item: int) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            item += 5
+            return str(item)
+        finally:
+            self.in_flight -= 1
+
+
+class AsyncListLoader(AsyncLoader):
+
+    def __init__(self):
+        super().__init__()
+        self.configuration.run_in_main_process = True
+        self.items = []
+
+    async def start(self):
+        self.items = []
+
+    async def load(self, item: Any):
+        await asyncio.sleep(0)
+        self.items.append(item)
+
+
+class ListBucketExtractor(ListExtractor):
+    """Yields the items in buckets of 7."""
+
+    def extract_buckets(self) -> Iterator[List[Any]]:
+        for idx in range(0, len(self.items), 7):
+            yield self.items[idx : idx + 7]  # noqa
+
+
+class BucketAdderToStr(AdderToStr):
+
+    def transform(self, item: int) -> str:
+        raise AssertionError("transform() called instead of transform_bucket()")
+
+    def transform_bucket(self, bucket: List[int]) -> List[str]:
+        return [str(item + 5) for item in bucket]
+
+
+class AsyncBucketAdderToStr(AdderToStr):
+
+    async def transform_bucket(self, bucket: List[int]) -> List[str]:  # type: ignore[override]
+        return [str(item + 5) for item in bucket]
+
+
+class BucketFilter(CustomFilter):
+
+    def filter_bucket(self, bucket: List[str]) -> List[str]:
+        return [item for item in bucket if int(item) % 5 != 0]
+
+
+class BucketListLoader(ListLoader):
+    """Keeps the size of every bucket loaded."""
+
+    def start(self):
+        super().start()
+        self.bucket_sizes = []
+
+    def load(self, item: Any):
+        raise AssertionError("load() called instead of load_bucket()")
+
+    def load_bucket(self, bucket: List[Any]):
+        self.bucket_sizes.append(len(bucket))
+        self.items.extend(bucket)
+
+
+class ColumnarExtractor(ListExtractor):
+    """Yields the items as the "value" column of ColumnarBuckets of 10 rows."""
+
+    def extract_buckets(self) -> Iterator[Any]:
+        for idx in range(0, len(self.items), 10):
+            yield ColumnarBucket({"value": self.items[idx : idx + 10]})  # noqa
+
+
+class ColumnarAdder(Transformer):
+
+    def transform(self, item: Dict[str, int]) -> Dict[str, int]:
+        return {**item, "result": item["value"] + 5}
+
+    def transform_bucket(self, bucket: Any) -> Any:
+        results = [value + 5 for value in bucket["value"]]
+        return ColumnarBucket({**bucket.columns, "result": results})
+
+
+class ColumnarFilter(Filter):
+
+    def filter(self, item: Dict[str, int]) -> Optional[Dict[str, int]]:
+        return item if item["result"] % 5 != 0 else None
+
+    def filter_bucket(self, bucket: Any) -> List[bool]:
+        return [result % 5 != 0 for result in bucket["result"]]
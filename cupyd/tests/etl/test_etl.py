@@ -1,7 +1,31 @@
+import logging
+import threading
+from multiprocessing import get_start_method
 from unittest import TestCase
 
-from cupyd import ETL
-from cupyd.tests.etl.nodes import ListExtractor, AdderToStr, ListLoader, CustomFilter
+import pytest
+
+from cupyd import ETL, ETLRuntime
+from cupyd.core.constants.connector_types import SHARED_MEMORY, TCP, DISPATCH
+from cupyd.core.constants.dispatch_policies import LEAST_LOADED
+from cupyd.core.constants.execution_modes import THREADS
+from cupyd.core.constants.overflow_policies import SPILL, SAMPLE
+from cupyd.core.constants.start_methods import FORK, FORKSERVER
+from cupyd.tests.etl.nodes import (
+    ListExtractor,
+    AdderToStr,
+    ListLoader,
+    CustomFilter,
+    SlowAdderToStr,
+    AsyncListExtractor,
+    AsyncAdderToStr,
+    AsyncListLoader,
+    ListBucketExtractor,
+    BucketAdderToStr,
+    AsyncBucketAdderToStr,
+    BucketFilter,
+    BucketListLoader,
+)
 
 
 def test__etl_01():
@@ -74,3 +98,441 @@ def test__etl_04():
 
     test_case.assertCountEqual(ldr_1.items, expected_items_1)
     test_case.assertCountEqual(ldr_2.items, expected_items_2)
+
+
+def test__etl_shared_memory_connector():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items=items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    tf.configuration.interprocess_connector = SHARED_MEMORY
+    tf.configuration.queue_max_size = 4
+    ldr = ListLoader()
+    ldr.configuration.interprocess_connector = SHARED_MEMORY
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_distributed_connector():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items=items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    tf.configuration.interprocess_connector = TCP
+    tf.configuration.queue_max_size = 4
+    ldr = ListLoader()
+    ldr.configuration.interprocess_connector = TCP
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_queue_max_bytes():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    tf = AdderToStr()
+    tf.configuration.queue_max_bytes = 1  # smaller than any bucket
+    ldr = ListLoader()
+    ldr.configuration.queue_max_bytes = 1
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_ordered():
+    items = list(range(5_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    ldr = ListLoader()
+    ldr.configuration.ordered = True
+    ldr.configuration.reorder_buffer_size = 20
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=3)
+
+    assert ldr.items == expected_items
+
+    # dropped buckets would leave the ordered node waiting for them forever
+    tf.configuration.overflow_policy = SAMPLE
+    with pytest.raises(ValueError):
+        ETL(ext).run(workers=3)
+
+
+def test__etl_broadcast():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    tf_1 = AdderToStr()
+    tf_2 = AdderToStr()
+    tf_2.configuration.interprocess_connector = SHARED_MEMORY
+    ldr_1 = ListLoader()
+    ldr_2 = ListLoader()
+
+    ext >> [tf_1 >> ldr_1, tf_2 >> ldr_2]
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr_1.items, expected_items)
+    test_case.assertCountEqual(ldr_2.items, expected_items)
+
+
+def test__etl_dispatch_connector():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    tf = AdderToStr()
+    tf.configuration.interprocess_connector = DISPATCH
+    tf.configuration.dispatch_policy = LEAST_LOADED
+    ldr = ListLoader()
+    ldr.configuration.interprocess_connector = DISPATCH
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=3)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_spilling_connector():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    tf.configuration.queue_max_size = 2
+    tf.configuration.overflow_policy = SPILL
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_build_error(tmp_path):
+    ext = ListExtractor(list(range(100)))
+    tf = AdderToStr()
+    tf.configuration.overflow_policy = SPILL
+    tf.configuration.spill_directory = str(tmp_path)
+    ldr = ListLoader()
+    ldr.configuration.run_in_main_process = True
+    ldr.configuration.interprocess_connector = "invalid"
+
+    ext >> tf >> ldr
+
+    start_method = get_start_method()
+    with pytest.raises(ValueError):
+        ETL(ext).run(workers=2, start_method=FORKSERVER)
+
+    # no connector was started (e.g. no spill directory left) & the start method was restored
+    assert not list(tmp_path.iterdir())
+    assert get_start_method() == start_method
+
+
+def test__etl_sample_overflow_policy():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    fast_tf = AdderToStr()
+    fast_ldr = ListLoader()
+    slow_tf = SlowAdderToStr()
+    slow_tf.configuration.queue_max_size = 1
+    slow_tf.configuration.overflow_policy = SAMPLE
+    slow_ldr = ListLoader()
+
+    ext >> [fast_tf, slow_tf]
+    fast_tf >> fast_ldr
+    slow_tf >> slow_ldr
+    ETL(ext).run(workers=3)
+
+    # the slow branch only gets a sample of the buckets, without slowing down the fast one
+    test_case.assertCountEqual(fast_ldr.items, expected_items)
+    assert 0 < len(slow_ldr.items) < len(expected_items)
+    assert set(slow_ldr.items) <= set(expected_items)
+
+
+def test__etl_adaptive_bucket_size():
+    test_case = TestCase()
+
+    items = list(range(10_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    ext.configuration.adaptive_bucket_size = True
+    ext.configuration.max_bucket_size = 1_000
+    ext.configuration.max_bucket_bytes = 100_000
+    tf = AdderToStr()
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_workers_per_node():
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items if (item + 5) % 5 != 0]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    tf.configuration.workers = 3
+    tf.configuration.interprocess_connector = SHARED_MEMORY
+    fil = CustomFilter()
+    fil.configuration.workers = 1
+    ldr = ListLoader()
+
+    ext >> tf >> fil >> ldr
+    ETL(ext).run(workers=2)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_autoscale(caplog):
+    test_case = TestCase()
+
+    items = list(range(400))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 5
+    tf = SlowAdderToStr()
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+    with caplog.at_level(logging.INFO, logger="cupyd.autoscaler"):
+        ETL(ext).run(workers=1, autoscale=True, max_workers=3)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+    assert "scaled up to 2 ETLWorkers" in caplog.text
+
+
+def test__etl_runtime():
+    test_case = TestCase()
+
+    with ETLRuntime(num_processes=2) as runtime:
+        for run_num in range(3):
+            items = list(range(1_000 * run_num, 1_000 * (run_num + 1)))
+            expected_items = [str(item + 5) for item in items if (item + 5) % 5 != 0]
+
+            ext = ListExtractor(items)
+            ext.configuration.bucket_size = 10
+            tf = AdderToStr()
+            fil = CustomFilter()
+            ldr = ListLoader()
+
+            ext >> tf >> fil >> ldr
+            ETL(ext).run(workers=2, runtime=runtime)
+
+            test_case.assertCountEqual(ldr.items, expected_items)
+
+        # the same warm processes ran the ETLWorkers of every ETL
+        assert len(runtime.processes) == 2
+
+
+@pytest.mark.parametrize("start_method", [FORKSERVER, FORK])
+def test__etl_start_method(start_method):
+    test_case = TestCase()
+
+    items = list(range(1_000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+    ETL(ext).run(workers=2, start_method=start_method, preload=["json"])
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+
+def test__etl_fork_unsafe(caplog):
+    test_case = TestCase()
+
+    items = list(range(100))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    tf = AdderToStr()
+    ldr = ListLoader()
+    ext >> tf >> ldr
+
+    finished = threading.Event()
+    thread = threading.Thread(target=finished.wait, name="busy_thread")
+    thread.start()
+    try:
+        with caplog.at_level(logging.WARNING, logger="cupyd.etl"):
+            ETL(ext).run(workers=2, start_method=FORK)
+    finally:
+        finished.set()
+        thread.join()
+
+    assert 'thread "busy_thread" running' in caplog.text
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+    with pytest.raises(ValueError):
+        ETL(ext).run(start_method="invalid")
+
+
+def test__etl_concurrency():
+    items = list(range(200))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 50
+    tf = SlowAdderToStr()
+    tf.configuration.run_in_main_process = True
+    tf.configuration.concurrency = 8
+    ldr = ListLoader()
+    ldr.configuration.concurrency = 4
+
+    ext >> tf >> ldr
+    ETL(ext).run()
+
+    # a single worker, so the items keep their order
+    assert ldr.items == expected_items
+
+    tf.configuration.concurrency = 0
+    with pytest.raises(ValueError):
+        ETL(ext).run()
+
+
+def test__etl_async_nodes():
+    items = list(range(1000))
+    expected_items = [str(item + 5) for item in items]
+
+    ext = AsyncListExtractor(items)
+    tf = AsyncAdderToStr()
+    tf.configuration.concurrency = 20
+    ldr = AsyncListLoader()
+    ldr.configuration.concurrency = 1
+
+    ext >> tf >> ldr
+    ETL(ext).run()
+
+    assert ldr.items == expected_items
+    assert 1 < tf.max_in_flight <= 20
+
+
+def test__etl_bucket_methods():
+    items = list(range(100))
+    expected_items = [str(item + 5) for item in items if (item + 5) % 5 != 0]
+
+    ext = ListBucketExtractor(items)
+    tf = BucketAdderToStr()
+    tf.configuration.run_in_main_process = True
+    fil = BucketFilter()
+    fil.configuration.run_in_main_process = True
+    ldr = BucketListLoader()
+
+    ext >> tf >> fil >> ldr
+    ETL(ext).run()
+
+    assert ldr.items == expected_items
+    assert max(ldr.bucket_sizes) < 7
+
+    ext = ListBucketExtractor(items)
+    ext >> AsyncBucketAdderToStr() >> ListLoader()
+    with pytest.raises(TypeError):
+        ETL(ext).run()
+
+
+def test__etl_fused_nodes(caplog):
+    items = list(range(1000))
+    expected_items = [str(item + 5) for item in items if (item + 5) % 5 != 0]
+
+    ext = ListExtractor(items)
+    tf = AdderToStr()
+    tf.configuration.run_in_main_process = True
+    fil = CustomFilter()
+    fil.configuration.run_in_main_process = True
+    ldr = ListLoader()
+
+    ext >> tf >> fil >> ldr
+
+    with caplog.at_level(logging.INFO):
+        ETL(ext).run(monitor_performance=True)
+    assert "Nodes fused: adder_to_str >> custom_filter >> list_loader" in caplog.text
+    assert ldr.items == expected_items
+
+    ETL(ext).run(fuse_nodes=False)
+    assert ldr.items == expected_items
+
+
+def test__etl_threads_execution_mode(caplog):
+    items = list(range(1000))
+    expected_items = [str(item + 5) for item in items if (item + 5) % 5 != 0]
+
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    tf.configuration.workers = 3
+    fil = CustomFilter()
+    fil.configuration.overflow_policy = SAMPLE
+    ldr = ListLoader()
+
+    ext >> tf >> fil >> ldr
+
+    with caplog.at_level(logging.INFO):
+        ETL(ext).run(workers=2, execution_mode=THREADS)
+
+    assert "ETL startup time (threads)" in caplog.text
+    test_case = TestCase()
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+    # unfused nodes of a segment with several ETLWorkerThreads, linked by their own connectors
+    ext = ListExtractor(items)
+    ext.configuration.bucket_size = 10
+    tf = AdderToStr()
+    fil = CustomFilter()
+    ldr = ListLoader()
+
+    ext >> tf >> fil >> ldr
+    ETL(ext).run(workers=3, execution_mode=THREADS, fuse_nodes=False)
+
+    test_case.assertCountEqual(ldr.items, expected_items)
+
+    with pytest.raises(ValueError):
+        ETL(ext).run(execution_mode="invalid")
+
+    with pytest.raises(ValueError):
+        ETL(ext).run(execution_mode=THREADS, runtime=ETLRuntime())
@@ -0,0 +1,92 @@
+import pickle
+
+import pytest
+
+from cupyd import ETL, ColumnarBucket, Bulker
+from cupyd.core.columnar import concat_buckets, filter_rows, slice_rows
+from cupyd.core.communication.serializer import PICKLE_OOB
+from cupyd.tests.etl.nodes import (
+    ColumnarExtractor,
+    ColumnarAdder,
+    ColumnarFilter,
+    ListLoader,
+    ListBucketExtractor,
+)
+
+
+def test__columnar_bucket():
+    bucket = ColumnarBucket({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    assert len(bucket) == 3
+    assert bucket["a"] == [1, 2, 3]
+    assert bucket[1] == {"a": 2, "b": "y"}
+    assert list(bucket) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}]
+    assert slice_rows(bucket, 1, 3) == ColumnarBucket({"a": [2, 3], "b": ["y", "z"]})
+    assert filter_rows(bucket, [True, False, True]) == ColumnarBucket(
+        {"a": [1, 3], "b": ["x", "z"]}
+    )
+    assert concat_buckets([bucket, bucket])["a"] == [1, 2, 3, 1, 2, 3]
+    assert pickle.loads(pickle.dumps(bucket)) == bucket
+
+    with pytest.raises(ValueError):
+        ColumnarBucket({"a": [1, 2], "b": [1]})
+
+
+def test__columnar_bucket_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    bucket = ColumnarBucket({"a": numpy.arange(10)})
+
+    assert list(filter_rows(bucket, bucket["a"] % 2 == 0)["a"]) == [0, 2, 4, 6, 8]
+    assert list(concat_buckets([bucket, bucket])["a"]) == list(range(10)) * 2
+
+
+def test__etl_columnar_buckets():
+    items = list(range(100))
+    expected_items = [{"value": item, "result": item + 5} for item in items if (item + 5) % 5 != 0]
+
+    ext = ColumnarExtractor(items)
+    tf = ColumnarAdder()
+    tf.configuration.serializer = PICKLE_OOB
+    fil = ColumnarFilter()
+    ldr = ListLoader()
+
+    ext >> tf >> fil >> ldr
+    ETL(ext).run()
+
+    # the per-item methods get the rows
+    assert ldr.items == expected_items
+
+
+def test__etl_columnar_bulks():
+    ext = ColumnarExtractor(list(range(100)))
+    bulker = Bulker(bulk_size=25)
+    ldr = ListLoader()
+
+    ext >> bulker >> ldr
+    ETL(ext).run()
+
+    assert [bulk["value"] for bulk in ldr.items] == [
+        list(range(idx, idx + 25)) for idx in range(0, 100, 25)
+    ]
+
+
+def test__etl_record_batches():
+    pyarrow = pytest.importorskip("pyarrow")
+
+    class RecordBatchExtractor(ListBucketExtractor):
+        def extract_buckets(self):
+            for bucket in super().extract_buckets():
+                yield pyarrow.RecordBatch.from_pydict({"value": bucket})
+
+    ext = RecordBatchExtractor(list(range(100)))
+    bulker = Bulker(bulk_size=50)
+    ldr = ListLoader()
+
+    ext >> bulker >> ldr
+    ETL(ext).run()
+
+    assert [bulk.column("value").to_pylist() for bulk in ldr.items] == [
+        list(range(50)),
+        list(range(50, 100)),
+    ]
@@ -1,8 +1,17 @@
 import pytest
 
 from cupyd import ETL
+from cupyd.core.constants.node_actions import PROCESS_BUCKET
 from cupyd.core.exceptions import ETLExecutionError
-from cupyd.tests.etl.nodes import ListExtractor, AdderToStr, ListLoader, CustomFilter
+from cupyd.tests.etl.nodes import (
+    ListExtractor,
+    AdderToStr,
+    ListLoader,
+    CustomFilter,
+    StrictAdderToStr,
+    AsyncListExtractor,
+    AsyncAdderToStr,
+)
 
 
 def test__etl_error_transformer():
@@ -35,3 +44,33 @@ def test__etl_error_extractor():
 
     with pytest.raises(ETLExecutionError):
         etl.run()
+
+
+def test__etl_error_concurrent_transformer():
+    ext = ListExtractor(items=[0, 1, "first", "second", 4])
+    tf = StrictAdderToStr()
+    tf.configuration.concurrency = 4
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+
+    with pytest.raises(ETLExecutionError):
+        ETL(ext).run()
+
+    # the exception of the first failed item is raised, although a later one failed sooner
+    assert tf.exception.action == PROCESS_BUCKET
+    assert str(tf.exception.exc) == "first"
+
+
+def test__etl_error_async_transformer():
+    ext = AsyncListExtractor(items=[0, 1, "2", 3])
+    tf = AsyncAdderToStr()
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+
+    with pytest.raises(ETLExecutionError):
+        ETL(ext).run()
+
+    # the items still awaited were cancelled
+    assert tf.in_flight == 0
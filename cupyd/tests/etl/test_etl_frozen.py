@@ -0,0 +1,90 @@
+import pickle
+from unittest import TestCase
+
+import pytest
+
+from cupyd import ETL
+from cupyd.core.communication.serializer import MARSHAL
+from cupyd.core.exceptions import ETLExecutionError
+from cupyd.core.frozen import FrozenDict, freeze
+from cupyd.tests.etl.nodes import (
+    ListExtractor,
+    AdderToStr,
+    ListLoader,
+    CustomFilter,
+    KeyIncrementer,
+)
+
+
+def test__freeze():
+    item = freeze({"a": [1, {"b": 2}], "c": {3}, "d": bytearray(b"x")})
+
+    assert item == {"a": (1, {"b": 2}), "c": frozenset({3}), "d": b"x"}
+    assert isinstance(item, FrozenDict)
+    assert isinstance(item["a"][1], FrozenDict)
+
+    with pytest.raises(TypeError):
+        item["a"] = 1
+    with pytest.raises(TypeError):
+        item.update(c=2)
+
+    loaded_item = pickle.loads(pickle.dumps(item))
+    assert isinstance(loaded_item, FrozenDict)
+    assert loaded_item == item
+
+
+def test__etl_frozen_buckets():
+    test_case = TestCase()
+
+    items = [0, 1, 2, 3, 4, 5]
+    expected_items_1 = ["5", "6", "7", "8", "9", "10"]
+    expected_items_2 = ["6", "7", "8", "9"]
+
+    ext = ListExtractor(items=items)
+    tf = AdderToStr()
+    filter_1 = CustomFilter()
+    ldr_1 = ListLoader()
+    ldr_2 = ListLoader()
+    ldr_3 = ListLoader()
+
+    ext >> [ldr_3, tf >> [ldr_1, filter_1 >> ldr_2]]
+    ETL(ext).run(workers=2, frozen_buckets=True)
+
+    test_case.assertCountEqual(ldr_1.items, expected_items_1)
+    test_case.assertCountEqual(ldr_2.items, expected_items_2)
+    test_case.assertCountEqual(ldr_3.items, items)
+
+
+def test__etl_frozen_buckets_marshal():
+    ext = ListExtractor(items=[{"value": 1}, {"value": 2}])
+    ldr = ListLoader()
+    ldr.configuration.run_in_main_process = False
+    ldr.configuration.serializer = MARSHAL
+
+    ext >> ldr
+
+    with pytest.raises(ValueError, match="marshal"):
+        ETL(ext).run(frozen_buckets=True)
+
+
+def test__etl_frozen_buckets_mutation():
+    ext = ListExtractor(items=[{"value": 1}, {"value": 2}])
+    tf = KeyIncrementer()
+    ldr = ListLoader()
+
+    ext >> tf >> ldr
+
+    with pytest.raises(ETLExecutionError, match="TypeError"):
+        ETL(ext).run(frozen_buckets=True)
+
+
+def test__etl_detect_bucket_mutations():
+    ext = ListExtractor(items=[{"value": 1}, {"value": 2}])
+    tf = KeyIncrementer()
+    ldr_1 = ListLoader()
+    ldr_2 = ListLoader()
+
+    ext >> [tf >> ldr_1, ldr_2]
+
+    with pytest.raises(ETLExecutionError, match="BucketMutationError"):
+        ETL(ext).run(detect_bucket_mutations=True)
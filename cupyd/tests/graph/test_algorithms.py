@@ -1,5 +1,12 @@
-from cupyd.core.graph.algorithms import topological_sort
+from cupyd.core.graph.algorithms import (
+    topological_sort,
+    assign_names_and_ids_to_nodes,
+    get_etl_segments,
+    get_node_chains,
+)
 from cupyd.core.graph.classes import Edge
+from cupyd.core.constants.overflow_policies import SAMPLE
+from cupyd.tests.etl.nodes import ListExtractor, AdderToStr, ListLoader, CustomFilter
 
 
 def test__topological_sort(node_a, node_b, node_c, node_d, node_e, node_f, node_g, node_h, node_i):
@@ -31,3 +38,66 @@ def test__topological_sort(node_a, node_b, node_c, node_d, node_e, node_f, node_
         Edge(node_f, node_i),
         Edge(node_e, node_c),
     ]
+
+
+def test__get_etl_segments_ordered():
+    ext = ListExtractor(items=[])
+    tf_1 = AdderToStr()
+    tf_2 = AdderToStr()
+    tf_2.configuration.ordered = True
+    ldr = ListLoader()
+    ldr.configuration.run_in_main_process = False
+
+    ext >> tf_1 >> tf_2 >> ldr
+    nodes, _ = topological_sort(root_node=ext)
+    assign_names_and_ids_to_nodes(nodes=nodes)
+
+    segments = get_etl_segments(nodes=nodes, num_workers=4)
+    num_workers_by_node = {
+        node: segment.num_workers for segment in segments for node in segment.nodes
+    }
+
+    assert num_workers_by_node == {ext: 1, tf_1: 4, tf_2: 1, ldr: 4}
+
+
+def test__get_etl_segments_workers_per_node():
+    ext = ListExtractor(items=[])
+    tf_1 = AdderToStr()
+    tf_1.configuration.workers = 8
+    tf_2 = AdderToStr()
+    ldr = ListLoader()
+    ldr.configuration.run_in_main_process = False
+    ldr.configuration.workers = 2
+
+    ext >> tf_1 >> tf_2 >> ldr
+    nodes, _ = topological_sort(root_node=ext)
+    assign_names_and_ids_to_nodes(nodes=nodes)
+
+    segments = get_etl_segments(nodes=nodes, num_workers=4)
+    num_workers_by_node = {
+        node: segment.num_workers for segment in segments for node in segment.nodes
+    }
+
+    assert num_workers_by_node == {ext: 1, tf_1: 8, tf_2: 4, ldr: 2}
+    assert len(segments) == 4
+
+
+def test__get_node_chains():
+    ext = ListExtractor(items=[])
+    tf_1 = AdderToStr()
+    fil = CustomFilter()
+    tf_2 = AdderToStr()
+    tf_2.configuration.overflow_policy = SAMPLE
+    ldr_1 = ListLoader()
+    ldr_2 = ListLoader()
+
+    ext >> tf_1 >> fil >> tf_2 >> [ldr_1, ldr_2]
+    for node in (tf_1, fil, tf_2, ldr_1, ldr_2):
+        node.configuration.run_in_main_process = True
+    nodes, _ = topological_sort(root_node=ext)
+    assign_names_and_ids_to_nodes(nodes=nodes)
+
+    (segment,) = get_etl_segments(nodes=nodes, num_workers=1)
+
+    # extractors, nodes with several outputs & dropping connectors aren't fused
+    assert get_node_chains(segment) == [[ext], [tf_1, fil], [tf_2], [ldr_1], [ldr_2]]